@@ -0,0 +1,291 @@
+import json
+import math
+import os
+import platform
+import statistics
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import uuid4
+import pytest
+from allure_commons import hookimpl, plugin_manager
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import TestResult
+from allure_commons.reporter import AllureReporter
+from requests.adapters import BaseAdapter
+from src.backend.clients.http_client import HTTPClient
+from src.backend.clients.metrics import RequestMetrics
+from src.backend.fake.server import FakeShopServer
+from src.backend.fake.shop import FakeShop, default_catalog
+from src.backend.fake.transport import FakeShopAdapter
+from src.backend.services.auth.adapter import AuthAdapter
+from src.utils.allure_results import BufferedAllureFileLogger
+from config import FAKE_SHOP_CONFIG
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup("autotests-shop-benchmarks")
+    group.addoption(
+        "--bench-backend",
+        choices=["inprocess", "loopback"],
+        default="inprocess",
+        help="Заглушка backend API для замеров: без сокетов или на локальном порту",
+    )
+    group.addoption(
+        "--bench-baseline",
+        default=BASELINE_PATH,
+        help="JSON файл с эталонными результатами",
+    )
+    group.addoption(
+        "--bench-save",
+        action="store_true",
+        help="Сохранить результаты прогона как новый эталон",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.3,
+        help="Допустимое замедление лучшего раунда относительно эталона "
+        "(0.3 - на 30%%)",
+    )
+    group.addoption(
+        "--bench-large",
+        action="store_true",
+        help="Включить замеры на 1M элементов",
+    )
+
+
+def pytest_configure(config) -> None:
+    config.addinivalue_line("markers", "large: замеры на 1M элементов (--bench-large)")
+    config.bench_results = {}
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    if config.getoption("--bench-large", default=True):
+        return
+    skip_large = pytest.mark.skip(reason="нужен --bench-large")
+    for item in items:
+        if "large" in item.keywords:
+            item.add_marker(skip_large)
+
+
+def _load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as baseline_file:
+        return json.load(baseline_file).get("results", {})
+
+
+class Benchmark:
+
+    def __init__(self, config, baseline: Dict[str, Dict[str, Any]]) -> None:
+        self._config = config
+        self._baseline = baseline
+
+    def __call__(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        rounds: int = 10,
+        ops: int = 1,
+        warmup: int = 1,
+        setup: Optional[Callable[[], None]] = None,
+        min_round_time: float = 0.05,
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        for _ in range(warmup):
+            if setup is not None:
+                setup()
+            func()
+        estimate = (time.perf_counter() - started) / max(warmup, 1)
+        loops = 1
+        if setup is None and estimate < min_round_time:
+            loops = math.ceil(min_round_time / max(estimate, 1e-6))
+        timings = []
+        for _ in range(rounds):
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            for _ in range(loops):
+                func()
+            timings.append((time.perf_counter() - started) / loops)
+        median = statistics.median(timings)
+        result = {
+            "rounds": rounds,
+            "loops": loops,
+            "ops": ops,
+            "min_s": round(min(timings), 6),
+            "median_s": round(median, 6),
+            "ops_per_s": round(ops / median, 1) if median else None,
+            "us_per_op": round(median / ops * 1e6, 3),
+        }
+        baseline = self._baseline.get(name)
+        if baseline:
+            result["baseline_min_s"] = baseline["min_s"]
+            result["change"] = round(min(timings) / baseline["min_s"] - 1, 3)
+        self._config.bench_results[name] = result
+        tolerance = self._config.getoption("--bench-tolerance")
+        if (
+            baseline
+            and not self._config.getoption("--bench-save")
+            and result["change"] > tolerance
+        ):
+            pytest.fail(
+                f"{name}: лучший раунд {min(timings) * 1e3:.3f} мс, эталон "
+                f"{baseline['min_s'] * 1e3:.3f} мс (+{result['change']:.0%}, "
+                f"допустимо +{tolerance:.0%})"
+            )
+        return result
+
+
+class AttachmentListener:
+
+    def __init__(self, reporter: AllureReporter) -> None:
+        self._reporter = reporter
+
+    @hookimpl
+    def attach_data(self, body, name, attachment_type, extension) -> None:
+        self._reporter.attach_data(
+            uuid4(),
+            body,
+            name=name,
+            attachment_type=attachment_type,
+            extension=extension,
+        )
+
+
+@pytest.fixture
+def allure_writer(tmp_path_factory):
+    if plugin_manager.hook.attach_data.get_hookimpls():
+        pytest.skip("замеры вложений запускаются без --alluredir")
+    installed = []
+
+    def install(writer: str = "default") -> Callable[[], None]:
+        report_dir = str(tmp_path_factory.mktemp(f"allure-{writer}"))
+        logger = (
+            BufferedAllureFileLogger(report_dir)
+            if writer == "buffered"
+            else AllureFileLogger(report_dir)
+        )
+        reporter = AllureReporter()
+        test_uuid = uuid4()
+        reporter.schedule_test(test_uuid, TestResult(uuid=test_uuid, name="benchmark"))
+        listener = AttachmentListener(reporter)
+        plugin_manager.register(logger)
+        plugin_manager.register(listener)
+        installed.append((logger, listener))
+        return getattr(logger, "flush", lambda: None)
+
+    yield install
+    for logger, listener in installed:
+        plugin_manager.unregister(listener)
+        plugin_manager.unregister(logger)
+        if isinstance(logger, BufferedAllureFileLogger):
+            logger.close()
+
+
+@pytest.fixture(scope="session")
+def benchmark(request) -> Benchmark:
+    config = request.config
+    return Benchmark(config, _load_baseline(config.getoption("--bench-baseline")))
+
+
+@pytest.fixture(scope="session")
+def fake_shop() -> FakeShop:
+    return FakeShop(default_catalog(FAKE_SHOP_CONFIG["catalog_size"]))
+
+
+@pytest.fixture(scope="session")
+def bench_backend(request, fake_shop: FakeShop) -> Tuple[str, Optional[BaseAdapter]]:
+    if request.config.getoption("--bench-backend") == "loopback":
+        server = FakeShopServer(fake_shop)
+        server.start()
+        yield server.base_url, None
+        server.stop()
+    else:
+        yield FAKE_SHOP_CONFIG["base_url"], FakeShopAdapter(fake_shop)
+
+
+@pytest.fixture(scope="session")
+def make_client(bench_backend: Tuple[str, Optional[BaseAdapter]]):
+    base_url, adapter = bench_backend
+    clients = []
+
+    def make(**kwargs: Any) -> HTTPClient:
+        kwargs.setdefault("reporting_level", "off")
+        kwargs.setdefault("metrics", RequestMetrics())
+        client = HTTPClient(base_url, **kwargs)
+        if adapter is not None:
+            client.mount(base_url, adapter)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def bench_http_client(make_client) -> HTTPClient:
+    return make_client()
+
+
+@pytest.fixture(scope="session")
+def bench_token(bench_http_client: HTTPClient) -> str:
+    auth = AuthAdapter(bench_http_client)
+    auth.register_user("benchuser", "Bench!Passw0rd")
+    return f"Bearer {auth.get_token('benchuser', 'Bench!Passw0rd')}"
+
+
+def pytest_sessionfinish(session) -> None:
+    config = session.config
+    if not config.getoption("--bench-save", default=False) or not getattr(
+        config, "bench_results", None
+    ):
+        return
+    with open(
+        config.getoption("--bench-baseline"), "w", encoding="utf-8"
+    ) as baseline_file:
+        json.dump(
+            {
+                "machine": {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "processor": platform.processor(),
+                },
+                "results": {
+                    name: {
+                        key: value
+                        for key, value in result.items()
+                        if key not in ("baseline_min_s", "change")
+                    }
+                    for name, result in sorted(config.bench_results.items())
+                },
+            },
+            baseline_file,
+            indent=2,
+        )
+
+
+def pytest_terminal_summary(terminalreporter, config) -> None:
+    results = getattr(config, "bench_results", None)
+    if not results:
+        return
+    terminalreporter.write_sep("-", "benchmarks")
+    terminalreporter.write_line(
+        f"{'name':<54}{'min ms':>10}{'median ms':>11}{'us/op':>12}{'ops/s':>13}"
+        f"{'vs baseline':>13}"
+    )
+    for name, result in sorted(results.items()):
+        change = result.get("change")
+        terminalreporter.write_line(
+            f"{name:<54}{result['min_s'] * 1e3:>10.3f}{result['median_s'] * 1e3:>11.3f}"
+            f"{result['us_per_op']:>12.3f}"
+            f"{result['ops_per_s'] or 0:>13.1f}"
+            f"{'' if change is None else f'{change:+.1%}':>13}"
+        )
+    if config.getoption("--bench-save"):
+        terminalreporter.write_line(
+            f"Эталон сохранён: {config.getoption('--bench-baseline')}"
+        )
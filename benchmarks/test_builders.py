@@ -0,0 +1,50 @@
+from src.backend.services.catalog.adapter import CatalogAdapter
+from src.builders.catalog_snapshot import CatalogSnapshot
+from src.builders.item_builder import ItemBuilder
+from src.builders.user_builder import UserBuilder
+
+
+def test_user_builder(benchmark, allure_writer):
+    allure_writer()
+    builder = UserBuilder()
+
+    def run() -> None:
+        for _ in range(1000):
+            builder.build()
+
+    benchmark("builders.user_builder.build", run, ops=1000)
+
+
+def test_user_builder_many(benchmark):
+    builder = UserBuilder(seed=1)
+    benchmark(
+        "builders.user_builder.build_many",
+        lambda: builder.build_many(10000),
+        ops=10000,
+    )
+
+
+def test_item_builder_snapshot(
+    benchmark, allure_writer, bench_http_client, bench_token
+):
+    allure_writer()
+    catalog_adapter = CatalogAdapter(bench_http_client)
+    snapshot = CatalogSnapshot(catalog_adapter, bench_token)
+    builder = ItemBuilder(catalog_adapter, bench_token, snapshot)
+
+    def run() -> None:
+        for _ in range(1000):
+            builder.build()
+
+    benchmark("builders.item_builder.build_snapshot", run, ops=1000)
+
+
+def test_item_builder_stream(benchmark, allure_writer, bench_http_client, bench_token):
+    allure_writer()
+    builder = ItemBuilder(CatalogAdapter(bench_http_client), bench_token)
+
+    def run() -> None:
+        for _ in range(100):
+            builder.build()
+
+    benchmark("builders.item_builder.build_stream", run, ops=100)
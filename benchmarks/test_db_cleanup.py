@@ -0,0 +1,32 @@
+from src.backend.fake.db import FakeDbClient
+from src.utils.cleanup import CleanupRegistry
+
+USERS = 2000
+
+
+def test_cleanup_flush(benchmark, fake_shop):
+    registry = CleanupRegistry(FakeDbClient(fake_shop), flush_threshold=10**9)
+    usernames = [f"cleanup{index:05d}" for index in range(USERS)]
+
+    def seed() -> None:
+        with fake_shop.lock:
+            fake_shop.conn.executemany(
+                "INSERT INTO users (username, password) VALUES (?, 'x')",
+                [(username,) for username in usernames],
+            )
+            fake_shop.conn.execute(
+                "INSERT INTO carts (user_id) SELECT id FROM users "
+                "WHERE username LIKE 'cleanup%'"
+            )
+            fake_shop.conn.execute(
+                "INSERT INTO cart_items (cart_id, item_id, quantity) "
+                "SELECT id, 1, 1 FROM carts"
+            )
+        for username in usernames:
+            registry.register_user(username)
+            registry.register_cart(username)
+
+    benchmark(
+        "db.cleanup_registry.flush.fake_sqlite", registry.flush, ops=USERS, setup=seed
+    )
+    registry.close()
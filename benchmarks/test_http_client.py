@@ -0,0 +1,74 @@
+import requests
+import pytest
+
+REQUESTS = 200
+
+
+def test_raw_session_get(benchmark, bench_backend, bench_token):
+    base_url, adapter = bench_backend
+    session = requests.Session()
+    if adapter is not None:
+        session.mount(base_url, adapter)
+    headers = {"Authorization": bench_token}
+
+    def run() -> None:
+        for _ in range(REQUESTS):
+            session.get(f"{base_url}/catalog/", headers=headers).json()
+
+    benchmark("http.get_catalog.raw_session", run, ops=REQUESTS)
+    session.close()
+
+
+@pytest.mark.parametrize("reporting_level", ["off", "errors", "full"])
+def test_client_get(
+    benchmark, allure_writer, make_client, bench_token, reporting_level
+):
+    allure_writer()
+    client = make_client(reporting_level=reporting_level)
+    headers = {"Authorization": bench_token}
+
+    def run() -> None:
+        for _ in range(REQUESTS):
+            client.get("/catalog/", headers=headers).json()
+        client.discard_pending()
+
+    benchmark(f"http.get_catalog.client_{reporting_level}", run, ops=REQUESTS)
+
+
+@pytest.mark.parametrize("payload", ["unique", "repeated"])
+@pytest.mark.parametrize("writer", ["default", "buffered"])
+def test_attachment_write(
+    benchmark, allure_writer, bench_http_client, bench_token, writer, payload
+):
+    flush = allure_writer(writer)
+    headers = {"Authorization": bench_token}
+    prices = sorted(
+        item["price"]
+        for item in bench_http_client.get("/catalog/", headers=headers).json()
+    )
+    windows = [
+        {"min_price": low, "max_price": high}
+        for index, low in enumerate(prices)
+        for high in prices[index:]
+    ][:REQUESTS]
+    if payload == "repeated":
+        windows = windows[:1] * REQUESTS
+    exchanges = [
+        (
+            {"params": params},
+            bench_http_client.get("/catalog/", headers=headers, params=params),
+        )
+        for params in windows
+    ]
+
+    def run() -> None:
+        for kwargs, response in exchanges:
+            bench_http_client._attach_request(
+                "GET", response.url, "/catalog/", headers, kwargs
+            )
+            bench_http_client._attach_response(response)
+        flush()
+
+    benchmark(
+        f"http.attachments.catalog_exchange.{writer}.{payload}", run, ops=REQUESTS
+    )
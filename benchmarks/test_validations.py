@@ -0,0 +1,72 @@
+import copy
+import json
+from functools import lru_cache
+import pytest
+from src.utils.json_diff import json_diff
+from src.utils.streaming import iter_json_array
+from src.utils.validations import validate_catalog_payload, validate_catalog_stream
+
+SIZES = [1_000, 100_000, pytest.param(1_000_000, marks=pytest.mark.large)]
+
+
+@lru_cache(maxsize=1)
+def catalog_payload(size: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": index + 1,
+                "name": f"Item {index + 1}",
+                "brand": ("Apple", "Samsung", "Sony")[index % 3],
+                "price": 50 + index // 10,
+                "image_url": f"https://static.shop.local/items/{index + 1}.png",
+            }
+            for index in range(size)
+        ]
+    ).encode()
+
+
+def rounds_for(size: int) -> int:
+    return 10 if size <= 100_000 else 3
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_validate_catalog_payload(benchmark, size):
+    raw = catalog_payload(size)
+    benchmark(
+        f"validations.catalog_payload.{size}",
+        lambda: validate_catalog_payload(raw, min_price=1, sort_order="asc"),
+        rounds=rounds_for(size),
+        ops=size,
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_validate_catalog_stream(benchmark, size):
+    raw = catalog_payload(size)
+
+    def run() -> None:
+        chunks = (raw[i : i + 65536] for i in range(0, len(raw), 65536))
+        validate_catalog_stream(iter_json_array(chunks), sort_order="asc")
+
+    benchmark(
+        f"validations.catalog_stream.{size}", run, rounds=rounds_for(size), ops=size
+    )
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_json_diff(benchmark, size):
+    actual = {
+        "order_id": 1,
+        "items": [
+            {"item_id": index, "quantity": 1 + index % 5, "price": 100}
+            for index in range(size)
+        ],
+    }
+    expected = copy.deepcopy(actual)
+    expected["items"][size // 2]["quantity"] = 0
+    benchmark(
+        f"validations.json_diff.{size}",
+        lambda: json_diff(actual, expected),
+        rounds=rounds_for(size),
+        ops=size,
+    )
@@ -1,4 +1,10 @@
 BASE_URL: str = "http://localhost:5050"
+BACKEND_MODE: str = "live"
+DB_ISOLATION: str = "cleanup"
+FAKE_SHOP_CONFIG: dict = {
+    "base_url": "http://shop.inprocess",
+    "catalog_size": 30,
+}
 DB_CONFIG: dict = {
     "host": "localhost",
     "port": 5432,
@@ -6,3 +12,66 @@ DB_CONFIG: dict = {
     "password": "shoppass",
     "dbname": "shopdb",
 }
+HTTP_POOL_CONFIG: dict = {
+    "pool_connections": 10,
+    "pool_maxsize": 20,
+    "pool_block": False,
+    "connect_timeout": 5.0,
+    "read_timeout": 30.0,
+}
+HTTP_REPORTING_CONFIG: dict = {
+    "reporting_level": "full",
+    "sample_rate": 10.0,
+    "max_attachment_bytes": 64 * 1024,
+}
+HTTP_CACHE_CONFIG: dict = {
+    "enabled": False,
+    "routes": ["/catalog/"],
+    "ttl": 60.0,
+    "max_entries": 256,
+    "max_bytes": 16 * 1024 * 1024,
+}
+ASYNC_HTTP_CONFIG: dict = {
+    "max_concurrency": 100,
+    "limit": 100,
+    "limit_per_host": 100,
+    "connect_timeout": 5.0,
+    "read_timeout": 30.0,
+}
+DB_TEMPLATE_CONFIG: dict = {
+    "mode": "off",
+    "template": "shopdb_template",
+    "seed_paths": [],
+}
+DB_POOL_CONFIG: dict = {
+    "minconn": 1,
+    "maxconn": 10,
+}
+CLEANUP_CONFIG: dict = {
+    "flush_threshold": 200,
+    "journal_path": ".cleanup_journal",
+}
+USER_POOL_CONFIG: dict = {
+    "size": 10,
+    "refill_batch": 5,
+    "provision_workers": 8,
+}
+TOKEN_CACHE_CONFIG: dict = {
+    "refresh_margin": 60.0,
+    "default_ttl": 3600.0,
+    "path": None,
+}
+CATALOG_SNAPSHOT_CONFIG: dict = {
+    "ttl": 300.0,
+    "price_band": 100,
+}
+DB_SEED_CONFIG: dict = {
+    "batch_size": 1000,
+    "password_iterations": 1000,
+}
+ALLURE_WRITER_CONFIG: dict = {
+    "buffered": True,
+    "dedup": True,
+    "queue_size": 10000,
+    "archive": False,
+}
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+BENCHMARKS_DIR = Path(__file__).parent / "benchmarks"
+
+
+def pytest_ignore_collect(collection_path, config):
+    if collection_path != BENCHMARKS_DIR:
+        return None
+    requested = (
+        Path(config.invocation_params.dir, str(arg).split("::")[0]).resolve()
+        for arg in config.args
+    )
+    return not any(
+        path == BENCHMARKS_DIR or BENCHMARKS_DIR in path.parents for path in requested
+    )
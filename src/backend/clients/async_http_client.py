@@ -0,0 +1,179 @@
+import asyncio
+import json
+import random
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+from urllib.parse import urljoin
+import aiohttp
+import allure
+from src.backend.clients.reporting import ReportingLevel, truncate
+from config import ASYNC_HTTP_CONFIG
+
+
+class AsyncResponse:
+
+    def __init__(
+        self,
+        request: SimpleNamespace,
+        status_code: int,
+        reason: Optional[str],
+        headers: Dict[str, str],
+        url: str,
+        content: bytes,
+        encoding: Optional[str],
+        elapsed: timedelta,
+    ) -> None:
+        self.request = request
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.url = url
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+class AsyncHTTPClient:
+
+    def __init__(
+        self,
+        host: str,
+        default_headers: Optional[Dict[str, str]] = None,
+        max_concurrency: int = ASYNC_HTTP_CONFIG["max_concurrency"],
+        limit: int = ASYNC_HTTP_CONFIG["limit"],
+        limit_per_host: int = ASYNC_HTTP_CONFIG["limit_per_host"],
+        connect_timeout: float = ASYNC_HTTP_CONFIG["connect_timeout"],
+        read_timeout: float = ASYNC_HTTP_CONFIG["read_timeout"],
+        reporting_level: str = ReportingLevel.FULL,
+        sample_rate: float = 10.0,
+        max_attachment_bytes: int = 64 * 1024,
+    ) -> None:
+        self._host = host
+        self._default_headers = default_headers or {}
+        self._max_concurrency = max_concurrency
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._timeout = aiohttp.ClientTimeout(
+            connect=connect_timeout, sock_read=read_timeout
+        )
+        self._reporting_level = ReportingLevel(reporting_level)
+        self._sample_rate = sample_rate
+        self._max_attachment_bytes = max_attachment_bytes
+        self._sampler = random.Random()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout
+            )
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._semaphore = None
+
+    async def get(
+        self, route: str, headers: Optional[Dict] = None, params: Optional[Dict] = None
+    ) -> AsyncResponse:
+        return await self._request("GET", route, headers, params=params)
+
+    async def post(
+        self, route: str, headers: Optional[Dict] = None, json: Optional[Dict] = None
+    ) -> AsyncResponse:
+        return await self._request("POST", route, headers, json=json)
+
+    async def _request(
+        self, method: str, route: str, headers: Optional[Dict] = None, **kwargs
+    ) -> AsyncResponse:
+        await self.start()
+        url = urljoin(self._host, route)
+        req_headers = {**self._default_headers, **(headers or {})}
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        request = SimpleNamespace(
+            method=method,
+            url=url,
+            headers=req_headers,
+            body=json.dumps(kwargs["json"]) if "json" in kwargs else None,
+        )
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                async with self._session.request(
+                    method, url, headers=req_headers, **kwargs
+                ) as resp:
+                    content = await resp.read()
+                    response = AsyncResponse(
+                        request=request,
+                        status_code=resp.status,
+                        reason=resp.reason,
+                        headers=dict(resp.headers),
+                        url=str(resp.url),
+                        content=content,
+                        encoding=resp.charset,
+                        elapsed=timedelta(seconds=time.perf_counter() - started),
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if self._reporting_level != ReportingLevel.OFF:
+                    error_details = {
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                        "request_url": url,
+                        "request_method": method,
+                    }
+                    allure.attach(
+                        json.dumps(error_details, indent=2, ensure_ascii=False),
+                        "Ошибка HTTP запроса",
+                        allure.attachment_type.JSON,
+                    )
+                raise
+        if self._should_attach(response):
+            self._attach_exchange(response)
+        return response
+
+    def _should_attach(self, response: AsyncResponse) -> bool:
+        if self._reporting_level == ReportingLevel.FULL:
+            return True
+        if self._reporting_level == ReportingLevel.OFF:
+            return False
+        if not response.ok:
+            return True
+        return (
+            self._reporting_level == ReportingLevel.SAMPLED
+            and self._sampler.random() * 100 < self._sample_rate
+        )
+
+    def _attach_exchange(self, response: AsyncResponse) -> None:
+        body, _ = truncate(response.text, self._max_attachment_bytes)
+        allure.attach(
+            f"{response.request.method} {response.url} -> {response.status_code} "
+            f"({response.elapsed.total_seconds() * 1000:.1f} мс)\n\n{body}",
+            f"{response.request.method} {response.url}",
+            allure.attachment_type.TEXT,
+        )
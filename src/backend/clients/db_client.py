@@ -1,19 +1,124 @@
-from typing import Dict
+import hashlib
+import io
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+)
 import psycopg2
+from psycopg2 import sql
+from psycopg2.pool import ThreadedConnectionPool
 import allure
 import json
+from src.builders.user_builder import UserBuilder
+from src.utils.passwords import hash_password
+
+DELETE_CARTS_SQL = """
+DELETE FROM cart_items
+WHERE cart_id IN (
+    SELECT c.id FROM carts c
+    JOIN users u ON u.id = c.user_id
+    WHERE u.username = ANY(%(usernames)s)
+);
+DELETE FROM carts
+WHERE user_id IN (
+    SELECT id FROM users WHERE username = ANY(%(usernames)s)
+);
+"""
+
+DELETE_USER_ROWS_SQL = """
+DELETE FROM users WHERE username = ANY(%(usernames)s);
+"""
+
+DELETE_USERS_SQL = DELETE_CARTS_SQL + DELETE_USER_ROWS_SQL
+
+ISOLATION_SAVEPOINT = "test_isolation"
+STATEMENT_SAVEPOINT = "db_client_statement"
+
+MAINTENANCE_DBNAME = "postgres"
+EMPTY_TEMPLATE = "template0"
+TEMPLATE_LOCK_SQL = "SELECT pg_advisory_lock(hashtext(%s))"
+TEMPLATE_UNLOCK_SQL = "SELECT pg_advisory_unlock(hashtext(%s))"
+DATABASE_COMMENT_SQL = (
+    "SELECT shobj_description(oid, 'pg_database') FROM pg_database WHERE datname = %s"
+)
+TERMINATE_BACKENDS_SQL = """
+SELECT pg_terminate_backend(pid) FROM pg_stat_activity
+WHERE datname = %s AND pid <> pg_backend_pid()
+"""
+SEED_COMMENT_PREFIX = "seed:"
+RESTORED_COMMENT_PREFIX = "restored:"
+
+EXISTING_USERS_SQL = "SELECT username FROM users WHERE username = ANY(%s)"
+SEEDED_USER_IDS_SQL = "SELECT id FROM users WHERE username = ANY(%s)"
+SEEDED_CART_IDS_SQL = "SELECT id FROM carts WHERE user_id = ANY(%s)"
+
+
+def _copy_value(value: Any) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _copy_buffer(rows: Iterable[Sequence[Any]]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(_copy_value(value) for value in row))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def require_seed_paths(template: str, seed_paths: Sequence[str]) -> None:
+    if not seed_paths:
+        raise ValueError(
+            f"Для шаблона {template} нужны seed_paths: "
+            "с пустым списком шаблон не собирается"
+        )
+
+
+def seed_checksum(seed_paths: Sequence[str]) -> str:
+    digest = hashlib.sha256()
+    for path in seed_paths:
+        digest.update(os.path.basename(path).encode("utf-8") + b"\0")
+        with open(path, "rb") as seed_file:
+            digest.update(seed_file.read())
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 
 class DbClient:
-    def __init__(self, config: Dict[str, any]) -> None:
+    def __init__(
+        self, config: Dict[str, any], minconn: int = 1, maxconn: int = 10
+    ) -> None:
+        self._isolated = None
+        self._isolation_lock = threading.RLock()
+        self._savepoint_ids = itertools.count()
+        self._config = config
         with allure.step("Подключение к базе данных"):
             try:
-                self.conn = psycopg2.connect(**config)
+                self.pool = ThreadedConnectionPool(minconn, maxconn, **config)
                 connection_info = {
                     "host": config.get("host"),
                     "port": config.get("port"),
                     "database": config.get("dbname"),
                     "user": config.get("user"),
+                    "pool": {"minconn": minconn, "maxconn": maxconn},
                     "status": "connected",
                 }
                 allure.attach(
@@ -34,95 +139,421 @@ class DbClient:
                 )
                 raise
 
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        isolated = self._isolated
+        if isolated is not None:
+            with self._isolation_lock:
+                yield isolated
+            return
+        conn = self.pool.getconn()
+        try:
+            yield conn
+        finally:
+            self.pool.putconn(conn)
+
+    @property
+    def in_isolation(self) -> bool:
+        return self._isolated is not None
+
+    @contextmanager
+    def isolated(self) -> Iterator[Any]:
+        conn = self.pool.getconn()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"SAVEPOINT {ISOLATION_SAVEPOINT}")
+            self._isolated = conn
+            yield conn
+        finally:
+            with self._isolation_lock:
+                self._isolated = None
+                conn.rollback()
+            self.pool.putconn(conn)
+
+    def _begin(self, conn: Any) -> Optional[str]:
+        if conn is not self._isolated:
+            return None
+        savepoint = f"{STATEMENT_SAVEPOINT}_{next(self._savepoint_ids)}"
+        with conn.cursor() as cur:
+            cur.execute(f"SAVEPOINT {savepoint}")
+        return savepoint
+
+    def _commit(self, conn: Any, savepoint: Optional[str]) -> None:
+        if savepoint is None:
+            conn.commit()
+            return
+        with conn.cursor() as cur:
+            cur.execute(f"RELEASE SAVEPOINT {savepoint}")
+
+    def _rollback(self, conn: Any, savepoint: Optional[str]) -> None:
+        if savepoint is None:
+            conn.rollback()
+            return
+        with conn.cursor() as cur:
+            cur.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            cur.execute(f"RELEASE SAVEPOINT {savepoint}")
+
     @allure.step("Выполнение SQL запроса: {query}")
-    def execute(self, query: str) -> None:
+    def execute(
+        self, query: str, params: Optional[Any] = None
+    ) -> Optional[List[tuple]]:
         with allure.step(f"Выполнение SQL: {query}"):
-            try:
-                allure.attach(query, "SQL запрос", allure.attachment_type.TEXT)
-                cur = self.conn.cursor()
-                cur.execute(query)
+            allure.attach(query, "SQL запрос", allure.attachment_type.TEXT)
+            if params is not None:
+                allure.attach(
+                    json.dumps(params, indent=2, default=str),
+                    "Параметры SQL запроса",
+                    allure.attachment_type.JSON,
+                )
+            with self.connection() as conn:
+                savepoint = self._begin(conn)
                 try:
-                    result = cur.fetchall()
-                    if result:
-                        allure.attach(
-                            json.dumps(result, indent=2, default=str),
-                            "Результат запроса",
-                            allure.attachment_type.JSON,
+                    result = None
+                    with conn.cursor() as cur:
+                        cur.execute(query, params)
+                        if cur.description is not None:
+                            result = cur.fetchall()
+                            if result:
+                                allure.attach(
+                                    json.dumps(result, indent=2, default=str),
+                                    "Результат запроса",
+                                    allure.attachment_type.JSON,
+                                )
+                    self._commit(conn, savepoint)
+                    return result
+                except psycopg2.Error as e:
+                    error_details = {
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                        "sql_query": query,
+                        "error_code": getattr(e, "pgcode", "N/A"),
+                    }
+                    allure.attach(
+                        json.dumps(error_details, indent=2),
+                        "Ошибка выполнения SQL",
+                        allure.attachment_type.JSON,
+                    )
+                    self._rollback(conn, savepoint)
+                    raise
+
+    @allure.step("Массовое создание пользователей")
+    def seed_users(
+        self,
+        count: int,
+        user_builder: Optional[UserBuilder] = None,
+        cart_items: Optional[Sequence[Dict[str, int]]] = None,
+        batch_size: int = 1000,
+        password_iterations: int = 1000,
+        on_batch: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[Dict[str, str]]:
+        user_builder = user_builder or UserBuilder()
+        seeded: List[Dict[str, str]] = []
+        started = time.perf_counter()
+        with allure.step(f"Создание пользователей через COPY: {count}"):
+            while len(seeded) < count:
+                batch = user_builder.build_many(min(batch_size, count - len(seeded)))
+                if on_batch is not None:
+                    on_batch([user["username"] for user in batch])
+                self._copy_users(batch, cart_items, password_iterations)
+                seeded.extend(batch)
+            allure.attach(
+                json.dumps(
+                    {
+                        "users": len(seeded),
+                        "batch_size": batch_size,
+                        "cart_items_per_user": (
+                            None if cart_items is None else len(cart_items)
+                        ),
+                        "password_iterations": password_iterations,
+                        "elapsed_seconds": round(time.perf_counter() - started, 3),
+                    },
+                    indent=2,
+                ),
+                "Результат массового создания",
+                allure.attachment_type.JSON,
+            )
+        return seeded
+
+    def _copy_users(
+        self,
+        users: List[Dict[str, str]],
+        cart_items: Optional[Sequence[Dict[str, int]]],
+        password_iterations: int,
+    ) -> None:
+        usernames = [user["username"] for user in users]
+        with self.connection() as conn:
+            savepoint = self._begin(conn)
+            try:
+                with conn.cursor() as cur:
+                    cur.copy_expert(
+                        "COPY users (username, password) FROM STDIN",
+                        _copy_buffer(
+                            (
+                                user["username"],
+                                hash_password(user["password"], password_iterations),
+                            )
+                            for user in users
+                        ),
+                    )
+                    if cart_items is not None:
+                        cur.execute(SEEDED_USER_IDS_SQL, (usernames,))
+                        user_ids = [row[0] for row in cur.fetchall()]
+                        cur.copy_expert(
+                            "COPY carts (user_id) FROM STDIN",
+                            _copy_buffer((user_id,) for user_id in user_ids),
+                        )
+                        cur.execute(SEEDED_CART_IDS_SQL, (user_ids,))
+                        cart_ids = [row[0] for row in cur.fetchall()]
+                        cur.copy_expert(
+                            "COPY cart_items (cart_id, item_id, quantity) FROM STDIN",
+                            _copy_buffer(
+                                (cart_id, item["item_id"], item["quantity"])
+                                for cart_id in cart_ids
+                                for item in cart_items
+                            ),
                         )
-                except psycopg2.ProgrammingError:
-                    pass
-                self.conn.commit()
-                cur.close()
+                self._commit(conn, savepoint)
             except psycopg2.Error as e:
-                error_details = {
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "sql_query": query,
-                    "error_code": getattr(e, "pgcode", "N/A"),
-                }
                 allure.attach(
-                    json.dumps(error_details, indent=2),
-                    "Ошибка выполнения SQL",
+                    json.dumps(
+                        {
+                            "error_type": type(e).__name__,
+                            "error_message": str(e),
+                            "error_code": getattr(e, "pgcode", "N/A"),
+                            "batch_size": len(users),
+                        },
+                        indent=2,
+                    ),
+                    "Ошибка массового создания пользователей",
                     allure.attachment_type.JSON,
                 )
-                self.conn.rollback()
+                self._rollback(conn, savepoint)
                 raise
 
-    @allure.step("Удаление пользователя и связанных данных")
-    def delete_user(self, username: str) -> None:
-        with allure.step(f"Удаление пользователя: {username}"):
-            cart_items_query = f"""
-            DELETE FROM cart_items
-            WHERE cart_id IN (
-                SELECT id FROM carts
-                WHERE user_id = (
-                    SELECT id FROM users
-                    WHERE username = '{username}'
+    @contextmanager
+    def _direct_connection(
+        self, dbname: str = MAINTENANCE_DBNAME, autocommit: bool = True
+    ) -> Iterator[Any]:
+        conn = psycopg2.connect(**{**self._config, "dbname": dbname})
+        conn.autocommit = autocommit
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def template_lock(self, template: str) -> Iterator[None]:
+        with self._direct_connection() as conn, conn.cursor() as cur:
+            cur.execute(TEMPLATE_LOCK_SQL, (template,))
+            try:
+                yield
+            finally:
+                cur.execute(TEMPLATE_UNLOCK_SQL, (template,))
+
+    def database_comment(self, name: str) -> Optional[str]:
+        with self._direct_connection() as conn, conn.cursor() as cur:
+            cur.execute(DATABASE_COMMENT_SQL, (name,))
+            row = cur.fetchone()
+        return row[0] if row else None
+
+    def template_checksum(self, template: str) -> Optional[str]:
+        comment = self.database_comment(template)
+        if not comment or not comment.startswith(SEED_COMMENT_PREFIX):
+            return None
+        return comment[len(SEED_COMMENT_PREFIX) :]
+
+    @allure.step("Удаление базы данных {name}")
+    def drop_database(self, name: str) -> None:
+        with self._direct_connection() as conn, conn.cursor() as cur:
+            self._drop_database(cur, name)
+
+    @allure.step("Создание шаблона {template} из текущих данных")
+    def snapshot_template(
+        self, template: str, checksum: str, source: Optional[str] = None
+    ) -> None:
+        source = source or self._config["dbname"]
+        started = time.perf_counter()
+        with self._direct_connection() as conn, conn.cursor() as cur:
+            self._drop_database(cur, template)
+            self._create_database(cur, template, source, SEED_COMMENT_PREFIX + checksum)
+            cur.execute(
+                sql.SQL("ALTER DATABASE {} IS_TEMPLATE true").format(
+                    sql.Identifier(template)
+                )
+            )
+        allure.attach(
+            json.dumps(
+                {
+                    "template": template,
+                    "source": source,
+                    "checksum": checksum,
+                    "duration_s": round(time.perf_counter() - started, 3),
+                },
+                indent=2,
+            ),
+            "Шаблон БД",
+            allure.attachment_type.JSON,
+        )
+
+    @allure.step("Проверка актуальности шаблона {template}")
+    def ensure_template(self, template: str, seed_paths: Sequence[str] = ()) -> bool:
+        require_seed_paths(template, seed_paths)
+        checksum = seed_checksum(seed_paths)
+        with self.template_lock(template):
+            if self.template_checksum(template) == checksum:
+                return False
+            with allure.step(f"Шаблон {template} устарел, пересоздание"):
+                self._build_template(template, checksum, seed_paths)
+        return True
+
+    def _build_template(
+        self, template: str, checksum: str, seed_paths: Sequence[str]
+    ) -> None:
+        scratch = f"{template}_build"
+        started = time.perf_counter()
+        with self._direct_connection() as conn, conn.cursor() as cur:
+            self._drop_database(cur, scratch)
+            self._create_database(cur, scratch, EMPTY_TEMPLATE, "building")
+        try:
+            with self._direct_connection(scratch, autocommit=False) as conn:
+                with conn.cursor() as cur:
+                    for path in seed_paths:
+                        with open(path, encoding="utf-8") as seed_file:
+                            cur.execute(seed_file.read())
+                conn.commit()
+        except Exception:
+            self.drop_database(scratch)
+            raise
+        with self._direct_connection() as conn, conn.cursor() as cur:
+            self._drop_database(cur, template)
+            cur.execute(TERMINATE_BACKENDS_SQL, (scratch,))
+            cur.execute(
+                sql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+                    sql.Identifier(scratch), sql.Identifier(template)
+                )
+            )
+            cur.execute(
+                sql.SQL("COMMENT ON DATABASE {} IS {}").format(
+                    sql.Identifier(template),
+                    sql.Literal(SEED_COMMENT_PREFIX + checksum),
                 )
             )
-            """
-            self.execute(cart_items_query)
-
-            carts_query = f"""
-            DELETE FROM carts
-            WHERE user_id = (
-                SELECT id FROM users
-                WHERE username = '{username}'
+            cur.execute(
+                sql.SQL("ALTER DATABASE {} IS_TEMPLATE true").format(
+                    sql.Identifier(template)
+                )
             )
-            """
-            self.execute(carts_query)
+        allure.attach(
+            json.dumps(
+                {
+                    "template": template,
+                    "source": EMPTY_TEMPLATE,
+                    "seed_paths": list(seed_paths),
+                    "checksum": checksum,
+                    "duration_s": round(time.perf_counter() - started, 3),
+                },
+                indent=2,
+            ),
+            "Шаблон БД",
+            allure.attachment_type.JSON,
+        )
+
+    @allure.step("Восстановление базы данных из шаблона {template}")
+    def restore_template(
+        self,
+        template: str,
+        target: Optional[str] = None,
+        run_marker: Optional[str] = None,
+    ) -> bool:
+        target = target or self._config["dbname"]
+        comment = RESTORED_COMMENT_PREFIX + (run_marker or template)
+        with self.template_lock(template):
+            if run_marker is not None and self.database_comment(target) == comment:
+                return False
+            started = time.perf_counter()
+            with self._direct_connection() as conn, conn.cursor() as cur:
+                self._drop_database(cur, target)
+                self._create_database(cur, target, template, comment)
+        allure.attach(
+            json.dumps(
+                {
+                    "template": template,
+                    "target": target,
+                    "duration_s": round(time.perf_counter() - started, 3),
+                },
+                indent=2,
+            ),
+            "Восстановление из шаблона",
+            allure.attachment_type.JSON,
+        )
+        return True
+
+    @staticmethod
+    def _drop_database(cur: Any, name: str) -> None:
+        cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,))
+        if cur.fetchone() is None:
+            return
+        identifier = sql.Identifier(name)
+        cur.execute(sql.SQL("ALTER DATABASE {} IS_TEMPLATE false").format(identifier))
+        cur.execute(TERMINATE_BACKENDS_SQL, (name,))
+        cur.execute(sql.SQL("DROP DATABASE {}").format(identifier))
+
+    @staticmethod
+    def _create_database(cur: Any, name: str, template: str, comment: str) -> None:
+        cur.execute(TERMINATE_BACKENDS_SQL, (template,))
+        cur.execute(
+            sql.SQL("CREATE DATABASE {} TEMPLATE {}").format(
+                sql.Identifier(name), sql.Identifier(template)
+            )
+        )
+        cur.execute(
+            sql.SQL("COMMENT ON DATABASE {} IS {}").format(
+                sql.Identifier(name), sql.Literal(comment)
+            )
+        )
+
+    @allure.step("Проверка существования пользователей")
+    def existing_users(self, usernames: Sequence[str]) -> Set[str]:
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return set()
+        rows = self.execute(EXISTING_USERS_SQL, (usernames,))
+        return {row[0] for row in rows or []}
+
+    @allure.step("Удаление пользователей и связанных данных")
+    def delete_users(self, usernames: Sequence[str]) -> None:
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return
+        with allure.step(f"Удаление пользователей: {len(usernames)}"):
+            self.execute(DELETE_USERS_SQL, {"usernames": usernames})
 
-            user_query = f"DELETE FROM users WHERE username = '{username}'"
-            self.execute(user_query)
+    @allure.step("Очистка корзин пользователей")
+    def delete_carts(self, usernames: Sequence[str]) -> None:
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return
+        with allure.step(f"Очистка корзин пользователей: {len(usernames)}"):
+            self.execute(DELETE_CARTS_SQL, {"usernames": usernames})
+
+    @allure.step("Удаление пользователя и связанных данных")
+    def delete_user(self, username: str) -> None:
+        with allure.step(f"Удаление пользователя: {username}"):
+            self.delete_users([username])
 
     @allure.step("Очистка корзины пользователя")
     def delete_cart(self, username: str) -> None:
         with allure.step(f"Очистка корзины пользователя: {username}"):
-            cart_items_query = f"""
-            DELETE FROM cart_items
-            WHERE cart_id IN (
-                SELECT id FROM carts
-                WHERE user_id = (
-                    SELECT id FROM users
-                    WHERE username = '{username}'
-                )
-            )
-            """
-            self.execute(cart_items_query)
-
-            carts_query = f"""
-            DELETE FROM carts
-            WHERE user_id = (
-                SELECT id FROM users
-                WHERE username = '{username}'
-            )
-            """
-            self.execute(carts_query)
+            self.delete_carts([username])
+
+    def close(self) -> None:
+        if getattr(self, "pool", None) is not None and not self.pool.closed:
+            self.pool.closeall()
 
     def __del__(self):
         try:
-            if hasattr(self, "conn") and self.conn:
+            if hasattr(self, "pool") and self.pool:
                 with allure.step("Закрытие соединения с БД"):
-                    self.conn.close()
+                    self.close()
         except Exception:
             pass
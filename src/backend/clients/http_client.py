@@ -1,23 +1,93 @@
-from typing import Optional, Dict
+from collections import deque
+from contextlib import nullcontext
+from typing import Any, Optional, Dict
+import random
+import time
 import requests
 import allure
+from requests.adapters import BaseAdapter
 from urllib.parse import urljoin
 import json
+from src.backend.clients.metrics import (
+    RequestMetrics,
+    TimedHTTPAdapter,
+    default_metrics,
+    normalize_route,
+    take_connect_time,
+)
+from src.backend.clients.reporting import ReportingLevel, truncate
+from src.backend.clients.response_cache import ResponseCache
+from config import HTTP_POOL_CONFIG
 
 
 class HTTPClient:
 
     def __init__(
-        self, host: str, default_headers: Optional[Dict[str, str]] = None
+        self,
+        host: str,
+        default_headers: Optional[Dict[str, str]] = None,
+        pool_connections: int = HTTP_POOL_CONFIG["pool_connections"],
+        pool_maxsize: int = HTTP_POOL_CONFIG["pool_maxsize"],
+        pool_block: bool = HTTP_POOL_CONFIG["pool_block"],
+        connect_timeout: float = HTTP_POOL_CONFIG["connect_timeout"],
+        read_timeout: float = HTTP_POOL_CONFIG["read_timeout"],
+        reporting_level: str = ReportingLevel.FULL,
+        sample_rate: float = 10.0,
+        max_attachment_bytes: int = 64 * 1024,
+        pending_reports: int = 20,
+        metrics: Optional[RequestMetrics] = None,
+        cache: Optional[ResponseCache] = None,
     ) -> None:
         self._host = host
         self._default_headers = default_headers or {}
+        self._timeout = (connect_timeout, read_timeout)
+        self._reporting_level = ReportingLevel(reporting_level)
+        self._sample_rate = sample_rate
+        self._max_attachment_bytes = max_attachment_bytes
+        self._sampler = random.Random()
+        self._pending: deque = deque(maxlen=pending_reports)
+        self.metrics = metrics if metrics is not None else default_metrics
+        self.cache = cache
+        self._adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
         with allure.step("Инициализация HTTP клиента"):
             allure.attach(
                 f"Базовый URL: {host}",
                 "Конфигурация клиента",
                 allure.attachment_type.TEXT,
             )
+            allure.attach(
+                json.dumps(
+                    {
+                        "pool_connections": pool_connections,
+                        "pool_maxsize": pool_maxsize,
+                        "pool_block": pool_block,
+                        "connect_timeout": connect_timeout,
+                        "read_timeout": read_timeout,
+                    },
+                    indent=2,
+                ),
+                "Конфигурация пула соединений",
+                allure.attachment_type.JSON,
+            )
+            allure.attach(
+                json.dumps(
+                    {
+                        "reporting_level": self._reporting_level.value,
+                        "sample_rate": sample_rate,
+                        "max_attachment_bytes": max_attachment_bytes,
+                    },
+                    indent=2,
+                ),
+                "Конфигурация отчётности",
+                allure.attachment_type.JSON,
+            )
             if default_headers:
                 allure.attach(
                     json.dumps(default_headers, indent=2),
@@ -25,90 +95,286 @@ class HTTPClient:
                     allure.attachment_type.JSON,
                 )
 
+    @property
+    def base_url(self) -> str:
+        return self._host
+
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._session.close()
+
+    def mount(self, prefix: str, adapter: BaseAdapter) -> None:
+        self._session.mount(prefix, adapter)
+
+    def connection_stats(self) -> Dict[str, int]:
+        pools = self._adapter.poolmanager.pools
+        opened = 0
+        sent = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            opened += pool.num_connections
+            sent += pool.num_requests
+        return {
+            "requests": sent,
+            "connections_opened": opened,
+            "connections_reused": max(sent - opened, 0),
+            "active_pools": len(pools),
+        }
+
+    def flush_pending(self) -> int:
+        reports = list(self._pending)
+        self._pending.clear()
+        if reports:
+            with allure.step("Отложенные детали HTTP запросов"):
+                for report in reports:
+                    report()
+        return len(reports)
+
+    def discard_pending(self) -> None:
+        self._pending.clear()
+
     def get(
-        self, route: str, headers: Optional[Dict] = None, params: Optional[Dict] = None
+        self,
+        route: str,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        stream: bool = False,
+        quiet: bool = False,
+    ) -> requests.Response:
+        if (
+            self.cache is not None
+            and not stream
+            and self.cache.enabled_for(route)
+            and not any(name.lower() == "if-none-match" for name in headers or {})
+        ):
+            return self._cached_get(route, headers, params, quiet)
+        return self._request(
+            "GET", route, headers, stream=stream, quiet=quiet, params=params
+        )
+
+    def _cached_get(
+        self,
+        route: str,
+        headers: Optional[Dict],
+        params: Optional[Dict],
+        quiet: bool,
     ) -> requests.Response:
-        return self._request("GET", route, headers, params=params)
+        key = self.cache.key(
+            "GET", route, params, {**self._default_headers, **(headers or {})}
+        )
+        entry = self.cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            response = self.cache.respond(entry)
+            if not quiet and self._should_attach(response):
+                with allure.step(f"GET {urljoin(self._host, route)} (из кэша)"):
+                    allure.attach(
+                        json.dumps(
+                            {
+                                "status_code": response.status_code,
+                                "etag": entry.etag,
+                                "size_bytes": entry.size,
+                                "expires_in_s": round(
+                                    entry.expires_at - time.monotonic(), 3
+                                ),
+                            },
+                            indent=2,
+                        ),
+                        "Ответ из кэша",
+                        allure.attachment_type.JSON,
+                    )
+            return response
+        if entry is not None and entry.etag is not None:
+            response = self._request(
+                "GET",
+                route,
+                {**(headers or {}), "If-None-Match": entry.etag},
+                quiet=quiet,
+                params=params,
+            )
+            if response.status_code == 304:
+                self.cache.revalidated(key, response)
+                return self.cache.respond(entry)
+        else:
+            response = self._request("GET", route, headers, quiet=quiet, params=params)
+        self.cache.store(key, response)
+        return response
 
     def post(
-        self, route: str, headers: Optional[Dict] = None, json: Optional[Dict] = None
+        self,
+        route: str,
+        headers: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        quiet: bool = False,
     ) -> requests.Response:
-        return self._request("POST", route, headers, json=json)
+        return self._request("POST", route, headers, quiet=quiet, json=json)
 
     def _request(
-        self, method: str, route: str, headers: Optional[Dict] = None, **kwargs
+        self,
+        method: str,
+        route: str,
+        headers: Optional[Dict] = None,
+        stream: bool = False,
+        quiet: bool = False,
+        **kwargs,
     ) -> requests.Response:
+        started = time.perf_counter()
+        take_connect_time()
+        endpoint = f"{method} {normalize_route(route)}"
         url = urljoin(self._host, route)
         req_headers = {**self._default_headers, **(headers or {})}
-        with allure.step(f"{method} {url}"):
-            request_details = {
-                "method": method,
-                "url": url,
-                "headers": req_headers,
-                "base_url": self._host,
-                "route": route,
-            }
-            if "params" in kwargs:
-                request_details["query_params"] = kwargs["params"]
-            if "json" in kwargs:
-                request_details["json_body"] = kwargs["json"]
-            if "data" in kwargs:
-                request_details["form_data"] = kwargs["data"]
-            allure.attach(
-                json.dumps(request_details, indent=2, ensure_ascii=False),
-                "Детали HTTP запроса",
-                allure.attachment_type.JSON,
-            )
+        with nullcontext() if quiet else allure.step(f"{method} {url}"):
             try:
-                response = requests.request(method, url, headers=req_headers, **kwargs)
-                response_details = {
-                    "status_code": response.status_code,
-                    "status_text": response.reason,
-                    "headers": dict(response.headers),
-                    "url": response.url,
-                    "elapsed_time": str(response.elapsed),
-                    "encoding": response.encoding,
-                    "cookies": dict(response.cookies),
-                }
-                allure.attach(
-                    json.dumps(response_details, indent=2, ensure_ascii=False),
-                    "Детали HTTP ответа",
-                    allure.attachment_type.JSON,
+                kwargs.setdefault("timeout", self._timeout)
+                sent_at = time.perf_counter()
+                response = self._session.request(
+                    method, url, headers=req_headers, stream=True, **kwargs
                 )
-                try:
-                    response_json = response.json()
+                first_byte_at = time.perf_counter()
+                if not stream:
+                    response.content
+                downloaded_at = time.perf_counter()
+            except requests.exceptions.RequestException as e:
+                if self._reporting_level != ReportingLevel.OFF and not quiet:
+                    self._attach_request(method, url, route, req_headers, kwargs)
+                    error_details = {
+                        "error_type": type(e).__name__,
+                        "error_message": str(e),
+                        "request_url": url,
+                        "request_method": method,
+                    }
                     allure.attach(
-                        json.dumps(response_json, indent=2, ensure_ascii=False),
-                        "JSON ответ",
+                        json.dumps(error_details, indent=2, ensure_ascii=False),
+                        "Ошибка HTTP запроса",
                         allure.attachment_type.JSON,
                     )
-                except (ValueError, json.JSONDecodeError):
-                    allure.attach(
-                        response.text, "Текстовый ответ", allure.attachment_type.TEXT
-                    )
-                if response.status_code < 400:
-                    allure.attach(
-                        f"Успешный ответ: {response.status_code}",
-                        "Результат запроса",
-                        allure.attachment_type.TEXT,
-                    )
-                else:
-                    allure.attach(
-                        f"Ошибка: {response.status_code}",
-                        "Результат запроса",
-                        allure.attachment_type.TEXT,
-                    )
-                return response
-            except requests.exceptions.RequestException as e:
-                error_details = {
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "request_url": url,
-                    "request_method": method,
-                }
-                allure.attach(
-                    json.dumps(error_details, indent=2, ensure_ascii=False),
-                    "Ошибка HTTP запроса",
-                    allure.attachment_type.JSON,
-                )
                 raise
+            connect = take_connect_time()
+            self._time_json(response, endpoint)
+
+            def report() -> None:
+                self._attach_request(method, url, route, req_headers, kwargs)
+                self._attach_response(response, include_body=not stream)
+
+            if not quiet and self._should_attach(response):
+                report()
+            elif self._reporting_level != ReportingLevel.OFF:
+                self._pending.append(report)
+            reported_at = time.perf_counter()
+        finished = time.perf_counter()
+        timings = {
+            "total": (finished - started) * 1000,
+            "connect": connect * 1000,
+            "ttfb": max(first_byte_at - sent_at - connect, 0.0) * 1000,
+            "attachments": (reported_at - downloaded_at) * 1000,
+            "framework": (sent_at - started + finished - downloaded_at) * 1000,
+        }
+        if not stream:
+            timings["download"] = (downloaded_at - first_byte_at) * 1000
+        self.metrics.record_request(endpoint, timings)
+        return response
+
+    def _time_json(self, response: requests.Response, endpoint: str) -> None:
+        decode = response.json
+
+        def timed_json(**json_kwargs) -> Any:
+            started = time.perf_counter()
+            try:
+                return decode(**json_kwargs)
+            finally:
+                self.metrics.record(
+                    endpoint, "json_decode", (time.perf_counter() - started) * 1000
+                )
+
+        response.json = timed_json
+
+    def _should_attach(self, response: requests.Response) -> bool:
+        if self._reporting_level == ReportingLevel.FULL:
+            return True
+        if self._reporting_level == ReportingLevel.ERRORS:
+            return response.status_code >= 400
+        if self._reporting_level == ReportingLevel.SAMPLED:
+            return (
+                response.status_code >= 400
+                or self._sampler.random() * 100 < self._sample_rate
+            )
+        return False
+
+    def _attach(self, body: str, name: str, attachment_type: Any) -> None:
+        body, truncated = truncate(body, self._max_attachment_bytes)
+        if truncated and attachment_type == allure.attachment_type.JSON:
+            attachment_type = allure.attachment_type.TEXT
+        allure.attach(body, name, attachment_type)
+
+    def _attach_request(
+        self,
+        method: str,
+        url: str,
+        route: str,
+        req_headers: Dict,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        request_details = {
+            "method": method,
+            "url": url,
+            "headers": req_headers,
+            "base_url": self._host,
+            "route": route,
+        }
+        if "params" in kwargs:
+            request_details["query_params"] = kwargs["params"]
+        if "json" in kwargs:
+            request_details["json_body"] = kwargs["json"]
+        if "data" in kwargs:
+            request_details["form_data"] = kwargs["data"]
+        self._attach(
+            json.dumps(request_details, indent=2, ensure_ascii=False, default=str),
+            "Детали HTTP запроса",
+            allure.attachment_type.JSON,
+        )
+
+    def _attach_response(
+        self, response: requests.Response, include_body: bool = True
+    ) -> None:
+        response_details = {
+            "status_code": response.status_code,
+            "status_text": response.reason,
+            "headers": dict(response.headers),
+            "url": response.url,
+            "elapsed_time": str(response.elapsed),
+            "encoding": response.encoding,
+            "cookies": dict(response.cookies),
+        }
+        allure.attach(
+            json.dumps(response_details, indent=2, ensure_ascii=False),
+            "Детали HTTP ответа",
+            allure.attachment_type.JSON,
+        )
+        if not include_body:
+            allure.attach(
+                "Тело ответа читается потоково и не прикладывается",
+                "Потоковый ответ",
+                allure.attachment_type.TEXT,
+            )
+        elif "json" in response.headers.get("Content-Type", ""):
+            self._attach(response.text, "JSON ответ", allure.attachment_type.JSON)
+        else:
+            self._attach(response.text, "Текстовый ответ", allure.attachment_type.TEXT)
+        if response.status_code < 400:
+            allure.attach(
+                f"Успешный ответ: {response.status_code}",
+                "Результат запроса",
+                allure.attachment_type.TEXT,
+            )
+        else:
+            allure.attach(
+                f"Ошибка: {response.status_code}",
+                "Результат запроса",
+                allure.attachment_type.TEXT,
+            )
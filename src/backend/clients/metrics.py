@@ -0,0 +1,142 @@
+import json
+import re
+import threading
+import time
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from requests.adapters import HTTPAdapter
+from src.utils.histogram import Histogram
+
+PHASES = (
+    "total",
+    "connect",
+    "ttfb",
+    "download",
+    "json_decode",
+    "attachments",
+    "framework",
+)
+
+_ID_SEGMENT = re.compile(r"^\d+$")
+_connect_timer = threading.local()
+
+
+def normalize_route(route: str) -> str:
+    path = urlsplit(route).path or "/"
+    return "/".join(
+        "<id>" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+def take_connect_time() -> float:
+    elapsed = getattr(_connect_timer, "elapsed", 0.0)
+    _connect_timer.elapsed = 0.0
+    return elapsed
+
+
+class _TimedConnectMixin:
+    def connect(self) -> None:
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timer.elapsed = (
+                getattr(_connect_timer, "elapsed", 0.0) + time.perf_counter() - started
+            )
+
+
+class TimedHTTPConnection(_TimedConnectMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+class RequestMetrics:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Histogram]] = {}
+
+    def record(self, endpoint: str, phase: str, value_ms: float) -> None:
+        with self._lock:
+            phases = self._endpoints.setdefault(endpoint, {})
+            histogram = phases.get(phase)
+            if histogram is None:
+                histogram = phases[phase] = Histogram()
+        histogram.record(value_ms)
+
+    def record_request(self, endpoint: str, timings_ms: Dict[str, float]) -> None:
+        for phase, value_ms in timings_ms.items():
+            self.record(endpoint, phase, value_ms)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        with self._lock:
+            endpoints = {name: dict(phases) for name, phases in self._endpoints.items()}
+        return {
+            name: {
+                phase: phases[phase].summary() for phase in PHASES if phase in phases
+            }
+            for name, phases in sorted(endpoints.items())
+        }
+
+    def slowest(
+        self, limit: int = 10, phase: str = "total", percentile: str = "p95_ms"
+    ) -> List[Tuple[str, Dict[str, Dict[str, float]]]]:
+        ranked = [
+            (name, phases) for name, phases in self.summary().items() if phase in phases
+        ]
+        ranked.sort(key=lambda entry: entry[1][phase][percentile], reverse=True)
+        return ranked[:limit]
+
+    def export_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as export_file:
+            json.dump(self.summary(), export_file, indent=2, ensure_ascii=False)
+
+    def format_table(self, limit: int = 10) -> List[str]:
+        header = (
+            f"{'endpoint':<28}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}"
+            f"{'connect':>9}{'ttfb':>9}{'download':>10}{'json':>8}{'framework':>11}"
+        )
+        lines = [header, "-" * len(header)]
+        for name, phases in self.slowest(limit):
+            total = phases["total"]
+
+            def mean(phase: str) -> float:
+                return phases.get(phase, {}).get("mean_ms", 0.0)
+
+            lines.append(
+                f"{name:<28}{total['count']:>7}{total['p50_ms']:>9.2f}"
+                f"{total['p95_ms']:>9.2f}{total['p99_ms']:>9.2f}"
+                f"{mean('connect'):>9.2f}{mean('ttfb'):>9.2f}"
+                f"{mean('download'):>10.2f}{mean('json_decode'):>8.2f}"
+                f"{mean('framework'):>11.2f}"
+            )
+        return lines
+
+
+default_metrics = RequestMetrics()
@@ -0,0 +1,19 @@
+from enum import Enum
+from typing import Tuple
+
+
+class ReportingLevel(str, Enum):
+    FULL = "full"
+    ERRORS = "errors"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+def truncate(text: str, max_bytes: int) -> Tuple[str, bool]:
+    if max_bytes <= 0 or len(text) * 4 <= max_bytes:
+        return text, False
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text, False
+    cut = encoded[:max_bytes].decode("utf-8", "ignore")
+    return f"{cut}\n... [обрезано {len(encoded) - max_bytes} байт]", True
@@ -0,0 +1,172 @@
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+import requests
+from src.backend.clients.metrics import normalize_route
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def _cache_control(response: requests.Response) -> Dict[str, Optional[str]]:
+    directives: Dict[str, Optional[str]] = {}
+    for part in response.headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+class CacheEntry:
+
+    __slots__ = ("response", "etag", "expires_at", "size")
+
+    def __init__(
+        self, response: requests.Response, etag: Optional[str], expires_at: float
+    ) -> None:
+        self.response = response
+        self.etag = etag
+        self.expires_at = expires_at
+        self.size = len(response.content)
+
+    def is_fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+
+class ResponseCache:
+
+    def __init__(
+        self,
+        routes: Sequence[str] = ("/catalog/",),
+        ttl: float = 60.0,
+        max_entries: int = 256,
+        max_bytes: int = 16 * 1024 * 1024,
+    ) -> None:
+        self._routes = {normalize_route(route) for route in routes}
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def enabled_for(self, route: str) -> bool:
+        return normalize_route(route) in self._routes
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @staticmethod
+    def key(
+        method: str,
+        route: str,
+        params: Optional[Dict[str, Any]],
+        headers: Dict[str, str],
+    ) -> CacheKey:
+        parts = urlsplit(route)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query.extend(
+            (str(name), str(value))
+            for name, value in (params or {}).items()
+            if value is not None
+        )
+        authorization = next(
+            (
+                value
+                for name, value in headers.items()
+                if name.lower() == "authorization"
+            ),
+            "",
+        )
+        scope = hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+        return (method.upper(), parts.path, tuple(sorted(query)), scope)
+
+    def lookup(self, key: CacheKey) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.is_fresh():
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def respond(self, entry: CacheEntry) -> requests.Response:
+        response = copy.copy(entry.response)
+        response.headers = entry.response.headers.copy()
+        return response
+
+    def revalidated(self, key: CacheKey, not_modified: requests.Response) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self.revalidations += 1
+            entry.expires_at = time.monotonic() + self._lifetime(not_modified)
+
+    def store(self, key: CacheKey, response: requests.Response) -> None:
+        directives = _cache_control(response)
+        if response.status_code != 200 or "no-store" in directives:
+            return
+        lifetime = self._lifetime(response)
+        etag = response.headers.get("ETag")
+        if lifetime <= 0 and etag is None:
+            return
+        declared = response.headers.get("Content-Length", "")
+        if declared.isdigit() and int(declared) > self._max_bytes:
+            return
+        stored = copy.copy(response)
+        stored.headers = response.headers.copy()
+        entry = CacheEntry(stored, etag, time.monotonic() + lifetime)
+        if entry.size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self.stores += 1
+            while self._entries and (
+                len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def _lifetime(self, response: requests.Response) -> float:
+        directives = _cache_control(response)
+        if "no-cache" in directives:
+            return 0.0
+        max_age = directives.get("s-maxage") or directives.get("max-age")
+        if max_age is not None:
+            try:
+                return min(float(max_age), self._ttl)
+            except ValueError:
+                return 0.0
+        return self._ttl
@@ -0,0 +1,29 @@
+import argparse
+from src.backend.fake.server import FakeShopServer
+from src.backend.fake.shop import FakeShop, default_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.backend.fake",
+        description="Локальная заглушка backend API магазина",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5050)
+    parser.add_argument("--catalog-size", type=int, default=30)
+    args = parser.parse_args()
+
+    server = FakeShopServer(
+        FakeShop(default_catalog(args.catalog_size)), args.host, args.port
+    )
+    print(f"Заглушка магазина запущена на {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import sqlite3
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+import allure
+from src.backend.clients.db_client import (
+    ISOLATION_SAVEPOINT,
+    require_seed_paths,
+    seed_checksum,
+)
+from src.backend.fake.shop import FakeShop
+from src.builders.user_builder import UserBuilder
+from src.utils.passwords import hash_password
+
+TEST_DATA_TABLES = ("order_items", "orders", "cart_items", "carts", "users")
+
+
+class FakeDbClient:
+
+    def __init__(self, shop: FakeShop) -> None:
+        self.shop = shop
+        self.in_isolation = False
+        self._templates: Dict[str, Tuple[sqlite3.Connection, str]] = {}
+
+    def execute(
+        self, query: str, params: Optional[Any] = None
+    ) -> Optional[List[tuple]]:
+        with self.shop.lock:
+            cursor = self.shop.conn.execute(query, params or ())
+            if cursor.description is None:
+                return None
+            return [tuple(row) for row in cursor.fetchall()]
+
+    @contextmanager
+    def isolated(self) -> Iterator[Any]:
+        with self.shop.lock:
+            self.shop.conn.execute(f"SAVEPOINT {ISOLATION_SAVEPOINT}")
+        self.in_isolation = True
+        try:
+            yield self.shop.conn
+        finally:
+            self.in_isolation = False
+            with self.shop.lock:
+                self.shop.conn.execute(f"ROLLBACK TO {ISOLATION_SAVEPOINT}")
+                self.shop.conn.execute(f"RELEASE {ISOLATION_SAVEPOINT}")
+
+    @allure.step("Массовое создание пользователей")
+    def seed_users(
+        self,
+        count: int,
+        user_builder: Optional[UserBuilder] = None,
+        cart_items: Optional[Sequence[Dict[str, int]]] = None,
+        batch_size: int = 1000,
+        password_iterations: int = 1000,
+        on_batch: Optional[Callable[[List[str]], None]] = None,
+    ) -> List[Dict[str, str]]:
+        user_builder = user_builder or UserBuilder()
+        seeded: List[Dict[str, str]] = []
+        while len(seeded) < count:
+            batch = user_builder.build_many(min(batch_size, count - len(seeded)))
+            usernames = [user["username"] for user in batch]
+            if on_batch is not None:
+                on_batch(usernames)
+            with self.shop.lock:
+                conn = self.shop.conn
+                conn.execute("SAVEPOINT seed_users")
+                try:
+                    conn.executemany(
+                        "INSERT INTO users (username, password) VALUES (?, ?)",
+                        [
+                            (
+                                user["username"],
+                                hash_password(user["password"], password_iterations),
+                            )
+                            for user in batch
+                        ],
+                    )
+                    if cart_items is not None:
+                        users = "SELECT id FROM users WHERE username IN "
+                        users += f"({self._marks(usernames)})"
+                        conn.execute(f"INSERT INTO carts (user_id) {users}", usernames)
+                        conn.executemany(
+                            "INSERT INTO cart_items (cart_id, item_id, quantity) "
+                            f"SELECT id, ?, ? FROM carts WHERE user_id IN ({users})",
+                            [
+                                (item["item_id"], item["quantity"], *usernames)
+                                for item in cart_items
+                            ],
+                        )
+                    conn.execute("RELEASE seed_users")
+                except Exception:
+                    conn.execute("ROLLBACK TO seed_users")
+                    conn.execute("RELEASE seed_users")
+                    raise
+            seeded.extend(batch)
+        return seeded
+
+    @allure.step("Проверка существования пользователей")
+    def existing_users(self, usernames: Sequence[str]) -> Set[str]:
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return set()
+        rows = self.execute(
+            f"SELECT username FROM users WHERE username IN ({self._marks(usernames)})",
+            usernames,
+        )
+        return {row[0] for row in rows}
+
+    @allure.step("Удаление пользователей и связанных данных")
+    def delete_users(self, usernames: Sequence[str]) -> None:
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return
+        with self.shop.lock:
+            self._delete_carts(usernames)
+            self.shop.conn.execute(
+                f"DELETE FROM users WHERE username IN ({self._marks(usernames)})",
+                usernames,
+            )
+
+    @allure.step("Очистка корзин пользователей")
+    def delete_carts(self, usernames: Sequence[str]) -> None:
+        usernames = list(dict.fromkeys(usernames))
+        if not usernames:
+            return
+        with self.shop.lock:
+            self._delete_carts(usernames)
+
+    def delete_user(self, username: str) -> None:
+        self.delete_users([username])
+
+    def delete_cart(self, username: str) -> None:
+        self.delete_carts([username])
+
+    def template_checksum(self, template: str) -> Optional[str]:
+        snapshot = self._templates.get(template)
+        return snapshot[1] if snapshot else None
+
+    def drop_database(self, name: str) -> None:
+        snapshot = self._templates.pop(name, None)
+        if snapshot is not None:
+            snapshot[0].close()
+
+    def snapshot_template(
+        self, template: str, checksum: str, source: Optional[str] = None
+    ) -> None:
+        copy = sqlite3.connect(":memory:", check_same_thread=False)
+        with self.shop.lock:
+            self.shop.conn.backup(copy)
+        self.drop_database(template)
+        self._templates[template] = (copy, checksum)
+
+    def ensure_template(self, template: str, seed_paths: Sequence[str] = ()) -> bool:
+        require_seed_paths(template, seed_paths)
+        checksum = seed_checksum(seed_paths)
+        if self.template_checksum(template) == checksum:
+            return False
+        scratch = sqlite3.connect(":memory:", check_same_thread=False)
+        with self.shop.lock:
+            self.shop.conn.backup(scratch)
+        scratch.executescript(
+            "".join(f"DELETE FROM {table};" for table in TEST_DATA_TABLES)
+        )
+        for path in seed_paths:
+            with open(path, encoding="utf-8") as seed_file:
+                scratch.executescript(seed_file.read())
+        self.drop_database(template)
+        self._templates[template] = (scratch, checksum)
+        return True
+
+    def restore_template(
+        self,
+        template: str,
+        target: Optional[str] = None,
+        run_marker: Optional[str] = None,
+    ) -> bool:
+        with self.shop.lock:
+            self._templates[template][0].backup(self.shop.conn)
+        return True
+
+    def close(self) -> None:
+        for template in list(self._templates):
+            self.drop_database(template)
+
+    def _delete_carts(self, usernames: List[str]) -> None:
+        users = f"SELECT id FROM users WHERE username IN ({self._marks(usernames)})"
+        self.shop.conn.execute(
+            "DELETE FROM cart_items WHERE cart_id IN "
+            f"(SELECT id FROM carts WHERE user_id IN ({users}))",
+            usernames,
+        )
+        self.shop.conn.execute(
+            f"DELETE FROM carts WHERE user_id IN ({users})", usernames
+        )
+
+    @staticmethod
+    def _marks(values: Sequence[Any]) -> str:
+        return ", ".join("?" for _ in values)
@@ -0,0 +1,384 @@
+import base64
+import hashlib
+import hmac
+import json
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from pydantic import ValidationError
+from src.backend.services.auth.models import RegisterRequest
+from src.backend.services.cart.models import AddToCartRequest, RemoveFromCartRequest
+from src.utils.passwords import check_password, hash_password
+
+SCHEMA_SQL = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL
+);
+CREATE TABLE items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    image_url TEXT NOT NULL
+);
+CREATE TABLE carts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL UNIQUE
+);
+CREATE TABLE cart_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cart_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    UNIQUE (cart_id, item_id)
+);
+CREATE TABLE orders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    total_price INTEGER NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE order_items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    order_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    brand TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    quantity INTEGER NOT NULL
+);
+"""
+
+BRANDS = ["Apple", "Samsung", "Xiaomi", "Sony", "Lenovo", "Asus"]
+PRODUCTS = ["Phone", "Tablet", "Laptop", "Headphones", "Watch"]
+SORTS = {
+    "price_asc": "price ASC, id ASC",
+    "price_desc": "price DESC, id ASC",
+    "name_asc": "name ASC, id ASC",
+    "name_desc": "name DESC, id ASC",
+}
+ORDER_ROUTE = re.compile(r"^/orders/(\d+)/?$")
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def default_catalog(size: int = 30) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": f"{BRANDS[i % len(BRANDS)]} {PRODUCTS[i % len(PRODUCTS)]} {i + 1}",
+            "brand": BRANDS[i % len(BRANDS)],
+            "price": 50 + (i * 137) % 1950,
+            "image_url": f"https://static.shop.local/items/{i + 1}.png",
+        }
+        for i in range(size)
+    ]
+
+
+class FakeShop:
+
+    def __init__(
+        self,
+        catalog: Optional[List[Dict[str, Any]]] = None,
+        secret: str = "fake-shop-secret",
+        token_ttl: int = 3600,
+        password_iterations: int = 1000,
+    ) -> None:
+        self._secret = secret.encode("utf-8")
+        self._token_ttl = token_ttl
+        self._password_iterations = password_iterations
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(
+            ":memory:", check_same_thread=False, isolation_level=None
+        )
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA_SQL)
+        self.load_catalog(default_catalog() if catalog is None else catalog)
+
+    def load_catalog(self, catalog: List[Dict[str, Any]]) -> None:
+        with self.lock:
+            self.conn.execute("DELETE FROM items")
+            self.conn.executemany(
+                "INSERT INTO items (name, brand, price, image_url) "
+                "VALUES (:name, :brand, :price, :image_url)",
+                catalog,
+            )
+            self._catalog_version = hashlib.sha1(
+                json.dumps(catalog, sort_keys=True).encode("utf-8")
+            ).hexdigest()[:16]
+
+    def issue_token(self, user_id: int, username: str) -> str:
+        header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode("utf-8"))
+        payload = _b64(
+            json.dumps(
+                {
+                    "sub": username,
+                    "user_id": user_id,
+                    "exp": int(time.time()) + self._token_ttl,
+                }
+            ).encode("utf-8")
+        )
+        signature = hmac.new(
+            self._secret, f"{header}.{payload}".encode("ascii"), hashlib.sha256
+        ).digest()
+        return f"{header}.{payload}.{_b64(signature)}"
+
+    def handle(
+        self, method: str, url: str, headers: Dict[str, str], body: Optional[bytes]
+    ) -> Response:
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        headers = {k.lower(): v for k, v in headers.items()}
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return self._json(400, {"message": "Invalid JSON body"})
+        with self.lock:
+            if method == "POST" and path == "/auth/register":
+                return self._register(payload)
+            if method == "POST" and path == "/auth/login":
+                return self._login(payload)
+            if method == "GET" and path in ("/catalog", "/catalog/"):
+                return self._catalog(query, headers)
+            user_id = self._authenticate(headers)
+            if user_id is None:
+                return self._json(401, {"message": "Unauthorized"})
+            if method == "GET" and path in ("/cart", "/cart/"):
+                return self._get_cart(user_id)
+            if method == "POST" and path == "/cart/add":
+                return self._add_to_cart(user_id, payload)
+            if method == "POST" and path == "/cart/remove":
+                return self._remove_from_cart(user_id, payload)
+            if method == "POST" and path in ("/orders", "/orders/"):
+                return self._create_order(user_id)
+            match = ORDER_ROUTE.match(path)
+            if method == "GET" and match:
+                return self._get_order(user_id, int(match.group(1)))
+        return self._json(404, {"message": "Not found"})
+
+    def _json(
+        self, status: int, data: Any, extra_headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(body)),
+            **(extra_headers or {}),
+        }
+        return status, headers, body
+
+    def _authenticate(self, headers: Dict[str, str]) -> Optional[int]:
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme != "Bearer" or token.count(".") != 2:
+            return None
+        header, payload, signature = token.split(".")
+        expected = hmac.new(
+            self._secret, f"{header}.{payload}".encode("utf-8"), hashlib.sha256
+        ).digest()
+        if not hmac.compare_digest(
+            _b64(expected).encode("ascii"), signature.encode("utf-8")
+        ):
+            return None
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        if claims.get("exp", 0) < time.time():
+            return None
+        row = self.conn.execute(
+            "SELECT id FROM users WHERE id = ?", (claims.get("user_id"),)
+        ).fetchone()
+        return row["id"] if row else None
+
+    def _register(self, payload: Any) -> Response:
+        try:
+            request = RegisterRequest(**(payload or {}))
+        except (ValidationError, TypeError) as e:
+            return self._json(400, {"message": "Validation error", "details": str(e)})
+        exists = self.conn.execute(
+            "SELECT 1 FROM users WHERE username = ?", (request.username,)
+        ).fetchone()
+        if exists:
+            return self._json(400, {"message": "User already exists"})
+        self.conn.execute(
+            "INSERT INTO users (username, password) VALUES (?, ?)",
+            (
+                request.username,
+                hash_password(request.password, self._password_iterations),
+            ),
+        )
+        return self._json(200, {"message": "Registration successful"})
+
+    def _login(self, payload: Any) -> Response:
+        payload = payload if isinstance(payload, dict) else {}
+        row = self.conn.execute(
+            "SELECT id, username, password FROM users WHERE username = ?",
+            (payload.get("username"),),
+        ).fetchone()
+        if row is None or not check_password(
+            row["password"], str(payload.get("password", ""))
+        ):
+            return self._json(401, {"message": "Invalid credentials"})
+        return self._json(200, {"token": self.issue_token(row["id"], row["username"])})
+
+    def _catalog(self, query: Dict[str, str], headers: Dict[str, str]) -> Response:
+        conditions, params = [], []
+        try:
+            for name, operator in (("min_price", ">="), ("max_price", "<=")):
+                if name in query:
+                    value = int(query[name])
+                    if value < 0:
+                        raise ValueError(name)
+                    conditions.append(f"price {operator} ?")
+                    params.append(value)
+        except ValueError:
+            return self._json(400, {"message": "Invalid filter parameters"})
+        if "brand" in query:
+            conditions.append("brand = ?")
+            params.append(query["brand"])
+        sort = query.get("sort")
+        if sort is not None and sort not in SORTS:
+            return self._json(400, {"message": "Invalid sort parameter"})
+        etag = self._catalog_etag(query)
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag, "Content-Length": "0"}, b""
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.conn.execute(
+            f"SELECT id, name, brand, price, image_url FROM items {where} "
+            f"ORDER BY {SORTS.get(sort, 'id ASC')}",
+            params,
+        ).fetchall()
+        return self._json(200, [dict(row) for row in rows], {"ETag": etag})
+
+    def _catalog_etag(self, query: Dict[str, str]) -> str:
+        query_hash = hashlib.sha1(
+            json.dumps(sorted(query.items())).encode("utf-8")
+        ).hexdigest()[:8]
+        return f'"{self._catalog_version}-{query_hash}"'
+
+    def _cart_id(self, user_id: int) -> int:
+        row = self.conn.execute(
+            "SELECT id FROM carts WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        if row:
+            return row["id"]
+        return self.conn.execute(
+            "INSERT INTO carts (user_id) VALUES (?)", (user_id,)
+        ).lastrowid
+
+    def _cart_rows(self, user_id: int) -> List[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT i.id AS item_id, i.name, i.brand, i.price, ci.quantity, i.image_url "
+            "FROM cart_items ci "
+            "JOIN carts c ON c.id = ci.cart_id "
+            "JOIN items i ON i.id = ci.item_id "
+            "WHERE c.user_id = ? ORDER BY ci.id",
+            (user_id,),
+        ).fetchall()
+
+    def _get_cart(self, user_id: int) -> Response:
+        items = [
+            {
+                "item_id": row["item_id"],
+                "name": row["name"],
+                "price": row["price"],
+                "quantity": row["quantity"],
+                "image_url": row["image_url"],
+            }
+            for row in self._cart_rows(user_id)
+        ]
+        return self._json(200, {"items": items})
+
+    def _add_to_cart(self, user_id: int, payload: Any) -> Response:
+        try:
+            request = AddToCartRequest(**(payload or {}))
+        except (ValidationError, TypeError) as e:
+            return self._json(400, {"message": "Validation error", "details": str(e)})
+        item = self.conn.execute(
+            "SELECT id FROM items WHERE id = ?", (request.item_id,)
+        ).fetchone()
+        if item is None:
+            return self._json(400, {"message": "Item not found"})
+        self.conn.execute(
+            "INSERT INTO cart_items (cart_id, item_id, quantity) VALUES (?, ?, ?) "
+            "ON CONFLICT (cart_id, item_id) "
+            "DO UPDATE SET quantity = quantity + excluded.quantity",
+            (self._cart_id(user_id), request.item_id, request.quantity),
+        )
+        return self._json(200, {"message": "Item added to cart"})
+
+    def _remove_from_cart(self, user_id: int, payload: Any) -> Response:
+        try:
+            request = RemoveFromCartRequest(**(payload or {}))
+        except (ValidationError, TypeError) as e:
+            return self._json(400, {"message": "Validation error", "details": str(e)})
+        deleted = self.conn.execute(
+            "DELETE FROM cart_items WHERE item_id = ? AND cart_id IN "
+            "(SELECT id FROM carts WHERE user_id = ?)",
+            (request.item_id, user_id),
+        ).rowcount
+        if not deleted:
+            return self._json(404, {"message": "Item not in cart"})
+        return self._json(200, {"message": "Item removed from cart"})
+
+    def _create_order(self, user_id: int) -> Response:
+        rows = self._cart_rows(user_id)
+        if not rows:
+            return self._json(400, {"message": "Cart is empty"})
+        total_price = sum(row["price"] * row["quantity"] for row in rows)
+        order_id = self.conn.execute(
+            "INSERT INTO orders (user_id, total_price, created_at) VALUES (?, ?, ?)",
+            (user_id, total_price, datetime.now(timezone.utc).isoformat()),
+        ).lastrowid
+        self.conn.executemany(
+            "INSERT INTO order_items (order_id, item_id, name, brand, price, quantity) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    order_id,
+                    row["item_id"],
+                    row["name"],
+                    row["brand"],
+                    row["price"],
+                    row["quantity"],
+                )
+                for row in rows
+            ],
+        )
+        self.conn.execute(
+            "DELETE FROM cart_items WHERE cart_id IN "
+            "(SELECT id FROM carts WHERE user_id = ?)",
+            (user_id,),
+        )
+        return self._json(200, {"message": "Order created", "order_id": order_id})
+
+    def _get_order(self, user_id: int, order_id: int) -> Response:
+        order = self.conn.execute(
+            "SELECT id, total_price, created_at FROM orders WHERE id = ? AND user_id = ?",
+            (order_id, user_id),
+        ).fetchone()
+        if order is None:
+            return self._json(404, {"message": "Order not found"})
+        items = self.conn.execute(
+            "SELECT item_id, name, brand, price, quantity FROM order_items "
+            "WHERE order_id = ? ORDER BY id",
+            (order_id,),
+        ).fetchall()
+        return self._json(
+            200,
+            {
+                "order_id": order["id"],
+                "total_price": order["total_price"],
+                "created_at": order["created_at"],
+                "items": [dict(item) for item in items],
+            },
+        )
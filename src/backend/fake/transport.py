@@ -0,0 +1,41 @@
+import io
+from datetime import timedelta
+import time
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from http import HTTPStatus
+from src.backend.fake.shop import FakeShop
+
+
+class FakeShopAdapter(BaseAdapter):
+
+    def __init__(self, shop: FakeShop) -> None:
+        super().__init__()
+        self.shop = shop
+
+    def send(
+        self, request: requests.PreparedRequest, stream: bool = False, **kwargs
+    ) -> requests.Response:
+        started = time.perf_counter()
+        body = request.body
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        status, headers, content = self.shop.handle(
+            request.method, request.url, dict(request.headers), body
+        )
+        response = requests.Response()
+        response.status_code = status
+        response.reason = HTTPStatus(status).phrase
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.raw = io.BytesIO(content)
+        if not stream:
+            response._content = content
+        response.elapsed = timedelta(seconds=time.perf_counter() - started)
+        return response
+
+    def close(self) -> None:
+        pass
@@ -1,11 +1,15 @@
-from typing import Dict
+from typing import Dict, Optional
 import requests
 from src.backend.clients.http_client import HTTPClient
+from src.backend.services.auth.token_cache import TokenCache
 
 
 class AuthAdapter:
-    def __init__(self, client: HTTPClient) -> None:
+    def __init__(
+        self, client: HTTPClient, token_cache: Optional[TokenCache] = None
+    ) -> None:
         self.client = client
+        self.token_cache = token_cache or TokenCache()
 
     def register(self, data: Dict) -> requests.Response:
         return self.client.post("/auth/register", json=data)
@@ -18,3 +22,12 @@ class AuthAdapter:
 
     def login_user(self, username: str, password: str) -> requests.Response:
         return self.login({"username": username, "password": password})
+
+    def get_token(self, username: str, password: str) -> str:
+        def fetch() -> str:
+            token_data = self.login_user(username, password).json()
+            if "token" not in token_data:
+                raise ValueError("JWT токен не получен")
+            return token_data["token"]
+
+        return self.token_cache.get(self.client.base_url, username, fetch)
@@ -0,0 +1,19 @@
+from typing import Dict
+from src.backend.clients.async_http_client import AsyncHTTPClient, AsyncResponse
+
+
+class AsyncAuthAdapter:
+    def __init__(self, client: AsyncHTTPClient) -> None:
+        self.client = client
+
+    async def register(self, data: Dict) -> AsyncResponse:
+        return await self.client.post("/auth/register", json=data)
+
+    async def login(self, data: Dict) -> AsyncResponse:
+        return await self.client.post("/auth/login", json=data)
+
+    async def register_user(self, username: str, password: str) -> AsyncResponse:
+        return await self.register({"username": username, "password": password})
+
+    async def login_user(self, username: str, password: str) -> AsyncResponse:
+        return await self.login({"username": username, "password": password})
@@ -0,0 +1,134 @@
+import base64
+import json
+import os
+import threading
+import time
+from typing import Callable, Collection, Dict, List, Optional, Tuple
+
+TokenKey = Tuple[str, str]
+
+
+def jwt_expiry(token: str) -> Optional[float]:
+    parts = token.split(".")
+    if len(parts) != 3:
+        return None
+    payload = parts[1] + "=" * (-len(parts[1]) % 4)
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (ValueError, TypeError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenCache:
+
+    def __init__(
+        self,
+        refresh_margin: float = 60.0,
+        default_ttl: float = 3600.0,
+        path: Optional[str] = None,
+    ) -> None:
+        self._refresh_margin = refresh_margin
+        self._default_ttl = default_ttl
+        self._path = path
+        self._lock = threading.Lock()
+        self._key_locks: Dict[TokenKey, threading.Lock] = {}
+        self._entries: Dict[TokenKey, Dict[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self._load()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "cached_tokens": len(self._entries),
+            }
+
+    def get(self, base_url: str, username: str, fetch: Callable[[], str]) -> str:
+        key = (base_url, username)
+        with self._lock:
+            entry = self._entries.get(key)
+            if self._is_fresh(entry):
+                self.hits += 1
+                return entry["token"]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+                if self._is_fresh(entry):
+                    self.hits += 1
+                    return entry["token"]
+                self.misses += 1
+                if entry is not None:
+                    self.refreshes += 1
+            token = fetch()
+            expires_at = jwt_expiry(token) or time.time() + self._default_ttl
+            with self._lock:
+                self._entries[key] = {"token": token, "expires_at": expires_at}
+                self._save()
+            return token
+
+    def invalidate(self, base_url: str, username: str) -> None:
+        with self._lock:
+            if self._entries.pop((base_url, username), None) is not None:
+                self._save()
+
+    def usernames(self, base_url: str) -> List[str]:
+        with self._lock:
+            return [username for url, username in self._entries if url == base_url]
+
+    def retain_users(self, base_url: str, existing: Collection[str]) -> int:
+        with self._lock:
+            missing = [
+                key
+                for key in self._entries
+                if key[0] == base_url and key[1] not in existing
+            ]
+            for key in missing:
+                del self._entries[key]
+            if missing:
+                self._save()
+            return len(missing)
+
+    def _is_fresh(self, entry: Optional[Dict]) -> bool:
+        return (
+            entry is not None
+            and entry["expires_at"] - self._refresh_margin > time.time()
+        )
+
+    def _load(self) -> None:
+        if not self._path or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, encoding="utf-8") as cache_file:
+                entries = {
+                    (entry["base_url"], entry["username"]): {
+                        "token": entry["token"],
+                        "expires_at": entry["expires_at"],
+                    }
+                    for entry in json.load(cache_file)
+                }
+        except (OSError, ValueError, TypeError, KeyError):
+            return
+        self._entries = {
+            key: entry for key, entry in entries.items() if self._is_fresh(entry)
+        }
+
+    def _save(self) -> None:
+        if not self._path:
+            return
+        tmp_path = f"{self._path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(
+                [
+                    {"base_url": base_url, "username": username, **entry}
+                    for (base_url, username), entry in self._entries.items()
+                ],
+                cache_file,
+            )
+        os.replace(tmp_path, self._path)
@@ -1,23 +1,46 @@
-from typing import Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+import allure
+import json
 import requests
 from src.backend.clients.http_client import HTTPClient
+from src.backend.services.cart.models import CartBatchItemResult, CartBatchResult
+
+MAX_REPORTED_FAILURES = 20
+
+
+def _merge_items(items: Sequence[Dict[str, int]]) -> List[Dict[str, int]]:
+    merged: Dict[int, Dict[str, int]] = {}
+    for item in items:
+        current = merged.get(item["item_id"])
+        if current is None:
+            merged[item["item_id"]] = dict(item)
+        else:
+            current["quantity"] += item["quantity"]
+    return list(merged.values())
 
 
 class CartAdapter:
-    def __init__(self, client: HTTPClient) -> None:
+    def __init__(self, client: HTTPClient, max_concurrency: int = 8) -> None:
         self.client = client
+        self.max_concurrency = max_concurrency
 
     def get_cart(self, token: str) -> requests.Response:
         return self.client.get("/cart/", headers={"Authorization": token})
 
-    def add_to_cart(self, token: str, data: Dict) -> requests.Response:
+    def add_to_cart(
+        self, token: str, data: Dict, quiet: bool = False
+    ) -> requests.Response:
         return self.client.post(
-            "/cart/add", headers={"Authorization": token}, json=data
+            "/cart/add", headers={"Authorization": token}, json=data, quiet=quiet
         )
 
-    def remove_from_cart(self, token: str, data: Dict) -> requests.Response:
+    def remove_from_cart(
+        self, token: str, data: Dict, quiet: bool = False
+    ) -> requests.Response:
         return self.client.post(
-            "/cart/remove", headers={"Authorization": token}, json=data
+            "/cart/remove", headers={"Authorization": token}, json=data, quiet=quiet
         )
 
     def add_item(self, token: str, item_id: int, quantity: int) -> requests.Response:
@@ -25,3 +48,90 @@ class CartAdapter:
 
     def remove_item(self, token: str, item_id: int) -> requests.Response:
         return self.remove_from_cart(token, {"item_id": item_id})
+
+    def add_items(
+        self,
+        token: str,
+        items: Sequence[Dict[str, int]],
+        max_concurrency: Optional[int] = None,
+    ) -> CartBatchResult:
+        with allure.step(f"Добавление товаров в корзину: {len(items)}"):
+            return self._batch(
+                "add",
+                _merge_items(items),
+                lambda data: self.add_to_cart(token, data, quiet=True),
+                max_concurrency,
+            )
+
+    def remove_items(
+        self,
+        token: str,
+        item_ids: Sequence[int],
+        max_concurrency: Optional[int] = None,
+    ) -> CartBatchResult:
+        with allure.step(f"Удаление товаров из корзины: {len(item_ids)}"):
+            return self._batch(
+                "remove",
+                [{"item_id": item_id} for item_id in dict.fromkeys(item_ids)],
+                lambda data: self.remove_from_cart(token, data, quiet=True),
+                max_concurrency,
+            )
+
+    def _batch(
+        self,
+        operation: str,
+        payloads: List[Dict[str, int]],
+        send: Callable[[Dict[str, int]], requests.Response],
+        max_concurrency: Optional[int],
+    ) -> CartBatchResult:
+        concurrency = max(
+            1, min(max_concurrency or self.max_concurrency, len(payloads))
+        )
+        started = time.perf_counter()
+
+        def run(data: Dict[str, int]) -> CartBatchItemResult:
+            item_started = time.perf_counter()
+            result = CartBatchItemResult(
+                item_id=data["item_id"], quantity=data.get("quantity")
+            )
+            try:
+                response = send(data)
+            except requests.exceptions.RequestException as e:
+                result.error = f"{type(e).__name__}: {e}"
+            else:
+                result.status_code = response.status_code
+                try:
+                    result.message = response.json().get("message")
+                except (ValueError, AttributeError):
+                    result.message = response.text[:200]
+            result.elapsed_ms = round((time.perf_counter() - item_started) * 1000, 3)
+            return result
+
+        results = [run(payload) for payload in payloads[:1]]
+        if len(payloads) > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                results.extend(executor.map(run, payloads[1:]))
+        batch = CartBatchResult(
+            operation=operation,
+            concurrency=concurrency,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+            results=results,
+        )
+        summary = {
+            "operation": operation,
+            "requested": len(results),
+            "succeeded": len(batch.succeeded),
+            "failed": len(batch.failed),
+            "concurrency": concurrency,
+            "elapsed_ms": batch.elapsed_ms,
+            "failures": [
+                result.model_dump(exclude_none=True)
+                for result in batch.failed[:MAX_REPORTED_FAILURES]
+            ],
+        }
+        allure.attach(
+            json.dumps(summary, indent=2, ensure_ascii=False),
+            "Итоги пакетной операции с корзиной",
+            allure.attachment_type.JSON,
+        )
+        return batch
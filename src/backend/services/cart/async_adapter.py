@@ -0,0 +1,26 @@
+from typing import Dict
+from src.backend.clients.async_http_client import AsyncHTTPClient, AsyncResponse
+
+
+class AsyncCartAdapter:
+    def __init__(self, client: AsyncHTTPClient) -> None:
+        self.client = client
+
+    async def get_cart(self, token: str) -> AsyncResponse:
+        return await self.client.get("/cart/", headers={"Authorization": token})
+
+    async def add_to_cart(self, token: str, data: Dict) -> AsyncResponse:
+        return await self.client.post(
+            "/cart/add", headers={"Authorization": token}, json=data
+        )
+
+    async def remove_from_cart(self, token: str, data: Dict) -> AsyncResponse:
+        return await self.client.post(
+            "/cart/remove", headers={"Authorization": token}, json=data
+        )
+
+    async def add_item(self, token: str, item_id: int, quantity: int) -> AsyncResponse:
+        return await self.add_to_cart(token, {"item_id": item_id, "quantity": quantity})
+
+    async def remove_item(self, token: str, item_id: int) -> AsyncResponse:
+        return await self.remove_from_cart(token, {"item_id": item_id})
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -21,3 +21,35 @@ class AddToCartRequest(BaseModel):
 
 class RemoveFromCartRequest(BaseModel):
     item_id: int
+
+
+class CartBatchItemResult(BaseModel):
+    item_id: int
+    quantity: Optional[int] = None
+    status_code: Optional[int] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+
+class CartBatchResult(BaseModel):
+    operation: str
+    concurrency: int
+    elapsed_ms: float
+    results: List[CartBatchItemResult] = Field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[CartBatchItemResult]:
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[CartBatchItemResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
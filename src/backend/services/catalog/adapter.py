@@ -1,6 +1,31 @@
-from typing import Dict, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 import requests
 from src.backend.clients.http_client import HTTPClient
+from src.utils.streaming import iter_json_array
+
+
+def build_catalog_params(
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    brand: Optional[str] = None,
+) -> Dict[str, str]:
+    params: Dict[str, str] = {}
+    if min_price is not None:
+        params["min_price"] = str(min_price)
+    if max_price is not None:
+        params["max_price"] = str(max_price)
+    if brand is not None:
+        params["brand"] = brand
+    if sort_by is not None:
+        if sort_by == "price":
+            params["sort"] = "price_asc" if sort_order == "asc" else "price_desc"
+        elif sort_by == "name":
+            params["sort"] = "name_asc" if sort_order == "asc" else "name_desc"
+    return params
 
 
 class CatalogAdapter:
@@ -15,18 +40,111 @@ class CatalogAdapter:
         sort_by: Optional[str] = None,
         sort_order: Optional[str] = None,
         brand: Optional[str] = None,
+        if_none_match: Optional[str] = None,
     ) -> requests.Response:
-        params: Dict[str, str] = {}
-        if min_price is not None:
-            params["min_price"] = str(min_price)
-        if max_price is not None:
-            params["max_price"] = str(max_price)
-        if brand is not None:
-            params["brand"] = brand
-        if sort_by is not None:
-            if sort_by == "price":
-                params["sort"] = "price_asc" if sort_order == "asc" else "price_desc"
-            elif sort_by == "name":
-                params["sort"] = "name_asc" if sort_order == "asc" else "name_desc"
+        params = build_catalog_params(min_price, max_price, sort_by, sort_order, brand)
+        headers = {"Authorization": token} if token else {}
+        if if_none_match is not None:
+            headers["If-None-Match"] = if_none_match
+        return self.client.get(
+            "/catalog/", headers=headers or None, params=params or None
+        )
+
+    def iter_catalog(
+        self,
+        token: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        brand: Optional[str] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[dict]:
+        params = build_catalog_params(min_price, max_price, sort_by, sort_order, brand)
         headers = {"Authorization": token} if token else None
-        return self.client.get("/catalog/", headers=headers, params=params or None)
+        resp = self.client.get(
+            "/catalog/", headers=headers, params=params or None, stream=True
+        )
+        with resp:
+            if resp.status_code != 200:
+                raise ValueError(f"Ошибка получения каталога: {resp.status_code}")
+            yield from iter_json_array(resp.iter_content(chunk_size))
+
+    def iter_catalog_windows(
+        self,
+        token: Optional[str] = None,
+        window: int = 500,
+        min_price: int = 0,
+        max_price: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        brand: Optional[str] = None,
+        prefetch: int = 1,
+    ) -> Iterator[dict]:
+        if window < 1:
+            raise ValueError(f"Ширина ценового окна должна быть больше 0: {window}")
+        if sort_by not in (None, "price"):
+            raise ValueError(
+                "Окна каталога строятся по цене и дают общий порядок только "
+                f"для sort_by='price': {sort_by}"
+            )
+        if max_price is None:
+            top = next(
+                self.iter_catalog(
+                    token, min_price, None, "price", "desc", brand, chunk_size=4096
+                ),
+                None,
+            )
+            if top is None:
+                return
+            max_price = top["price"]
+        windows = [
+            (low, min(low + window - 1, max_price))
+            for low in range(min_price, max_price + 1, window)
+        ]
+        if sort_by == "price" and sort_order != "asc":
+            windows.reverse()
+        pending_windows = iter(windows)
+        in_flight: Deque[Future] = deque()
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 0) + 1)
+
+        def submit() -> None:
+            bounds = next(pending_windows, None)
+            if bounds is not None:
+                in_flight.append(
+                    executor.submit(
+                        self._fetch_window, token, bounds, sort_by, sort_order, brand
+                    )
+                )
+
+        try:
+            for _ in range(max(prefetch, 0) + 1):
+                submit()
+            while in_flight:
+                items = in_flight.popleft().result()
+                submit()
+                yield from items
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_window(
+        self,
+        token: Optional[str],
+        bounds: Tuple[int, int],
+        sort_by: Optional[str],
+        sort_order: Optional[str],
+        brand: Optional[str],
+    ) -> List[dict]:
+        params = build_catalog_params(*bounds, sort_by, sort_order, brand)
+        resp = self.client.get(
+            "/catalog/",
+            headers={"Authorization": token} if token else None,
+            params=params,
+            quiet=True,
+        )
+        if resp.status_code != 200:
+            raise ValueError(
+                f"Ошибка получения окна каталога {bounds[0]}-{bounds[1]}: "
+                f"{resp.status_code}"
+            )
+        return resp.json()
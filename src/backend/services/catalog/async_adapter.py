@@ -0,0 +1,23 @@
+from typing import Optional
+from src.backend.clients.async_http_client import AsyncHTTPClient, AsyncResponse
+from src.backend.services.catalog.adapter import build_catalog_params
+
+
+class AsyncCatalogAdapter:
+    def __init__(self, client: AsyncHTTPClient) -> None:
+        self.client = client
+
+    async def get_catalog(
+        self,
+        token: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_order: Optional[str] = None,
+        brand: Optional[str] = None,
+    ) -> AsyncResponse:
+        params = build_catalog_params(min_price, max_price, sort_by, sort_order, brand)
+        headers = {"Authorization": token} if token else None
+        return await self.client.get(
+            "/catalog/", headers=headers, params=params or None
+        )
@@ -1,8 +1,9 @@
 from typing import List
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 
 
-class CatalogItem(BaseModel):
+class CatalogItem(TypedDict):
     id: int
     name: str
     brand: str
@@ -0,0 +1,14 @@
+from src.backend.clients.async_http_client import AsyncHTTPClient, AsyncResponse
+
+
+class AsyncOrdersAdapter:
+    def __init__(self, http_client: AsyncHTTPClient) -> None:
+        self.http_client = http_client
+
+    async def create_order(self, token: str) -> AsyncResponse:
+        return await self.http_client.post("/orders/", headers={"Authorization": token})
+
+    async def get_order_details(self, token: str, order_id: int) -> AsyncResponse:
+        return await self.http_client.get(
+            f"/orders/{order_id}", headers={"Authorization": token}
+        )
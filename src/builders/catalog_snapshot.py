@@ -0,0 +1,137 @@
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+import allure
+import json
+from src.backend.services.catalog.adapter import CatalogAdapter
+
+
+class CatalogSnapshot:
+
+    def __init__(
+        self,
+        catalog_adapter: CatalogAdapter,
+        token: str,
+        ttl: float = 300.0,
+        price_band: int = 100,
+        token_provider: Optional[Callable[[], str]] = None,
+    ) -> None:
+        self.catalog_adapter = catalog_adapter
+        self.token = token
+        self.token_provider = token_provider
+        self._ttl = ttl
+        self._price_band = price_band
+        self._lock = threading.Lock()
+        self._items: List[dict] = []
+        self._by_id: Dict[int, dict] = {}
+        self._by_brand: Dict[str, List[dict]] = {}
+        self._by_band: Dict[int, List[dict]] = {}
+        self._etag: Optional[str] = None
+        self._fetched_at: Optional[float] = None
+        self.refreshes = 0
+        self.revalidations = 0
+
+    @property
+    def items(self) -> List[dict]:
+        self._ensure_fresh()
+        return self._items
+
+    def refresh(self, force: bool = False) -> None:
+        with self._lock:
+            if not force and self._is_fresh():
+                return
+            with allure.step("Обновление снимка каталога"):
+                if self.token_provider is not None:
+                    self.token = self.token_provider()
+                resp = self.catalog_adapter.get_catalog(
+                    self.token,
+                    if_none_match=None if force else self._etag,
+                )
+                if resp.status_code == 304 and self._fetched_at is not None:
+                    self._fetched_at = time.monotonic()
+                    self.revalidations += 1
+                    allure.attach(
+                        "Каталог не изменился (304 Not Modified)",
+                        "Ревалидация снимка",
+                        allure.attachment_type.TEXT,
+                    )
+                    return
+                if resp.status_code != 200:
+                    error_msg = f"Ошибка получения каталога: {resp.status_code}"
+                    allure.attach(error_msg, "Ошибка", allure.attachment_type.TEXT)
+                    raise ValueError(error_msg)
+                self._index(resp.json())
+                self._etag = resp.headers.get("ETag")
+                self._fetched_at = time.monotonic()
+                self.refreshes += 1
+                allure.attach(
+                    json.dumps(
+                        {
+                            "items": len(self._items),
+                            "brands": len(self._by_brand),
+                            "price_bands": len(self._by_band),
+                            "etag": self._etag,
+                        },
+                        indent=2,
+                    ),
+                    "Информация о снимке каталога",
+                    allure.attachment_type.JSON,
+                )
+
+    def by_id(self, item_id: int) -> Optional[dict]:
+        self._ensure_fresh()
+        return self._by_id.get(item_id)
+
+    def by_brand(self, brand: str) -> List[dict]:
+        self._ensure_fresh()
+        return self._by_brand.get(brand, [])
+
+    def by_price(self, min_price: int, max_price: int) -> List[dict]:
+        self._ensure_fresh()
+        found = []
+        for band in range(
+            min_price // self._price_band, max_price // self._price_band + 1
+        ):
+            found.extend(
+                item
+                for item in self._by_band.get(band, [])
+                if min_price <= item["price"] <= max_price
+            )
+        return found
+
+    def random_item(self, rng: Optional[random.Random] = None) -> dict:
+        items = self.items
+        if not items:
+            raise ValueError("Каталог пуст - нет товаров для тестирования")
+        return (rng or random).choice(items)
+
+    def sample(self, k: int, rng: Optional[random.Random] = None) -> List[dict]:
+        items = self.items
+        if k > len(items):
+            raise ValueError(
+                f"В каталоге {len(items)} товаров, запрошено {k} различных"
+            )
+        return (rng or random).sample(items, k)
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._fetched_at is not None
+            and time.monotonic() - self._fetched_at < self._ttl
+        )
+
+    def _ensure_fresh(self) -> None:
+        if not self._is_fresh():
+            self.refresh()
+
+    def _index(self, items: List[dict]) -> None:
+        by_brand = defaultdict(list)
+        by_band = defaultdict(list)
+        for item in items:
+            by_brand[item.get("brand")].append(item)
+            by_band[int(item["price"] // self._price_band)].append(item)
+        self._items = items
+        self._by_id = {item["id"]: item for item in items}
+        self._by_brand = dict(by_brand)
+        self._by_band = dict(by_band)
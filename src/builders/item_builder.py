@@ -1,20 +1,31 @@
 import random
-from typing import Dict
+from typing import Dict, List, Optional
 import allure
 import json
 from src.backend.services.catalog.adapter import CatalogAdapter
+from src.builders.catalog_snapshot import CatalogSnapshot
+from src.utils.streaming import reservoir_sample
 
 
 class ItemBuilder:
 
-    def __init__(self, catalog_adapter: CatalogAdapter, token: str) -> None:
+    def __init__(
+        self,
+        catalog_adapter: CatalogAdapter,
+        token: str,
+        snapshot: Optional[CatalogSnapshot] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
         self.catalog_adapter = catalog_adapter
         self.token = token
+        self.snapshot = snapshot
+        self.rng = rng if rng is not None else random.Random()
         with allure.step("Инициализация ItemBuilder"):
             initialization_details = {
                 "catalog_adapter": str(catalog_adapter),
                 "token_type": "JWT",
                 "token_length": len(token),
+                "uses_snapshot": snapshot is not None,
             }
             allure.attach(
                 json.dumps(initialization_details, indent=2),
@@ -28,68 +39,31 @@ class ItemBuilder:
             )
 
     def build(self) -> Dict[str, int]:
+        if self.snapshot is not None:
+            return self.build_many(1)[0]
         with allure.step("Получение случайного товара из каталога"):
-            with allure.step("Запрос каталога товаров"):
+            with allure.step("Потоковое чтение каталога и выбор случайного товара"):
                 try:
-                    resp = self.catalog_adapter.get_catalog(self.token)
-                    allure.attach(
-                        str(resp.status_code),
-                        "HTTP статус ответа каталога",
-                        allure.attachment_type.TEXT,
+                    selected = reservoir_sample(
+                        self.catalog_adapter.iter_catalog(self.token), 1, self.rng
                     )
-                    if resp.status_code != 200:
-                        error_msg = f"Ошибка получения каталога: {resp.status_code}"
-                        allure.attach(error_msg, "Ошибка", allure.attachment_type.TEXT)
-                        raise ValueError(error_msg)
                 except Exception as e:
                     error_details = {
                         "error_type": type(e).__name__,
                         "error_message": str(e),
-                        "operation": "get_catalog",
+                        "operation": "iter_catalog",
                     }
                     allure.attach(
                         json.dumps(error_details, indent=2),
-                        "Ошибка запроса каталога",
+                        "Ошибка чтения каталога",
                         allure.attachment_type.JSON,
                     )
                     raise
-            with allure.step("Парсинг ответа каталога"):
-                try:
-                    items = resp.json()
-                    allure.attach(
-                        json.dumps(items, indent=2),
-                        "Полученный каталог товаров",
-                        allure.attachment_type.JSON,
-                    )
-                    allure.attach(
-                        str(len(items)),
-                        "Количество товаров в каталоге",
-                        allure.attachment_type.TEXT,
-                    )
-                except (ValueError, json.JSONDecodeError) as e:
-                    error_details = {
-                        "error_type": "JSONDecodeError",
-                        "error_message": str(e),
-                        "response_text": resp.text[:500],
-                    }
-                    allure.attach(
-                        json.dumps(error_details, indent=2),
-                        "Ошибка парсинга JSON",
-                        allure.attachment_type.JSON,
-                    )
-                    raise ValueError(f"Не удалось распарсить ответ каталога: {e}")
-            with allure.step("Проверка наличия товаров"):
-                if not items:
+                if not selected:
                     error_msg = "Каталог пуст - нет товаров для тестирования"
                     allure.attach(error_msg, "Ошибка", allure.attachment_type.TEXT)
                     raise ValueError(error_msg)
-                allure.attach(
-                    f"В каталоге найдено {len(items)} товаров",
-                    "Результат проверки",
-                    allure.attachment_type.TEXT,
-                )
-            with allure.step("Выбор случайного товара"):
-                selected_item = random.choice(items)
+                selected_item = selected[0]
                 allure.attach(
                     json.dumps(selected_item, indent=2),
                     "Выбранный товар",
@@ -101,7 +75,7 @@ class ItemBuilder:
                     allure.attachment_type.TEXT,
                 )
             with allure.step("Генерация количества товара"):
-                quantity = random.randint(1, 5)
+                quantity = self.rng.randint(1, 5)
                 allure.attach(
                     str(quantity),
                     "Сгенерированное количество",
@@ -143,3 +117,20 @@ class ItemBuilder:
                     allure.attachment_type.TEXT,
                 )
             return item_data
+
+    def build_many(self, count: int) -> List[Dict[str, int]]:
+        with allure.step(f"Выбор товаров из снимка каталога: {count}"):
+            snapshot = self.snapshot or CatalogSnapshot(
+                self.catalog_adapter, self.token
+            )
+            selected_items = snapshot.sample(count, self.rng)
+            items_data = [
+                {"item_id": item["id"], "quantity": self.rng.randint(1, 5)}
+                for item in selected_items
+            ]
+            allure.attach(
+                json.dumps(items_data, indent=2),
+                "Итоговые данные товаров",
+                allure.attachment_type.JSON,
+            )
+            return items_data
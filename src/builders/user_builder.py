@@ -1,13 +1,28 @@
+import itertools
 import random
 import string
-from typing import Dict
+from typing import Dict, List, Optional
 import allure
 import json
+from src.utils.workers import base36, worker_namespace
+
+ALPHANUMERIC = string.ascii_letters + string.digits
+SPECIAL_CHARS = "!@#$%^&*"
 
 
 class UserBuilder:
 
-    def __init__(self):
+    def __init__(
+        self,
+        namespace: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+        seed: Optional[int] = None,
+        tag: Optional[str] = None,
+    ):
+        self.namespace = worker_namespace() if namespace is None else namespace
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.tag = base36(self.rng.getrandbits(32) % 36**6, 6) if tag is None else tag
+        self._counter = itertools.count()
         with allure.step("Инициализация UserBuilder"):
             allure.attach(
                 "UserBuilder готов к генерации тестовых данных пользователей",
@@ -67,13 +82,34 @@ class UserBuilder:
                 )
             return user_data
 
+    def build_many(self, count: int) -> List[Dict[str, str]]:
+        return [
+            {"username": self._next_username(), "password": self._next_password()}
+            for _ in range(count)
+        ]
+
+    def _next_username(self) -> str:
+        return self.namespace + self.tag + base36(next(self._counter), 4)
+
+    def _next_password(self) -> str:
+        return "".join(self._password_components().values())
+
+    def _password_components(self) -> Dict[str, str]:
+        return {
+            "uppercase": self.rng.choice(string.ascii_uppercase),
+            "lowercase": self.rng.choice(string.ascii_lowercase),
+            "random_chars": "".join(self.rng.choices(ALPHANUMERIC, k=5)),
+            "special_char": self.rng.choice(SPECIAL_CHARS),
+        }
+
     def _generate_username(self) -> str:
-        username = "".join(random.choices(string.ascii_letters + string.digits, k=8))
+        username = self._next_username()
         with allure.step(f"Генерация username: {username}"):
             generation_details = {
-                "method": "random.choices",
-                "characters": "ascii_letters + digits",
-                "length": 8,
+                "method": "namespace + tag + counter",
+                "namespace": self.namespace,
+                "tag": self.tag,
+                "length": len(username),
                 "result": username,
             }
             allure.attach(
@@ -84,22 +120,12 @@ class UserBuilder:
         return username
 
     def _generate_password(self) -> str:
-        uppercase = random.choice(string.ascii_uppercase)
-        lowercase = random.choice(string.ascii_lowercase)
-        random_chars = "".join(
-            random.choices(string.ascii_letters + string.digits, k=5)
-        )
-        special_char = random.choice("!@#$%^&*")
-        password = uppercase + lowercase + random_chars + special_char
+        components = self._password_components()
+        password = "".join(components.values())
         with allure.step(f"Генерация password: {password}"):
             generation_details = {
                 "method": "component_based",
-                "components": {
-                    "uppercase": uppercase,
-                    "lowercase": lowercase,
-                    "random_chars": random_chars,
-                    "special_char": special_char,
-                },
+                "components": components,
                 "total_length": len(password),
                 "result": password,
             }
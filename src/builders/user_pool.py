@@ -0,0 +1,114 @@
+import math
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional
+import allure
+import json
+from src.backend.clients.db_client import DbClient
+from src.backend.services.auth.adapter import AuthAdapter
+from src.builders.user_builder import UserBuilder
+from src.utils.cleanup import CleanupRegistry
+from src.utils.workers import worker_count, worker_id
+
+
+class UserPool:
+
+    def __init__(
+        self,
+        auth_adapter: AuthAdapter,
+        db_client: DbClient,
+        cleanup_registry: Optional[CleanupRegistry] = None,
+        size: int = 10,
+        refill_batch: int = 5,
+        provision_workers: int = 8,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self._auth = auth_adapter
+        self._db = db_client
+        self._cleanup = cleanup_registry
+        self._size = max(1, math.ceil(size / worker_count()))
+        self._refill_batch = max(1, refill_batch)
+        self._provision_workers = provision_workers
+        self._builder = UserBuilder(rng=rng)
+        self._lock = threading.Lock()
+        self._idle: Deque[Dict[str, str]] = deque()
+        self._dirty: List[Dict[str, str]] = []
+        self._provisioned = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "worker": worker_id(),
+                "size": self._size,
+                "provisioned": self._provisioned,
+                "idle": len(self._idle),
+                "dirty": len(self._dirty),
+            }
+
+    def fill(self) -> None:
+        with self._lock:
+            missing = self._size - self._provisioned
+            if missing > 0:
+                self._idle.extend(self._provision(missing))
+
+    def checkout(self) -> Dict[str, str]:
+        with self._lock:
+            if not self._idle and self._dirty:
+                self._reset_dirty()
+            if not self._idle:
+                self._idle.extend(self._provision(self._refill_batch))
+            user = self._idle.popleft()
+        token = self._auth.get_token(user["username"], user["password"])
+        return {**user, "token": f"Bearer {token}"}
+
+    def checkin(self, user: Dict[str, str], dirty: bool = True) -> None:
+        with self._lock:
+            if dirty:
+                self._dirty.append(user)
+            else:
+                self._idle.append(user)
+
+    def close(self) -> None:
+        with allure.step("Закрытие пула пользователей"):
+            allure.attach(
+                json.dumps(self.stats, indent=2),
+                "Статистика пула пользователей",
+                allure.attachment_type.JSON,
+            )
+
+    def _reset_dirty(self) -> None:
+        dirty, self._dirty = self._dirty, []
+        with allure.step(f"Сброс корзин пользователей пула: {len(dirty)}"):
+            self._db.delete_carts([user["username"] for user in dirty])
+        self._idle.extend(dirty)
+
+    def _provision(self, count: int) -> List[Dict[str, str]]:
+        with allure.step(f"Создание пользователей пула: {count}"):
+            users_data = self._builder.build_many(count)
+            if self._cleanup is not None:
+                for user_data in users_data:
+                    self._cleanup.register_session_user(user_data["username"])
+            with ThreadPoolExecutor(
+                max_workers=min(self._provision_workers, count)
+            ) as executor:
+                users = list(executor.map(self._provision_one, users_data))
+            self._provisioned += len(users)
+            return users
+
+    def _provision_one(self, user_data: Dict[str, str]) -> Dict[str, str]:
+        resp = self._auth.register(user_data)
+        if not resp.ok:
+            error_msg = (
+                f"Не удалось зарегистрировать пользователя пула "
+                f"{user_data['username']}: {resp.status_code} {resp.text}"
+            )
+            allure.attach(error_msg, "Ошибка", allure.attachment_type.TEXT)
+            raise ValueError(error_msg)
+        self._auth.get_token(user_data["username"], user_data["password"])
+        return {
+            "username": user_data["username"],
+            "password": user_data["password"],
+        }
@@ -0,0 +1,131 @@
+import argparse
+import json
+import sys
+from typing import Dict, List, Optional
+from config import BASE_URL, CLEANUP_CONFIG, DB_CONFIG
+from src.backend.clients.db_client import DbClient
+from src.backend.clients.http_client import HTTPClient
+from src.load.runner import LoadRunner, check_slo
+from src.utils.cleanup import CleanupRegistry
+
+
+def parse_slo(values: List[str]) -> Dict[str, float]:
+    slo = {}
+    for value in values:
+        percentile, _, limit = value.partition("=")
+        try:
+            if not percentile.startswith("p"):
+                raise ValueError(percentile)
+            percent = float(percentile[1:])
+            limit_ms = float(limit)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Неверный формат SLO: {value}")
+        if not 0 < percent <= 100:
+            raise argparse.ArgumentTypeError(
+                f"Перцентиль SLO должен быть в диапазоне (0, 100]: {value}"
+            )
+        slo[f"p{percent:g}"] = limit_ms
+    return slo
+
+
+def print_report(report: Dict) -> None:
+    header = f"{'endpoint':<26}{'count':>8}{'err%':>8}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = {**report["endpoints"], "TOTAL": report["total"]}
+    for endpoint, summary in rows.items():
+        print(
+            f"{endpoint:<26}{summary['count']:>8}"
+            f"{summary['error_rate'] * 100:>7.2f}%"
+            f"{summary['throughput_rps']:>9.2f}"
+            f"{summary['p50_ms']:>9.1f}{summary['p95_ms']:>9.1f}{summary['p99_ms']:>9.1f}"
+        )
+    journeys = report["journeys"]
+    print(
+        f"\nСценариев: {journeys['started']}, неуспешных: {journeys['failed']}, "
+        f"пропущено (нет свободных воркеров): {journeys['dropped']}, "
+        f"длительность: {report['duration_s']} с"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.load",
+        description="Нагрузочный прогон пользовательских сценариев магазина",
+    )
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--rate", type=float, default=1.0, help="Сценариев в секунду")
+    parser.add_argument("--duration", type=float, default=60.0, help="Секунд")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Секунд")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Секунд")
+    parser.add_argument("--workers", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--slo",
+        action="append",
+        default=[],
+        help="Порог задержки, например p95=500 (мс); можно указать несколько раз",
+    )
+    parser.add_argument("--max-error-rate", type=float, default=None)
+    parser.add_argument("--report", default=None, help="Путь для JSON отчёта")
+    parser.add_argument(
+        "--keep-users",
+        action="store_true",
+        help="Не удалять из БД пользователей, зарегистрированных сценариями",
+    )
+    args = parser.parse_args(argv)
+    try:
+        slo = parse_slo(args.slo)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    percents = sorted({50.0, 95.0, 99.0} | {float(key[1:]) for key in slo})
+
+    db_client = None
+    cleanup_registry = None
+    if not args.keep_users:
+        db_client = DbClient(
+            {**DB_CONFIG, "application_name": "autotests-load"}, minconn=0, maxconn=1
+        )
+        cleanup_registry = CleanupRegistry(
+            db_client, flush_threshold=CLEANUP_CONFIG["flush_threshold"]
+        )
+    try:
+        with HTTPClient(
+            args.base_url,
+            pool_maxsize=args.workers,
+            reporting_level="off",
+        ) as client:
+            stats = LoadRunner(
+                client,
+                arrival_rate=args.rate,
+                duration=args.duration,
+                ramp_up=args.ramp_up,
+                think_time=args.think_time,
+                max_workers=args.workers,
+                seed=args.seed,
+                cleanup_registry=cleanup_registry,
+            ).run()
+    finally:
+        if cleanup_registry is not None:
+            try:
+                cleanup_registry.close()
+            finally:
+                db_client.close()
+
+    report = stats.report(percents)
+    violations = check_slo(report, slo, args.max_error_rate)
+    report["slo_violations"] = violations
+    print_report(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as report_file:
+            json.dump(report, report_file, indent=2, ensure_ascii=False)
+    if violations:
+        print("\nНарушения SLO:")
+        for violation in violations:
+            print(f"  - {violation}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
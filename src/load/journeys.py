@@ -0,0 +1,98 @@
+import random
+import time
+from typing import Any, Callable, Optional
+from src.backend.clients.http_client import HTTPClient
+from src.backend.services.auth.adapter import AuthAdapter
+from src.backend.services.cart.adapter import CartAdapter
+from src.backend.services.catalog.adapter import CatalogAdapter
+from src.backend.services.orders.adapter import OrdersAdapter
+from src.builders.user_builder import UserBuilder
+from src.load.stats import LoadStats
+
+
+class JourneyError(Exception):
+    pass
+
+
+class ShopperJourney:
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        stats: LoadStats,
+        think_time: float = 0.0,
+        max_cart_items: int = 3,
+        rng: random.Random = None,
+        on_register: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.auth = AuthAdapter(http_client)
+        self.catalog = CatalogAdapter(http_client)
+        self.cart = CartAdapter(http_client)
+        self.orders = OrdersAdapter(http_client)
+        self.stats = stats
+        self.think_time = think_time
+        self.max_cart_items = max_cart_items
+        self.rng = rng or random.Random()
+        self.users = UserBuilder(rng=self.rng)
+        self.on_register = on_register
+
+    def run(self) -> None:
+        user_data = self.users.build_many(1)[0]
+        if self.on_register is not None:
+            self.on_register(user_data["username"])
+        self._call("POST /auth/register", lambda: self.auth.register(user_data))
+        login_resp = self._call("POST /auth/login", lambda: self.auth.login(user_data))
+        token = f"Bearer {login_resp.json()['token']}"
+        self._think()
+
+        items = self._call(
+            "GET /catalog/", lambda: self.catalog.get_catalog(token)
+        ).json()
+        if not items:
+            raise JourneyError("Каталог пуст")
+        self._think()
+
+        prices = sorted(item["price"] for item in items)
+        low = prices[len(prices) // 4]
+        high = prices[len(prices) * 3 // 4]
+        self._call(
+            "GET /catalog/ [filter]",
+            lambda: self.catalog.get_catalog(
+                token, min_price=low, max_price=high, sort_by="price", sort_order="asc"
+            ),
+        )
+        self._think()
+
+        count = self.rng.randint(1, min(self.max_cart_items, len(items)))
+        for item in self.rng.sample(items, count):
+            self._call(
+                "POST /cart/add",
+                lambda: self.cart.add_item(token, item["id"], self.rng.randint(1, 5)),
+            )
+            self._think()
+
+        order_id = self._call(
+            "POST /orders/", lambda: self.orders.create_order(token)
+        ).json()["order_id"]
+        self._think()
+
+        self._call(
+            "GET /orders/<id>", lambda: self.orders.get_order_details(token, order_id)
+        )
+
+    def _call(self, endpoint: str, request: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        try:
+            response = request()
+        except Exception as e:
+            self.stats.record(endpoint, (time.perf_counter() - started) * 1000, True)
+            raise JourneyError(f"{endpoint}: {type(e).__name__}: {e}") from e
+        failed = response.status_code >= 400
+        self.stats.record(endpoint, (time.perf_counter() - started) * 1000, failed)
+        if failed:
+            raise JourneyError(f"{endpoint}: HTTP {response.status_code}")
+        return response
+
+    def _think(self) -> None:
+        if self.think_time > 0:
+            time.sleep(self.rng.uniform(0.5, 1.5) * self.think_time)
@@ -0,0 +1,106 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from src.backend.clients.http_client import HTTPClient
+from src.load.journeys import ShopperJourney
+from src.load.stats import LoadStats
+from src.utils.cleanup import CleanupRegistry
+
+
+class LoadRunner:
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        arrival_rate: float,
+        duration: float,
+        ramp_up: float = 0.0,
+        think_time: float = 0.0,
+        max_workers: int = 50,
+        seed: Optional[int] = None,
+        cleanup_registry: Optional[CleanupRegistry] = None,
+    ) -> None:
+        self.http_client = http_client
+        self.arrival_rate = arrival_rate
+        self.duration = duration
+        self.ramp_up = ramp_up
+        self.think_time = think_time
+        self.max_workers = max_workers
+        self.cleanup_registry = cleanup_registry
+        self.stats = LoadStats()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers)
+
+    def current_rate(self, elapsed: float) -> float:
+        if self.ramp_up > 0 and elapsed < self.ramp_up:
+            return self.arrival_rate * elapsed / self.ramp_up
+        return self.arrival_rate
+
+    def run(self) -> LoadStats:
+        self.stats.started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            accumulated = 0.0
+            threshold = self._rng.expovariate(1.0)
+            previous = 0.0
+            while True:
+                elapsed = time.monotonic() - self.stats.started_at
+                if elapsed >= self.duration:
+                    break
+                accumulated += self.current_rate(elapsed) * (elapsed - previous)
+                previous = elapsed
+                while accumulated >= threshold:
+                    accumulated -= threshold
+                    with self._rng_lock:
+                        threshold = self._rng.expovariate(1.0)
+                    if not self._slots.acquire(blocking=False):
+                        self.stats.journey_dropped()
+                        continue
+                    executor.submit(self._run_journey)
+                time.sleep(0.005)
+        self.stats.finish()
+        if self.cleanup_registry is not None:
+            self.cleanup_registry.flush()
+        return self.stats
+
+    def _run_journey(self) -> None:
+        try:
+            with self._rng_lock:
+                seed = self._rng.getrandbits(64)
+            self.stats.journey_started()
+            ShopperJourney(
+                self.http_client,
+                self.stats,
+                think_time=self.think_time,
+                rng=random.Random(seed),
+                on_register=(
+                    self.cleanup_registry.register_user
+                    if self.cleanup_registry is not None
+                    else None
+                ),
+            ).run()
+        except Exception:
+            self.stats.journey_failed()
+        finally:
+            self._slots.release()
+
+
+def check_slo(
+    report: Dict, latency_slo: Dict[str, float], max_error_rate: Optional[float]
+) -> List[str]:
+    violations = []
+    scopes = {"total": report["total"], **report["endpoints"]}
+    for scope, summary in scopes.items():
+        for percentile, limit_ms in latency_slo.items():
+            actual = summary[f"{percentile}_ms"]
+            if actual > limit_ms:
+                violations.append(
+                    f"{scope}: {percentile} = {actual} мс > {limit_ms} мс"
+                )
+        if max_error_rate is not None and summary["error_rate"] > max_error_rate:
+            violations.append(
+                f"{scope}: error_rate = {summary['error_rate']} > {max_error_rate}"
+            )
+    return violations
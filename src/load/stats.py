@@ -0,0 +1,82 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from src.utils.histogram import Histogram
+
+
+class LoadStats:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: Dict[str, Histogram] = {}
+        self._errors: Dict[str, int] = {}
+        self.journeys_started = 0
+        self.journeys_failed = 0
+        self.journeys_dropped = 0
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def record(self, endpoint: str, elapsed_ms: float, failed: bool) -> None:
+        with self._lock:
+            if self.finished_at is not None:
+                return
+            histogram = self._latency.get(endpoint)
+            if histogram is None:
+                histogram = self._latency[endpoint] = Histogram()
+                self._errors[endpoint] = 0
+            if failed:
+                self._errors[endpoint] += 1
+        histogram.record(elapsed_ms)
+
+    def journey_started(self) -> None:
+        with self._lock:
+            self.journeys_started += 1
+
+    def journey_failed(self) -> None:
+        with self._lock:
+            if self.finished_at is None:
+                self.journeys_failed += 1
+
+    def journey_dropped(self) -> None:
+        with self._lock:
+            self.journeys_dropped += 1
+
+    def finish(self) -> None:
+        with self._lock:
+            self.finished_at = time.monotonic()
+
+    def report(self, percents: Iterable[float] = (50, 95, 99)) -> Dict:
+        duration = (self.finished_at or time.monotonic()) - (
+            self.started_at or time.monotonic()
+        )
+        duration = max(duration, 1e-9)
+        endpoints = {}
+        total = Histogram()
+        total_errors = 0
+        for endpoint, histogram in sorted(self._latency.items()):
+            errors = self._errors[endpoint]
+            total.merge(histogram)
+            total_errors += errors
+            endpoints[endpoint] = {
+                **histogram.summary(percents),
+                "errors": errors,
+                "error_rate": round(errors / histogram.count, 4),
+                "throughput_rps": round(histogram.count / duration, 2),
+            }
+        return {
+            "duration_s": round(duration, 2),
+            "journeys": {
+                "started": self.journeys_started,
+                "failed": self.journeys_failed,
+                "dropped": self.journeys_dropped,
+            },
+            "total": {
+                **total.summary(percents),
+                "errors": total_errors,
+                "error_rate": (
+                    round(total_errors / total.count, 4) if total.count else 0.0
+                ),
+                "throughput_rps": round(total.count / duration, 2),
+            },
+            "endpoints": endpoints,
+        }
@@ -0,0 +1,157 @@
+import hashlib
+import json
+import os
+import queue
+import shutil
+import tarfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from attr import asdict
+from allure_commons import hookimpl, plugin_manager
+from allure_commons.logger import AllureFileLogger
+
+_STOP = object()
+
+
+def _executables(item: Any) -> Iterable[Any]:
+    stack = [item, *getattr(item, "befores", []), *getattr(item, "afters", [])]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(getattr(current, "steps", None) or [])
+
+
+class BufferedAllureFileLogger:
+
+    def __init__(
+        self,
+        report_dir: str,
+        dedup: bool = True,
+        queue_size: int = 10000,
+    ) -> None:
+        self._report_dir = Path(report_dir).absolute()
+        self._report_dir.mkdir(parents=True, exist_ok=True)
+        self._dedup = dedup
+        self._lock = threading.Lock()
+        self._sources: Dict[str, str] = {}
+        self._aliases: Dict[str, str] = {}
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self.errors: List[str] = []
+        self.stats = {
+            "results": 0,
+            "attachments": 0,
+            "deduplicated": 0,
+            "deduplicated_bytes": 0,
+        }
+        self._writer = threading.Thread(
+            target=self._write_loop, name="allure-results-writer", daemon=True
+        )
+        self._writer.start()
+
+    @hookimpl
+    def report_result(self, result: Any) -> None:
+        self._enqueue_item(result)
+
+    @hookimpl
+    def report_container(self, container: Any) -> None:
+        self._enqueue_item(container)
+
+    @hookimpl
+    def report_attached_file(self, source: str, file_name: str) -> None:
+        with self._lock:
+            self.stats["attachments"] += 1
+        self._queue.put((file_name, lambda path: shutil.copy2(source, path)))
+
+    @hookimpl
+    def report_attached_data(self, body: Any, file_name: str) -> None:
+        data = body.encode("utf-8") if isinstance(body, str) else body
+        digest = None
+        if self._dedup:
+            digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+            digest += os.path.splitext(file_name)[1]
+        with self._lock:
+            self.stats["attachments"] += 1
+            if digest is not None:
+                source = self._sources.setdefault(digest, file_name)
+                if source != file_name:
+                    self._aliases[file_name] = source
+                    self.stats["deduplicated"] += 1
+                    self.stats["deduplicated_bytes"] += len(data)
+                    return
+        self._queue.put((file_name, data))
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(_STOP)
+        self._writer.join()
+
+    def _enqueue_item(self, item: Any) -> None:
+        with self._lock:
+            self.stats["results"] += 1
+            if self._aliases:
+                for executable in _executables(item):
+                    for attachment in getattr(executable, "attachments", None) or []:
+                        attachment.source = self._aliases.pop(
+                            attachment.source, attachment.source
+                        )
+        self._queue.put((item.file_pattern.format(prefix=uuid.uuid4()), item))
+
+    def _write_loop(self) -> None:
+        while True:
+            task = self._queue.get()
+            try:
+                if task is _STOP:
+                    return
+                self._write(*task)
+            except Exception as e:
+                self.errors.append(f"{task[0]}: {type(e).__name__}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, file_name: str, payload: Any) -> None:
+        path = self._report_dir / file_name
+        if callable(payload):
+            payload(path)
+            return
+        if not isinstance(payload, bytes):
+            payload = json.dumps(
+                asdict(payload, filter=lambda _, value: value or value is False),
+                ensure_ascii=False,
+            ).encode("utf-8")
+        with open(path, "wb") as result_file:
+            result_file.write(payload)
+
+
+def archive_results(report_dir: str) -> str:
+    archive_path = f"{os.path.abspath(report_dir).rstrip(os.sep)}.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        archive.add(report_dir, arcname=os.path.basename(os.path.abspath(report_dir)))
+    return archive_path
+
+
+def install_buffered_logger(
+    **options: Any,
+) -> Optional[Tuple[BufferedAllureFileLogger, Callable[[], None]]]:
+    originals = [
+        plugin
+        for plugin in plugin_manager.get_plugins()
+        if isinstance(plugin, AllureFileLogger)
+    ]
+    if not originals:
+        return None
+    original = originals[0]
+    name = plugin_manager.get_name(original)
+    plugin_manager.unregister(original)
+    buffered = BufferedAllureFileLogger(str(original._report_dir), **options)
+    plugin_manager.register(buffered)
+
+    def restore() -> None:
+        buffered.close()
+        plugin_manager.unregister(buffered)
+        plugin_manager.register(original, name)
+
+    return buffered, restore
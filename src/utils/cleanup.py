@@ -0,0 +1,157 @@
+import atexit
+import logging
+import os
+import threading
+from typing import Optional, Set
+import allure
+import json
+from src.backend.clients.db_client import DbClient
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupRegistry:
+
+    def __init__(
+        self,
+        db_client: DbClient,
+        flush_threshold: int = 200,
+        journal_path: Optional[str] = None,
+    ) -> None:
+        self._db = db_client
+        self._flush_threshold = flush_threshold
+        self._journal_path = journal_path
+        self._lock = threading.Lock()
+        self._users: Set[str] = set()
+        self._carts: Set[str] = set()
+        self._session_users: Set[str] = set()
+        self._closed = False
+        self._recover_journal()
+        atexit.register(self._flush_at_exit)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._users) + len(self._carts) + len(self._session_users)
+
+    def register_user(self, username: str) -> None:
+        self._register(self._users, "user", username)
+
+    def register_cart(self, username: str) -> None:
+        self._register(self._carts, "cart", username)
+
+    def register_session_user(self, username: str) -> None:
+        self._register(self._session_users, "session_user", username)
+
+    def _register(self, bucket: Set[str], kind: str, username: str) -> None:
+        with self._lock:
+            if username in bucket:
+                return
+            bucket.add(username)
+            self._journal_append(kind, username)
+
+    def flush_if_due(self) -> None:
+        with self._lock:
+            due = (
+                len(self._users) + len(self._carts) >= self._flush_threshold
+                and not self._db.in_isolation
+            )
+        if not due:
+            return
+        try:
+            self.flush()
+        except Exception:
+            return
+
+    def flush(self, include_session: bool = False) -> None:
+        with self._lock:
+            users, self._users = self._users, set()
+            if include_session:
+                users |= self._session_users
+                self._session_users = set()
+            carts, self._carts = self._carts - users, set()
+            if not users and not carts:
+                return
+            with allure.step(
+                f"Отложенная очистка: пользователей {len(users)}, корзин {len(carts)}"
+            ):
+                try:
+                    self._db.delete_users(sorted(users))
+                    self._db.delete_carts(sorted(carts))
+                except Exception as e:
+                    self._users |= users
+                    self._carts |= carts
+                    logger.error(
+                        "Отложенная очистка не выполнена, возвращено в очередь: "
+                        "пользователей %d, корзин %d: %s: %s",
+                        len(users),
+                        len(carts),
+                        type(e).__name__,
+                        e,
+                    )
+                    allure.attach(
+                        json.dumps(
+                            {
+                                "error_type": type(e).__name__,
+                                "error_message": str(e),
+                                "users": len(users),
+                                "carts": len(carts),
+                            },
+                            indent=2,
+                        ),
+                        "Ошибка отложенной очистки",
+                        allure.attachment_type.JSON,
+                    )
+                    raise
+            self._journal_rewrite()
+
+    def close(self) -> None:
+        try:
+            self.flush(include_session=True)
+        finally:
+            self._closed = True
+            atexit.unregister(self._flush_at_exit)
+
+    def _flush_at_exit(self) -> None:
+        if self._closed:
+            return
+        try:
+            self.flush(include_session=True)
+        except Exception:
+            logger.exception("Очистка при завершении процесса не выполнена")
+
+    def _recover_journal(self) -> None:
+        if not self._journal_path or not os.path.exists(self._journal_path):
+            return
+        with open(self._journal_path, encoding="utf-8") as journal:
+            for line in journal:
+                kind, _, username = line.rstrip("\n").partition("\t")
+                if kind in ("user", "session_user") and username:
+                    self._users.add(username)
+                elif kind == "cart" and username:
+                    self._carts.add(username)
+        if self._users or self._carts:
+            with allure.step("Очистка данных прерванного запуска"):
+                try:
+                    self.flush()
+                except Exception:
+                    logger.exception("Очистка данных прерванного запуска не выполнена")
+
+    def _journal_append(self, kind: str, username: str) -> None:
+        if not self._journal_path:
+            return
+        with open(self._journal_path, "a", encoding="utf-8") as journal:
+            journal.write(f"{kind}\t{username}\n")
+
+    def _journal_rewrite(self) -> None:
+        if not self._journal_path:
+            return
+        lines = [f"user\t{name}\n" for name in sorted(self._users)]
+        lines += [f"session_user\t{name}\n" for name in sorted(self._session_users)]
+        lines += [f"cart\t{name}\n" for name in sorted(self._carts)]
+        if not lines:
+            if os.path.exists(self._journal_path):
+                os.remove(self._journal_path)
+            return
+        with open(self._journal_path, "w", encoding="utf-8") as journal:
+            journal.writelines(lines)
@@ -0,0 +1,70 @@
+import math
+import threading
+from typing import Dict, Iterable
+
+
+class Histogram:
+
+    def __init__(self, precision: float = 0.01) -> None:
+        self._log_base = math.log1p(precision)
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        bucket = self._bucket(value_ms)
+        with self._lock:
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+            self.count += 1
+            self.total += value_ms
+            self.min = min(self.min, value_ms)
+            self.max = max(self.max, value_ms)
+
+    def merge(self, other: "Histogram") -> None:
+        with self._lock, other._lock:
+            for bucket, count in other._buckets.items():
+                self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+            self.count += other.count
+            self.total += other.total
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        with self._lock:
+            if not self.count:
+                return 0.0
+            rank = max(1, math.ceil(self.count * percent / 100))
+            seen = 0
+            for bucket in sorted(self._buckets):
+                seen += self._buckets[bucket]
+                if seen >= rank:
+                    return min(max(self._value(bucket), self.min), self.max)
+            return self.max
+
+    def summary(self, percents: Iterable[float] = (50, 95, 99)) -> Dict[str, float]:
+        result = {
+            "count": self.count,
+            "mean_ms": round(self.mean, 3),
+            "min_ms": round(self.min if self.count else 0.0, 3),
+            "max_ms": round(self.max, 3),
+        }
+        for percent in percents:
+            result[f"p{percent:g}_ms"] = round(self.percentile(percent), 3)
+        return result
+
+    def _bucket(self, value_ms: float) -> int:
+        if value_ms <= 0.001:
+            return -(10**6)
+        return math.floor(math.log(value_ms) / self._log_base)
+
+    def _value(self, bucket: int) -> float:
+        if bucket == -(10**6):
+            return 0.0
+        return math.exp((bucket + 0.5) * self._log_base)
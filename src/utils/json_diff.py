@@ -0,0 +1,179 @@
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from src.backend.clients.reporting import truncate
+
+LIST_KEYS = ("item_id", "order_id", "id")
+_CONTAINERS = (dict, list)
+
+
+def _pointer(path: str, token: Any) -> str:
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+
+def _same(actual: Any, expected: Any) -> bool:
+    if actual is expected:
+        return True
+    if actual != expected:
+        return False
+    stack = [(actual, expected)]
+    while stack:
+        actual, expected = stack.pop()
+        if type(actual) is dict:
+            pairs: Iterable[Tuple[Any, Any]] = zip(
+                actual.values(), map(expected.__getitem__, actual)
+            )
+        elif type(actual) is list:
+            pairs = zip(actual, expected)
+        else:
+            pairs = ((actual, expected),)
+        for actual_value, expected_value in pairs:
+            if type(actual_value) is not type(expected_value):
+                if type(actual_value) is bool or type(expected_value) is bool:
+                    return False
+            elif type(actual_value) in _CONTAINERS:
+                stack.append((actual_value, expected_value))
+    return True
+
+
+def _list_key(
+    actual: List[Any], expected: List[Any], list_keys: Sequence[str]
+) -> Optional[str]:
+    if not actual or not expected:
+        return None
+    for key in list_keys:
+        if not all(
+            isinstance(item, dict) and key in item
+            for side in (actual, expected)
+            for item in side
+        ):
+            continue
+        try:
+            if len({item[key] for item in actual}) == len(actual) and len(
+                {item[key] for item in expected}
+            ) == len(expected):
+                return key
+        except TypeError:
+            continue
+    return None
+
+
+def json_diff(
+    actual: Any,
+    expected: Any,
+    contains: bool = False,
+    list_keys: Sequence[str] = LIST_KEYS,
+    max_ops: int = 100,
+) -> List[Dict[str, Any]]:
+    ops: List[Dict[str, Any]] = []
+
+    def emit(new_ops: Iterable[Dict[str, Any]]) -> None:
+        ops.extend(islice(new_ops, max(max_ops - len(ops), 0)))
+
+    stack: List[Tuple[str, Any, Any, bool]] = [("", actual, expected, contains)]
+    while stack and len(ops) < max_ops:
+        path, actual_value, expected_value, partial = stack.pop()
+        if _same(actual_value, expected_value):
+            continue
+        children: List[Tuple[str, Any, Any, bool]] = []
+        if isinstance(actual_value, dict) and isinstance(expected_value, dict):
+            emit(
+                {"op": "add", "path": _pointer(path, key), "value": value}
+                for key, value in expected_value.items()
+                if key not in actual_value
+            )
+            children.extend(
+                (_pointer(path, key), actual_value[key], value, partial)
+                for key, value in expected_value.items()
+                if key in actual_value and not _same(actual_value[key], value)
+            )
+            if not partial:
+                emit(
+                    {"op": "remove", "path": _pointer(path, key), "actual": value}
+                    for key, value in actual_value.items()
+                    if key not in expected_value
+                )
+        elif isinstance(actual_value, list) and isinstance(expected_value, list):
+            key = _list_key(actual_value, expected_value, list_keys)
+            if key is None:
+                common = min(len(actual_value), len(expected_value))
+                children.extend(
+                    (
+                        _pointer(path, index),
+                        actual_value[index],
+                        expected_value[index],
+                        False,
+                    )
+                    for index in range(common)
+                    if not _same(actual_value[index], expected_value[index])
+                )
+                emit(
+                    {"op": "add", "path": _pointer(path, index), "value": value}
+                    for index, value in enumerate(expected_value[common:], common)
+                )
+                emit(
+                    {
+                        "op": "remove",
+                        "path": _pointer(path, index),
+                        "actual": actual_value[index],
+                    }
+                    for index in range(len(actual_value) - 1, common - 1, -1)
+                )
+            else:
+                positions = {
+                    item[key]: index for index, item in enumerate(actual_value)
+                }
+                expected_keys = set()
+                last_position = -1
+                for index, value in enumerate(expected_value):
+                    if len(ops) >= max_ops:
+                        break
+                    expected_keys.add(value[key])
+                    position = positions.get(value[key])
+                    if position is None:
+                        ops.append(
+                            {"op": "add", "path": _pointer(path, "-"), "value": value}
+                        )
+                        continue
+                    if position < last_position:
+                        ops.append(
+                            {
+                                "op": "move",
+                                "from": _pointer(path, position),
+                                "path": _pointer(path, index),
+                                key: value[key],
+                            }
+                        )
+                    last_position = max(last_position, position)
+                    if not _same(actual_value[position], value):
+                        children.append(
+                            (
+                                _pointer(path, position),
+                                actual_value[position],
+                                value,
+                                False,
+                            )
+                        )
+                emit(
+                    {"op": "remove", "path": _pointer(path, index), "actual": value}
+                    for index, value in enumerate(actual_value)
+                    if value[key] not in expected_keys
+                )
+        else:
+            ops.append(
+                {
+                    "op": "replace",
+                    "path": path,
+                    "value": expected_value,
+                    "actual": actual_value,
+                }
+            )
+        stack.extend(reversed(children))
+    return ops
+
+
+def format_diff(ops: List[Dict[str, Any]], max_bytes: int = 64 * 1024) -> str:
+    text, _ = truncate(
+        json.dumps(ops, indent=2, ensure_ascii=False, default=str), max_bytes
+    )
+    return text
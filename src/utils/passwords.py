@@ -0,0 +1,26 @@
+import hashlib
+import hmac
+import secrets
+
+
+def hash_password(password: str, iterations: int = 600000) -> str:
+    salt = secrets.token_hex(8)
+    digest = hashlib.pbkdf2_hmac(
+        "sha256", password.encode("utf-8"), salt.encode("utf-8"), iterations
+    ).hex()
+    return f"pbkdf2:sha256:{iterations}${salt}${digest}"
+
+
+def check_password(password_hash: str, password: str) -> bool:
+    try:
+        method, salt, expected = password_hash.split("$", 2)
+        _, hash_name, iterations = method.split(":", 2)
+        digest = hashlib.pbkdf2_hmac(
+            hash_name,
+            password.encode("utf-8"),
+            salt.encode("utf-8"),
+            int(iterations),
+        ).hex()
+    except (ValueError, TypeError):
+        return False
+    return hmac.compare_digest(digest, expected)
@@ -0,0 +1,16 @@
+import hashlib
+import random
+from src.utils.workers import run_id
+
+
+def run_seed() -> int:
+    return int(hashlib.sha256(run_id().encode("utf-8")).hexdigest()[:8], 16)
+
+
+def derive_seed(seed: int, *scope: str) -> int:
+    key = ":".join((str(seed), *scope))
+    return int(hashlib.sha256(key.encode("utf-8")).hexdigest()[:16], 16)
+
+
+def derive_rng(seed: int, *scope: str) -> random.Random:
+    return random.Random(derive_seed(seed, *scope))
@@ -0,0 +1,79 @@
+import codecs
+import json
+import random
+from typing import Any, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    state = "start"
+    chunks = iter(chunks)
+    eof = False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos == len(buffer) or state == "value":
+            if state == "value" and pos < len(buffer):
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    if eof or end < len(buffer) and buffer[end] in _DELIMITERS:
+                        yield value
+                        pos = end
+                        state = "separator"
+                        continue
+            if eof:
+                raise ValueError("Неожиданный конец JSON массива")
+            chunk = next(chunks, None)
+            if chunk is None:
+                eof = True
+                buffer = buffer[pos:] + text_decoder.decode(b"", final=True)
+            else:
+                buffer = buffer[pos:] + text_decoder.decode(chunk)
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if state == "start":
+            if char != "[":
+                raise ValueError(f"Ожидался JSON массив, получено: {char!r}")
+            pos += 1
+            state = "first"
+        elif state == "first" and char == "]":
+            return
+        elif state == "first":
+            state = "value"
+        elif char == ",":
+            pos += 1
+            state = "value"
+        elif char == "]":
+            return
+        else:
+            raise ValueError(f"Ожидалась ',' или ']' в позиции {pos}: {char!r}")
+
+
+def reservoir_sample(
+    items: Iterable[T], k: int, rng: Optional[random.Random] = None
+) -> List[T]:
+    rng = rng or random
+    sample: List[T] = []
+    for index, item in enumerate(items):
+        if index < k:
+            sample.append(item)
+        else:
+            slot = rng.randint(0, index)
+            if slot < k:
+                sample[slot] = item
+    return sample
@@ -1,8 +1,18 @@
 import json
-from typing import Any, Optional, Mapping, List
+from typing import Any, Iterable, Optional, Mapping, List, Union
 import allure
+import numpy as np
 import requests
 import http
+from pydantic import TypeAdapter, ValidationError
+from src.backend.services.catalog.models import CatalogItem
+from src.backend.clients.reporting import truncate
+from src.utils.json_diff import format_diff, json_diff
+
+CATALOG_ITEMS = TypeAdapter(List[CatalogItem])
+MAX_REPORTED_IDS = 20
+MAX_DIFF_OPS = 50
+MAX_ATTACHMENT_BYTES = 64 * 1024
 
 
 @allure.step("Сравнение значений: {allure_title}")
@@ -13,6 +23,16 @@ def assert_eq(
     error_msg: Optional[str] = None,
 ) -> None:
     with allure.step(allure_title):
+        if isinstance(actual_value, (dict, list)) and isinstance(
+            expected_value, (dict, list)
+        ):
+            _assert_json_diff(
+                actual_value,
+                expected_value,
+                False,
+                error_msg or "Значения не равны",
+            )
+            return
         try:
             allure.attach(
                 json.dumps(
@@ -65,17 +85,27 @@ def assert_true(
 
 
 def _dict_contains(superset: Mapping[str, Any], subset: Mapping[str, Any]) -> bool:
-    for key, expected_value in subset.items():
-        if key not in superset:
-            return False
-        actual_value = superset[key]
-        if isinstance(expected_value, Mapping) and isinstance(actual_value, Mapping):
-            if not _dict_contains(actual_value, expected_value):
-                return False
-        else:
-            if actual_value != expected_value:
-                return False
-    return True
+    return not json_diff(superset, subset, contains=True, max_ops=1)
+
+
+def _assert_json_diff(
+    actual_json: Any, expected_json: Any, contains: bool, error_msg: str
+) -> None:
+    ops = json_diff(actual_json, expected_json, contains=contains, max_ops=MAX_DIFF_OPS)
+    if ops:
+        allure.attach(
+            format_diff(ops),
+            "Расхождения JSON (JSON Patch)",
+            allure.attachment_type.JSON,
+        )
+        shown = "\n".join(
+            f"{op['op']} {op.get('from', '')}{' -> ' if 'from' in op else ''}"
+            f"{op['path'] or '/'}"
+            for op in ops[:10]
+        )
+        more = "" if len(ops) < MAX_DIFF_OPS else f"\nпоказаны первые {MAX_DIFF_OPS}"
+        raise AssertionError(f"{error_msg}:\n{shown}{more}")
+    allure.attach("Сравнение успешно", "Результат", allure.attachment_type.TEXT)
 
 
 @allure.step("Частичная проверка JSON: {allure_title}")
@@ -85,23 +115,16 @@ def assert_json_contains(
     allure_title: str,
 ) -> None:
     with allure.step(allure_title):
-        allure.attach(
-            json.dumps(actual_json, indent=2, ensure_ascii=False),
-            "Фактический JSON",
-            allure.attachment_type.JSON,
-        )
         allure.attach(
             json.dumps(expected_subset, indent=2, ensure_ascii=False),
             "Ожидаемый фрагмент",
             allure.attachment_type.JSON,
         )
-        assert _dict_contains(
-            actual_json, expected_subset
-        ), "JSON не содержит ожидаемые поля/значения"
-        allure.attach(
-            "JSON содержит ожидаемые поля/значения",
-            "Результат",
-            allure.attachment_type.TEXT,
+        _assert_json_diff(
+            actual_json,
+            expected_subset,
+            True,
+            "JSON не содержит ожидаемые поля/значения",
         )
 
 
@@ -151,10 +174,15 @@ def validate_response(
     if expected_json is not None or expected_json_partial is not None:
         try:
             actual_json = response.json()
+            body, truncated = truncate(response.text, MAX_ATTACHMENT_BYTES)
             allure.attach(
-                json.dumps(actual_json, indent=2, ensure_ascii=False),
+                body,
                 "Фактический JSON ответ",
-                allure.attachment_type.JSON,
+                (
+                    allure.attachment_type.TEXT
+                    if truncated
+                    else allure.attachment_type.JSON
+                ),
             )
         except json.JSONDecodeError:
             allure.attach(
@@ -215,28 +243,165 @@ def validate_json_structure(
         )
 
 
+def _format_ids(ids: np.ndarray) -> str:
+    shown = ", ".join(str(item_id) for item_id in ids[:MAX_REPORTED_IDS])
+    if len(ids) > MAX_REPORTED_IDS:
+        shown += f" … (ещё {len(ids) - MAX_REPORTED_IDS})"
+    return shown
+
+
+def catalog_violations(
+    items: List[CatalogItem],
+    min_items: int = 0,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    sort_order: Optional[str] = None,
+    brand: Optional[str] = None,
+) -> List[str]:
+    violations = []
+    if len(items) < min_items:
+        violations.append(
+            f"Каталог должен содержать минимум {min_items} товар(ов), получено {len(items)}"
+        )
+    if not items:
+        return violations
+    ids = np.fromiter((item["id"] for item in items), dtype=np.int64, count=len(items))
+    prices = np.fromiter(
+        (item["price"] for item in items), dtype=np.int64, count=len(items)
+    )
+    checks = [(prices <= 0, "Цена должна быть положительной")]
+    if min_price is not None:
+        checks.append((prices < min_price, f"Цена меньше {min_price}"))
+    if max_price is not None:
+        checks.append((prices > max_price, f"Цена больше {max_price}"))
+    if brand is not None:
+        brands = np.array([item["brand"] for item in items])
+        checks.append((brands != brand, f"Бренд отличается от {brand}"))
+    for mask, message in checks:
+        if mask.any():
+            violations.append(f"{message}: товары {_format_ids(ids[mask])}")
+    if sort_order is not None and len(prices) > 1:
+        steps = np.diff(prices)
+        unordered = steps < 0 if sort_order == "asc" else steps > 0
+        if unordered.any():
+            violations.append(
+                f"Нарушена сортировка по цене ({sort_order}): "
+                f"товары {_format_ids(ids[1:][unordered])}"
+            )
+    unique_ids, counts = np.unique(ids, return_counts=True)
+    if (counts > 1).any():
+        violations.append(
+            f"Повторяющиеся ID товаров: {_format_ids(unique_ids[counts > 1])}"
+        )
+    return violations
+
+
+def _schema_violations(error: ValidationError) -> List[str]:
+    return [
+        "".join(
+            f"[{part}]" if isinstance(part, int) else f".{part}"
+            for part in details["loc"]
+        ).lstrip(".")
+        + f": {details['msg']}"
+        for details in error.errors()
+    ]
+
+
+def _assert_catalog(
+    validate: Any,
+    data: Union[bytes, str, List[dict]],
+    **filters: Any,
+) -> List[CatalogItem]:
+    try:
+        items = validate(data, strict=True)
+        violations = catalog_violations(items, **filters)
+    except ValidationError as e:
+        items = []
+        violations = _schema_violations(e)
+    if violations:
+        allure.attach(
+            json.dumps(violations, indent=2, ensure_ascii=False),
+            "Нарушения в каталоге",
+            allure.attachment_type.JSON,
+        )
+        raise AssertionError(
+            f"Каталог невалиден, нарушений: {len(violations)}\n" + "\n".join(violations)
+        )
+    allure.attach(
+        f"Каталог товаров валиден, товаров: {len(items)}",
+        "Результат",
+        allure.attachment_type.TEXT,
+    )
+    return items
+
+
 @allure.step("Валидация ответа каталога")
-def validate_catalog_response(response_data: List[dict], min_items: int = 0) -> None:
+def validate_catalog_response(
+    response_data: List[dict], min_items: int = 0
+) -> List[CatalogItem]:
     with allure.step("Проверка каталога товаров"):
         assert isinstance(response_data, list), "Ответ должен быть списком"
-        assert (
-            len(response_data) >= min_items
-        ), f"Каталог должен содержать минимум {min_items} товар(ов)"
-
-        if response_data:
-            item = response_data[0]
-            required_item_fields = ["id", "name", "brand", "price"]
-            validate_json_structure(
-                item, required_item_fields, "Проверка структуры товара"
-            )
+        return _assert_catalog(
+            CATALOG_ITEMS.validate_python, response_data, min_items=min_items
+        )
 
-            assert isinstance(item["id"], int), "ID товара должен быть числом"
-            assert isinstance(item["price"], (int, float)), "Цена должна быть числом"
-            assert item["price"] > 0, "Цена должна быть положительной"
 
-        allure.attach(
-            "Каталог товаров валиден", "Результат", allure.attachment_type.TEXT
-        )
+@allure.step("Валидация тела ответа каталога")
+def validate_catalog_payload(
+    raw: Union[bytes, str],
+    min_items: int = 0,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    sort_order: Optional[str] = None,
+    brand: Optional[str] = None,
+) -> List[CatalogItem]:
+    return _assert_catalog(
+        CATALOG_ITEMS.validate_json,
+        raw,
+        min_items=min_items,
+        min_price=min_price,
+        max_price=max_price,
+        sort_order=sort_order,
+        brand=brand,
+    )
+
+
+@allure.step("Потоковая валидация каталога")
+def validate_catalog_stream(
+    items: Iterable[dict],
+    min_items: int = 0,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    sort_order: Optional[str] = None,
+) -> int:
+    required_item_fields = ("id", "name", "brand", "price")
+    count = 0
+    previous_price = None
+    for item in items:
+        missing_fields = [field for field in required_item_fields if field not in item]
+        assert not missing_fields, f"Товар {count}: отсутствуют поля {missing_fields}"
+        item_id, price = item["id"], item["price"]
+        assert isinstance(item_id, int), f"ID товара {item_id!r} должен быть числом"
+        assert isinstance(price, (int, float)), f"Цена товара {item_id} не число"
+        assert price > 0, f"Цена товара {item_id} должна быть положительной"
+        if min_price is not None:
+            assert price >= min_price, f"Цена товара {item_id} меньше {min_price}"
+        if max_price is not None:
+            assert price <= max_price, f"Цена товара {item_id} больше {max_price}"
+        if sort_order is not None and previous_price is not None:
+            in_order = (
+                previous_price <= price
+                if sort_order == "asc"
+                else previous_price >= price
+            )
+            assert in_order, f"Нарушен порядок сортировки на товаре {item_id}"
+        previous_price = price
+        count += 1
+    assert count >= min_items, f"Каталог должен содержать минимум {min_items} товар(ов)"
+    allure.attach(
+        f"Проверено товаров: {count}", "Результат", allure.attachment_type.TEXT
+    )
+    return count
 
 
 @allure.step("Валидация ответа корзины")
@@ -0,0 +1,43 @@
+import os
+import string
+import uuid
+
+_BASE36 = string.digits + string.ascii_lowercase
+_RUN_ID = uuid.uuid4().hex
+
+
+def worker_id() -> str:
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+
+def run_id() -> str:
+    return os.environ.get("PYTEST_XDIST_TESTRUNUID", _RUN_ID)
+
+
+def worker_count() -> int:
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
+def worker_index() -> int:
+    current = worker_id()
+    if current.startswith("gw") and current[2:].isdigit():
+        return int(current[2:])
+    return 0
+
+
+def worker_namespace() -> str:
+    index = worker_index()
+    return "w" + _BASE36[index // 36 % 36] + _BASE36[index % 36]
+
+
+def worker_path(path: str) -> str:
+    current = worker_id()
+    return path if current == "master" else f"{path}.{current}"
+
+
+def base36(value: int, width: int = 1) -> str:
+    digits = []
+    while value:
+        value, digit = divmod(value, 36)
+        digits.append(_BASE36[digit])
+    return "".join(reversed(digits)).rjust(width, "0")
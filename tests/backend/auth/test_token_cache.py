@@ -0,0 +1,116 @@
+import base64
+import json
+import threading
+import time
+import allure
+import pytest
+from src.backend.services.auth.token_cache import TokenCache, jwt_expiry
+
+pytestmark = [
+    allure.epic("Система аутентификации"),
+    allure.feature("Кэш JWT токенов"),
+]
+
+BASE_URL = "http://shop.test"
+
+
+def make_jwt(expires_at: float) -> str:
+    def encode(data: dict) -> str:
+        raw = json.dumps(data).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    return f"{encode({'alg': 'HS256'})}.{encode({'exp': expires_at})}.signature"
+
+
+class Login:
+
+    def __init__(self, token: str, delay: float = 0.0) -> None:
+        self.token = token
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return self.token
+
+
+@allure.title("Токен перевыпускается, когда до exp остаётся меньше refresh_margin")
+def test_token_refreshed_near_jwt_expiry():
+    cache = TokenCache(refresh_margin=60)
+    expiring = Login(make_jwt(time.time() + 30))
+    valid = Login(make_jwt(time.time() + 3600))
+
+    cache.get(BASE_URL, "expiring", expiring)
+    cache.get(BASE_URL, "expiring", expiring)
+    cache.get(BASE_URL, "valid", valid)
+    cache.get(BASE_URL, "valid", valid)
+
+    assert jwt_expiry(valid.token) == pytest.approx(time.time() + 3600, abs=5)
+    assert jwt_expiry("not-a-jwt") is None
+    assert expiring.calls == 2
+    assert valid.calls == 1
+    assert cache.stats()["refreshes"] == 1
+
+
+@allure.title("Параллельные запросы одного пользователя выполняют один логин")
+def test_single_flight_login_per_key():
+    cache = TokenCache()
+    login = Login(make_jwt(time.time() + 3600), delay=0.05)
+    other_backend = Login(make_jwt(time.time() + 3600))
+    tokens = []
+    threads = [
+        threading.Thread(
+            target=lambda: tokens.append(cache.get(BASE_URL, "shopper", login))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cache.get("http://other.test", "shopper", other_backend)
+
+    assert login.calls == 1
+    assert tokens == [login.token] * 8
+    assert other_backend.calls == 1
+
+
+@allure.title("После invalidate токен запрашивается заново")
+def test_invalidate_forces_new_login():
+    cache = TokenCache()
+    login = Login(make_jwt(time.time() + 3600))
+    cache.get(BASE_URL, "shopper", login)
+    cache.invalidate(BASE_URL, "shopper")
+    cache.get(BASE_URL, "shopper", login)
+
+    assert login.calls == 2
+    assert cache.stats()["cached_tokens"] == 1
+
+
+@allure.title("Кэш читается с диска без устаревших токенов и удалённых пользователей")
+def test_reload_from_disk_drops_expired_and_missing_users(
+    tmp_path, base_url, db_client, seed_users
+):
+    existing = seed_users(1)[0]["username"]
+    path = str(tmp_path / "tokens.json")
+    cache = TokenCache(path=path)
+    cache.get(base_url, existing, Login(make_jwt(time.time() + 3600)))
+    cache.get(base_url, "deleted_user", Login(make_jwt(time.time() + 3600)))
+    cache.get(BASE_URL, existing, Login(make_jwt(time.time() + 3600)))
+    cache.get(base_url, "expired_user", Login(make_jwt(time.time() + 120)))
+
+    reloaded = TokenCache(refresh_margin=300, path=path)
+    dropped = reloaded.retain_users(
+        base_url, db_client.existing_users(reloaded.usernames(base_url))
+    )
+    login = Login(make_jwt(time.time() + 3600))
+    reloaded.get(base_url, existing, login)
+
+    assert sorted(reloaded.usernames(base_url)) == [existing]
+    assert reloaded.usernames(BASE_URL) == [existing]
+    assert dropped == 1
+    assert login.calls == 0
+    assert TokenCache(path=path).usernames(base_url) == [existing]
@@ -3,6 +3,7 @@ import pytest
 import http
 from src.utils.validations import validate_response, validate_json_structure
 from src.builders.user_builder import UserBuilder
+from config import CLEANUP_CONFIG
 
 pytestmark = [
     allure.epic("Система аутентификации"),
@@ -13,8 +14,8 @@ pytestmark = [
 
 @allure.title("Регистрация нового пользователя")
 @allure.severity(allure.severity_level.CRITICAL)
-def test_user_registration(auth_adapter):
-    new_user = UserBuilder().build()
+def test_user_registration(auth_adapter, rng):
+    new_user = UserBuilder(rng=rng).build()
     with allure.step("Регистрация пользователя"):
         resp = auth_adapter.register_user(new_user["username"], new_user["password"])
         allure.attach(str(resp.text), "Ответ API", allure.attachment_type.TEXT)
@@ -27,6 +28,20 @@ def test_user_registration(auth_adapter):
     assert response_data["message"] == "Registration successful"
 
 
+@allure.title("Вход пользователя, созданного массовой загрузкой в БД")
+@allure.severity(allure.severity_level.NORMAL)
+def test_login_seeded_user(auth_adapter, seed_users, db_client, backend_mode):
+    if backend_mode == "live" and db_client.in_isolation:
+        pytest.skip(
+            "живой backend не видит пользователей внутри незафиксированного SAVEPOINT"
+        )
+    seeded = seed_users(50)
+    with allure.step("Вход последнего созданного пользователя"):
+        resp = auth_adapter.login_user(seeded[-1]["username"], seeded[-1]["password"])
+    validate_response(resp, http.HTTPStatus.OK)
+    validate_json_structure(resp.json(), ["token"], "Проверка структуры ответа входа")
+
+
 @allure.title("Вход пользователя в систему")
 @allure.severity(allure.severity_level.CRITICAL)
 def test_user_login(auth_adapter, user):
@@ -48,3 +63,19 @@ def test_login_invalid_credentials(auth_adapter, user):
         resp = auth_adapter.login_user(user["username"], "wrong_password")
         allure.attach(str(resp.json()), "Ответ API", allure.attachment_type.JSON)
     validate_response(resp, http.HTTPStatus.UNAUTHORIZED)
+
+
+@allure.title("Созданные и пуловые пользователи доступны при превышении порога очистки")
+@allure.severity(allure.severity_level.NORMAL)
+def test_seeded_users_survive_cleanup_threshold(
+    auth_adapter, cart_adapter, seed_users, user
+):
+    seeded = seed_users(CLEANUP_CONFIG["flush_threshold"] + 50)
+    with allure.step("Вход первого и последнего созданного пользователя"):
+        for seeded_user in (seeded[0], seeded[-1]):
+            resp = auth_adapter.login_user(
+                seeded_user["username"], seeded_user["password"]
+            )
+            validate_response(resp, http.HTTPStatus.OK)
+    with allure.step("Запрос корзины пользователем из пула"):
+        validate_response(cart_adapter.get_cart(user["token"]), http.HTTPStatus.OK)
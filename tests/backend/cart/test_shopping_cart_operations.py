@@ -1,6 +1,7 @@
 import allure
 import pytest
 import http
+from src.builders.item_builder import ItemBuilder
 from src.utils.validations import validate_response, validate_cart_response
 
 pytestmark = [
@@ -62,3 +63,60 @@ def test_add_invalid_item(cart_adapter, user):
         resp = cart_adapter.add_item(user["token"], 99999, 1)
         allure.attach(resp.text, "Ответ API", allure.attachment_type.TEXT)
     assert resp.status_code in [400, 500]
+
+
+@allure.title("Пакетное добавление и удаление товаров")
+@allure.severity(allure.severity_level.NORMAL)
+def test_add_and_remove_items_batch(
+    cart_adapter, catalog_adapter, catalog_snapshot, user, rng
+):
+    items = ItemBuilder(
+        catalog_adapter, user["token"], snapshot=catalog_snapshot, rng=rng
+    ).build_many(10)
+    added = cart_adapter.add_items(user["token"], items)
+    assert added.ok, added.failed
+
+    with allure.step("Проверка содержимого корзины"):
+        resp = cart_adapter.get_cart(user["token"])
+    validate_response(resp, http.HTTPStatus.OK)
+    validate_cart_response(resp.json())
+    assert {item["item_id"] for item in items} <= {
+        item["item_id"] for item in resp.json()["items"]
+    }
+
+    removed = cart_adapter.remove_items(
+        user["token"], [item["item_id"] for item in items]
+    )
+    assert removed.ok, removed.failed
+
+
+@allure.title("Пакетное добавление с повторами и несуществующим товаром")
+@allure.severity(allure.severity_level.NORMAL)
+def test_add_items_batch_merges_duplicates_and_reports_failures(
+    cart_adapter, catalog_adapter, catalog_snapshot, user, rng
+):
+    first, second = ItemBuilder(
+        catalog_adapter, user["token"], snapshot=catalog_snapshot, rng=rng
+    ).build_many(2)
+    items = [
+        first,
+        second,
+        {"item_id": 99999, "quantity": 1},
+        {"item_id": first["item_id"], "quantity": 2},
+    ]
+    added = cart_adapter.add_items(user["token"], items)
+
+    assert not added.ok
+    assert [result.item_id for result in added.succeeded] == [
+        first["item_id"],
+        second["item_id"],
+    ]
+    assert [result.item_id for result in added.failed] == [99999]
+    assert added.results[0].quantity == first["quantity"] + 2
+
+    with allure.step("Проверка количества повторённого товара"):
+        resp = cart_adapter.get_cart(user["token"])
+    validate_response(resp, http.HTTPStatus.OK)
+    quantities = {item["item_id"]: item["quantity"] for item in resp.json()["items"]}
+    assert quantities[first["item_id"]] == first["quantity"] + 2
+    assert quantities[second["item_id"]] == second["quantity"]
@@ -1,7 +1,13 @@
+import asyncio
 import allure
 import pytest
 import http
-from src.utils.validations import validate_response, validate_catalog_response
+from src.utils.validations import (
+    validate_response,
+    validate_catalog_payload,
+    validate_catalog_response,
+    validate_catalog_stream,
+)
 
 pytestmark = [
     allure.epic("Система каталога"),
@@ -17,7 +23,7 @@ def test_get_catalog(catalog_adapter, user):
         resp = catalog_adapter.get_catalog(user["token"])
         allure.attach(str(resp.json()), "Ответ API", allure.attachment_type.JSON)
     validate_response(resp, http.HTTPStatus.OK)
-    validate_catalog_response(resp.json())
+    validate_catalog_payload(resp.content)
 
 
 @allure.title("Фильтрация товаров по цене")
@@ -27,15 +33,9 @@ def test_filter_by_price(catalog_adapter, user):
         resp = catalog_adapter.get_catalog(user["token"], min_price=100, max_price=500)
         allure.attach(str(resp.json()), "Ответ API", allure.attachment_type.JSON)
     validate_response(resp, http.HTTPStatus.OK)
-    response_data = resp.json()
-    validate_catalog_response(response_data, min_items=0)
-
-    if response_data:
-        for item in response_data:
-            assert (
-                100 <= item["price"] <= 500
-            ), f'Цена товара {item["id"]} не в диапазоне 100-500'
-    else:
+    response_data = validate_catalog_payload(resp.content, min_price=100, max_price=500)
+
+    if not response_data:
         allure.attach(
             "Фильтр вернул пустой список - нет товаров в диапазоне 100-500",
             "Информация",
@@ -52,11 +52,21 @@ def test_sort_by_price(catalog_adapter, user):
         )
         allure.attach(str(resp.json()), "Ответ API", allure.attachment_type.JSON)
     validate_response(resp, http.HTTPStatus.OK)
-    response_data = resp.json()
-    validate_catalog_response(response_data)
+    validate_catalog_payload(resp.content, sort_order="asc")
+
 
-    prices = [item["price"] for item in response_data if "price" in item]
-    assert prices == sorted(prices), "Товары не отсортированы по возрастанию цены"
+@allure.title("Потоковое чтение отсортированного каталога с фильтром по цене")
+@allure.severity(allure.severity_level.NORMAL)
+def test_stream_filtered_catalog(catalog_adapter, user):
+    with allure.step("Потоковое чтение каталога"):
+        items = catalog_adapter.iter_catalog(
+            user["token"],
+            min_price=100,
+            max_price=500,
+            sort_by="price",
+            sort_order="asc",
+        )
+        validate_catalog_stream(items, min_price=100, max_price=500, sort_order="asc")
 
 
 @allure.title("Попытка фильтрации с невалидными параметрами")
@@ -68,3 +78,39 @@ def test_invalid_filter_params(catalog_adapter, user):
         )
         allure.attach(resp.text, "Ответ API", allure.attachment_type.TEXT)
     assert resp.status_code in [200, 400, 500]
+
+
+@allure.title("Параллельное получение каталога")
+@allure.severity(allure.severity_level.NORMAL)
+@pytest.mark.asyncio
+async def test_concurrent_catalog_requests(async_catalog_adapter, user):
+    with allure.step("Параллельные запросы каталога"):
+        responses = await asyncio.gather(
+            *(async_catalog_adapter.get_catalog(user["token"]) for _ in range(20))
+        )
+    for resp in responses:
+        validate_response(resp, http.HTTPStatus.OK)
+        validate_catalog_response(resp.json())
+
+
+@allure.title("Чтение каталога ценовыми окнами с предзагрузкой")
+@allure.severity(allure.severity_level.NORMAL)
+def test_iter_catalog_windows(catalog_adapter, user):
+    with allure.step("Получение каталога целиком"):
+        resp = catalog_adapter.get_catalog(
+            user["token"], sort_by="price", sort_order="desc"
+        )
+    validate_response(resp, http.HTTPStatus.OK)
+
+    with allure.step("Чтение каталога окнами по 200"):
+        items = list(
+            catalog_adapter.iter_catalog_windows(
+                user["token"], window=200, sort_by="price", sort_order="desc"
+            )
+        )
+        validate_catalog_stream(items, sort_order="desc")
+    assert sorted(item["id"] for item in items) == sorted(
+        item["id"] for item in resp.json()
+    )
+    with pytest.raises(ValueError):
+        next(catalog_adapter.iter_catalog_windows(user["token"], sort_by="name"))
@@ -1,13 +1,48 @@
+from typing import List, Optional
 import pytest
+import pytest_asyncio
 import allure
 import json
+import random
 from src.backend.clients.http_client import HTTPClient
+from src.backend.clients.async_http_client import AsyncHTTPClient
 from src.backend.clients.db_client import DbClient
+from src.backend.clients.metrics import default_metrics
+from src.backend.clients.response_cache import ResponseCache
+from src.backend.fake.db import FakeDbClient
+from src.backend.fake.server import FakeShopServer
+from src.backend.fake.shop import FakeShop, default_catalog
+from src.backend.fake.transport import FakeShopAdapter
 from src.backend.services.auth.adapter import AuthAdapter
 from src.backend.services.cart.adapter import CartAdapter
 from src.backend.services.catalog.adapter import CatalogAdapter
 from src.backend.services.orders.adapter import OrdersAdapter
-from config import BASE_URL, DB_CONFIG
+from src.backend.services.auth.async_adapter import AsyncAuthAdapter
+from src.backend.services.cart.async_adapter import AsyncCartAdapter
+from src.backend.services.catalog.async_adapter import AsyncCatalogAdapter
+from src.backend.services.orders.async_adapter import AsyncOrdersAdapter
+from src.backend.services.auth.token_cache import TokenCache
+from src.builders.catalog_snapshot import CatalogSnapshot
+from src.builders.user_builder import UserBuilder
+from src.builders.user_pool import UserPool
+from src.utils.cleanup import CleanupRegistry
+from src.utils.seeds import derive_rng
+from src.utils.workers import run_id, worker_id, worker_path
+from config import (
+    BASE_URL,
+    CATALOG_SNAPSHOT_CONFIG,
+    CLEANUP_CONFIG,
+    DB_CONFIG,
+    DB_POOL_CONFIG,
+    DB_SEED_CONFIG,
+    DB_TEMPLATE_CONFIG,
+    FAKE_SHOP_CONFIG,
+    HTTP_CACHE_CONFIG,
+    HTTP_POOL_CONFIG,
+    ASYNC_HTTP_CONFIG,
+    TOKEN_CACHE_CONFIG,
+    USER_POOL_CONFIG,
+)
 
 pytestmark = [
     allure.epic("Автотесты для Backend API интернет-магазина"),
@@ -16,16 +51,124 @@ pytestmark = [
 ]
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    client = getattr(item, "funcargs", {}).get("http_client")
+    if report.failed and report.when != "teardown":
+        seed = item.config.run_seed
+        report.sections.append(
+            (
+                "test data seed",
+                f"seed {seed}, повтор: pytest '{item.nodeid}' --seed {seed}",
+            )
+        )
+    if client is None or report.when == "teardown":
+        return
+    if report.failed:
+        client.flush_pending()
+    elif report.when == "call":
+        client.discard_pending()
+
+
+def pytest_sessionfinish(session) -> None:
+    path = session.config.getoption("--http-metrics-json")
+    if path and default_metrics.summary():
+        default_metrics.export_json(worker_path(path))
+
+
+def pytest_terminal_summary(terminalreporter, config) -> None:
+    limit = config.getoption("--http-metrics-top")
+    if limit <= 0 or not default_metrics.summary():
+        return
+    terminalreporter.write_sep("-", "HTTP latency by endpoint (ms)")
+    for line in default_metrics.format_table(limit):
+        terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def http_reporting_config(request) -> dict:
+    return {
+        "reporting_level": request.config.getoption("--http-reporting"),
+        "sample_rate": request.config.getoption("--http-sample-rate"),
+        "max_attachment_bytes": request.config.getoption("--http-attachment-max-bytes"),
+    }
+
+
+@pytest.fixture(scope="session")
+def backend_mode(request) -> str:
+    return request.config.getoption("--backend")
+
+
 @pytest.fixture(scope="session")
-@allure.step("Инициализация HTTP клиента")
-def http_client() -> HTTPClient:
-    with allure.step(f"Создание HTTP клиента для {BASE_URL}"):
-        client = HTTPClient(BASE_URL)
+def fake_shop(backend_mode: str) -> Optional[FakeShop]:
+    if backend_mode == "live":
+        return None
+    with allure.step("Запуск заглушки backend API"):
+        return FakeShop(default_catalog(FAKE_SHOP_CONFIG["catalog_size"]))
+
+
+@pytest.fixture(scope="session")
+def fake_shop_server(fake_shop: Optional[FakeShop]) -> Optional[FakeShopServer]:
+    if fake_shop is None:
+        yield None
+        return
+    server = FakeShopServer(fake_shop).start()
+
+    yield server
+
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(backend_mode: str, request) -> str:
+    if backend_mode == "inprocess":
+        return FAKE_SHOP_CONFIG["base_url"]
+    if backend_mode == "loopback":
+        return request.getfixturevalue("fake_shop_server").base_url
+    return BASE_URL
+
+
+@pytest.fixture(scope="session")
+def socket_base_url(backend_mode: str, base_url: str, request) -> str:
+    if backend_mode == "inprocess":
+        return request.getfixturevalue("fake_shop_server").base_url
+    return base_url
+
+
+@pytest.fixture(scope="session")
+def http_client(
+    request,
+    http_reporting_config: dict,
+    base_url: str,
+    backend_mode: str,
+    fake_shop: Optional[FakeShop],
+) -> HTTPClient:
+    cache = None
+    if request.config.getoption("--http-cache") == "on":
+        cache = ResponseCache(
+            **{
+                key: value
+                for key, value in HTTP_CACHE_CONFIG.items()
+                if key != "enabled"
+            }
+        )
+    with allure.step(f"Создание HTTP клиента для {base_url}"):
+        client = HTTPClient(
+            base_url, **HTTP_POOL_CONFIG, **http_reporting_config, cache=cache
+        )
+        if backend_mode == "inprocess":
+            client.mount(base_url, FakeShopAdapter(fake_shop))
 
         client_info = {
-            "base_url": BASE_URL,
+            "base_url": base_url,
+            "backend": backend_mode,
             "client_type": "HTTPClient",
             "scope": "session",
+            "pool": HTTP_POOL_CONFIG,
+            "reporting": http_reporting_config,
+            "cache": HTTP_CACHE_CONFIG if cache is not None else None,
         }
 
         allure.attach(
@@ -40,24 +183,77 @@ def http_client() -> HTTPClient:
             allure.attachment_type.TEXT,
         )
 
-        return client
+    yield client
+
+    with allure.step("Закрытие HTTP клиента"):
+        allure.attach(
+            json.dumps(client.connection_stats(), indent=2),
+            "Статистика переиспользования соединений",
+            allure.attachment_type.JSON,
+        )
+        if cache is not None:
+            allure.attach(
+                json.dumps(cache.stats(), indent=2),
+                "Статистика кэша ответов",
+                allure.attachment_type.JSON,
+            )
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def db_database(request, fake_shop: Optional[FakeShop]) -> str:
+    database = DB_CONFIG["dbname"]
+    if fake_shop is not None or request.config.getoption("--db-template") == "off":
+        return database
+    template = DB_TEMPLATE_CONFIG["template"]
+    with allure.step(f"Восстановление {database} из шаблона {template}"):
+        admin = DbClient(
+            {**DB_CONFIG, "application_name": f"autotests-admin-{worker_id()}"},
+            minconn=0,
+            maxconn=1,
+        )
+        try:
+            admin.ensure_template(template, DB_TEMPLATE_CONFIG["seed_paths"])
+            admin.restore_template(template, run_marker=run_id())
+        finally:
+            admin.close()
+    return database
 
 
 @pytest.fixture(scope="session")
-@allure.step("Инициализация DB клиента")
-def db_client() -> DbClient:
+def db_client(request, fake_shop: Optional[FakeShop]) -> DbClient:
+    if fake_shop is not None:
+        client = FakeDbClient(fake_shop)
+        if request.config.getoption("--db-template") != "off":
+            template = DB_TEMPLATE_CONFIG["template"]
+            with allure.step(f"Подготовка БД из шаблона {template}"):
+                client.ensure_template(template, DB_TEMPLATE_CONFIG["seed_paths"])
+                client.restore_template(template)
+        yield client
+        client.close()
+        return
+    database = request.getfixturevalue("db_database")
     with allure.step(
         f"Создание DB клиента для {DB_CONFIG['host']}:{DB_CONFIG['port']}"
     ):
-        client = DbClient(DB_CONFIG)
+        client = DbClient(
+            {
+                **DB_CONFIG,
+                "dbname": database,
+                "application_name": f"autotests-{worker_id()}",
+            },
+            **DB_POOL_CONFIG,
+        )
 
         db_info = {
             "host": DB_CONFIG["host"],
             "port": DB_CONFIG["port"],
-            "database": DB_CONFIG["dbname"],
+            "database": database,
             "user": DB_CONFIG["user"],
             "client_type": "DbClient",
             "scope": "session",
+            "worker": worker_id(),
+            "pool": DB_POOL_CONFIG,
         }
 
         allure.attach(
@@ -72,30 +268,156 @@ def db_client() -> DbClient:
             allure.attachment_type.TEXT,
         )
 
-        return client
+    yield client
+
+    with allure.step("Закрытие пула соединений с БД"):
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def cleanup_registry(db_client: DbClient) -> CleanupRegistry:
+    with allure.step("Создание реестра отложенной очистки"):
+        cleanup_config = {
+            **CLEANUP_CONFIG,
+            "journal_path": worker_path(CLEANUP_CONFIG["journal_path"]),
+        }
+        registry = CleanupRegistry(db_client, **cleanup_config)
+        allure.attach(
+            json.dumps(cleanup_config, indent=2),
+            "Конфигурация отложенной очистки",
+            allure.attachment_type.JSON,
+        )
+
+    yield registry
+
+    with allure.step("Финальная очистка тестовых данных"):
+        try:
+            registry.close()
+        except Exception:
+            pass
+
+
+@pytest.fixture(scope="session")
+def token_cache(base_url: str, db_client: DbClient) -> TokenCache:
+    cache_path = TOKEN_CACHE_CONFIG["path"]
+    cache = TokenCache(
+        **{
+            **TOKEN_CACHE_CONFIG,
+            "path": worker_path(cache_path) if cache_path else None,
+        }
+    )
+    cached = cache.usernames(base_url)
+    if cached:
+        with allure.step(f"Проверка пользователей из кэша токенов: {len(cached)}"):
+            cache.retain_users(base_url, db_client.existing_users(cached))
+
+    yield cache
+
+    with allure.step("Статистика кэша токенов"):
+        allure.attach(
+            json.dumps(cache.stats(), indent=2),
+            "Попадания и промахи кэша токенов",
+            allure.attachment_type.JSON,
+        )
 
 
 @pytest.fixture
-@allure.step("Создание тестового пользователя")
-def user(http_client: HTTPClient, db_client: DbClient) -> dict:
-    from src.builders.user_builder import UserBuilder
-
-    auth = AuthAdapter(http_client)
-    user_data = UserBuilder().build()
-    try:
-        db_client.delete_user(user_data["username"])
-    except Exception:
-        pass
-    register_resp = auth.register(user_data)
-    login_resp = auth.login(user_data)
-    token_data = login_resp.json()
-    if "token" not in token_data:
-        raise ValueError("JWT токен не получен")
-    return {
-        "username": user_data["username"],
-        "password": user_data["password"],
-        "token": f"Bearer {token_data['token']}",
-    }
+def seed_users(
+    db_client: DbClient, cleanup_registry: CleanupRegistry, rng: random.Random
+):
+    created: List[str] = []
+
+    def seed(count: int, cart_items: Optional[List[dict]] = None) -> List[dict]:
+        return db_client.seed_users(
+            count,
+            user_builder=UserBuilder(rng=rng),
+            cart_items=cart_items,
+            on_batch=created.extend,
+            **DB_SEED_CONFIG,
+        )
+
+    yield seed
+
+    if not created or db_client.in_isolation:
+        return
+    with allure.step(f"Удаление созданных пользователей: {len(created)}"):
+        try:
+            db_client.delete_users(created)
+        except Exception:
+            for username in created:
+                cleanup_registry.register_user(username)
+
+
+@pytest.fixture
+def rng(request) -> random.Random:
+    seed = request.config.run_seed
+    allure.dynamic.parameter("test_data_seed", seed, excluded=True)
+    return derive_rng(seed, request.node.nodeid)
+
+
+@pytest.fixture(scope="session")
+def user_pool(
+    request,
+    http_client: HTTPClient,
+    db_client: DbClient,
+    cleanup_registry: CleanupRegistry,
+    token_cache: TokenCache,
+) -> UserPool:
+    with allure.step("Создание пула тестовых пользователей"):
+        pool = UserPool(
+            AuthAdapter(http_client, token_cache),
+            db_client,
+            cleanup_registry,
+            **USER_POOL_CONFIG,
+            rng=derive_rng(request.config.run_seed, "user_pool", worker_id()),
+        )
+        pool.fill()
+        allure.attach(
+            json.dumps(pool.stats, indent=2),
+            "Информация о пуле пользователей",
+            allure.attachment_type.JSON,
+        )
+
+    yield pool
+
+    pool.close()
+
+
+@pytest.fixture(autouse=True)
+def cleanup_checkpoint(request):
+    yield
+    if "cleanup_registry" in request.fixturenames:
+        request.getfixturevalue("cleanup_registry").flush_if_due()
+
+
+@pytest.fixture(autouse=True)
+def db_isolation(request):
+    if request.config.getoption("--db-isolation") != "savepoint":
+        yield
+        return
+    if "user" in request.fixturenames:
+        request.getfixturevalue("user")
+    with request.getfixturevalue("db_client").isolated():
+        yield
+
+
+@pytest.fixture
+def user(request, user_pool: UserPool, backend_mode: str) -> dict:
+    with allure.step("Получение тестового пользователя из пула"):
+        pooled_user = user_pool.checkout()
+        allure.attach(
+            pooled_user["username"],
+            "Пользователь из пула",
+            allure.attachment_type.TEXT,
+        )
+
+    yield pooled_user
+
+    rolled_back = (
+        request.config.getoption("--db-isolation") == "savepoint"
+        and backend_mode != "live"
+    )
+    user_pool.checkin(pooled_user, dirty=not rolled_back)
 
 
 @pytest.fixture
@@ -175,14 +497,45 @@ def catalog_adapter(http_client: HTTPClient) -> CatalogAdapter:
         return adapter
 
 
+@pytest.fixture(scope="session")
+def catalog_snapshot(
+    http_client: HTTPClient, user_pool: UserPool, token_cache: TokenCache
+) -> CatalogSnapshot:
+    snapshot_user = user_pool.checkout()
+    auth = AuthAdapter(http_client, token_cache)
+
+    def token_provider() -> str:
+        token = auth.get_token(snapshot_user["username"], snapshot_user["password"])
+        return f"Bearer {token}"
+
+    with allure.step("Создание снимка каталога"):
+        snapshot = CatalogSnapshot(
+            CatalogAdapter(http_client),
+            snapshot_user["token"],
+            **CATALOG_SNAPSHOT_CONFIG,
+            token_provider=token_provider,
+        )
+
+    yield snapshot
+
+    user_pool.checkin(snapshot_user)
+
+
 @pytest.fixture
 @allure.step("Получение случайного товара")
-def random_item(catalog_adapter: CatalogAdapter, user: dict) -> dict:
+def random_item(
+    catalog_adapter: CatalogAdapter,
+    user: dict,
+    catalog_snapshot: CatalogSnapshot,
+    rng: random.Random,
+) -> dict:
     with allure.step("Получение случайного товара из каталога"):
         from src.builders.item_builder import ItemBuilder
 
         try:
-            item_builder = ItemBuilder(catalog_adapter, user["token"])
+            item_builder = ItemBuilder(
+                catalog_adapter, user["token"], snapshot=catalog_snapshot, rng=rng
+            )
             item_data = item_builder.build()
 
             allure.attach(
@@ -215,9 +568,7 @@ def random_item(catalog_adapter: CatalogAdapter, user: dict) -> dict:
 
 
 @pytest.fixture
-def add_random_item(
-    cart_adapter: CartAdapter, random_item: dict, user: dict, db_client: DbClient
-) -> dict:
+def add_random_item(cart_adapter: CartAdapter, random_item: dict, user: dict) -> dict:
     with allure.step("Добавление товара в корзину"):
         try:
             add_resp = cart_adapter.add_to_cart(user["token"], random_item)
@@ -258,13 +609,6 @@ def add_random_item(
             )
             raise
 
-        finally:
-            with allure.step("Очистка корзины после теста"):
-                try:
-                    db_client.delete_cart(user["username"])
-                except Exception:
-                    pass
-
 
 @pytest.fixture
 @allure.step("Создание адаптера заказов")
@@ -293,3 +637,47 @@ def orders_adapter(http_client: HTTPClient) -> OrdersAdapter:
         )
 
         return adapter
+
+
+@pytest_asyncio.fixture
+async def async_http_client(
+    http_reporting_config: dict, socket_base_url: str
+) -> AsyncHTTPClient:
+    with allure.step(f"Создание асинхронного HTTP клиента для {socket_base_url}"):
+        allure.attach(
+            json.dumps(
+                {
+                    "base_url": socket_base_url,
+                    "client_type": "AsyncHTTPClient",
+                    "pool": ASYNC_HTTP_CONFIG,
+                    "reporting": http_reporting_config,
+                },
+                indent=2,
+            ),
+            "Информация об асинхронном HTTP клиенте",
+            allure.attachment_type.JSON,
+        )
+    async with AsyncHTTPClient(
+        socket_base_url, **ASYNC_HTTP_CONFIG, **http_reporting_config
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def async_auth_adapter(async_http_client: AsyncHTTPClient) -> AsyncAuthAdapter:
+    return AsyncAuthAdapter(async_http_client)
+
+
+@pytest.fixture
+def async_cart_adapter(async_http_client: AsyncHTTPClient) -> AsyncCartAdapter:
+    return AsyncCartAdapter(async_http_client)
+
+
+@pytest.fixture
+def async_catalog_adapter(async_http_client: AsyncHTTPClient) -> AsyncCatalogAdapter:
+    return AsyncCatalogAdapter(async_http_client)
+
+
+@pytest.fixture
+def async_orders_adapter(async_http_client: AsyncHTTPClient) -> AsyncOrdersAdapter:
+    return AsyncOrdersAdapter(async_http_client)
@@ -1,7 +1,11 @@
 import allure
 import pytest
 import http
-from src.utils.validations import validate_response, validate_order_response
+from src.utils.validations import (
+    assert_json_contains,
+    validate_order_response,
+    validate_response,
+)
 
 pytestmark = [
     allure.epic("Система управления заказами"),
@@ -19,13 +23,20 @@ def created_order_id(orders_adapter, add_random_item, user):
 
 @allure.title("Получение деталей заказа")
 @allure.severity(allure.severity_level.NORMAL)
-def test_get_order_details(orders_adapter, user, created_order_id):
+def test_get_order_details(orders_adapter, user, add_random_item, created_order_id):
     order_id = created_order_id
     with allure.step("Получение деталей заказа"):
         resp = orders_adapter.get_order_details(user["token"], order_id)
         allure.attach(str(resp.json()), "Детали заказа", allure.attachment_type.JSON)
-    validate_response(resp, http.HTTPStatus.OK)
+    validate_response(
+        resp,
+        http.HTTPStatus.OK,
+        expected_json_partial={"order_id": order_id},
+    )
     validate_order_response(resp.json(), expected_order_id=order_id)
+    assert_json_contains(
+        resp.json()["items"][0], add_random_item, "Товар заказа совпадает с добавленным"
+    )
 
 
 @allure.title("Попытка получения несуществующего заказа")
@@ -0,0 +1,46 @@
+import time
+import allure
+from src.backend.clients.http_client import HTTPClient
+from src.backend.fake.shop import FakeShop, default_catalog
+from src.backend.fake.transport import FakeShopAdapter
+from src.backend.services.auth.adapter import AuthAdapter
+from src.backend.services.auth.token_cache import TokenCache
+from src.backend.services.cart.adapter import CartAdapter
+from src.backend.services.catalog.adapter import CatalogAdapter
+from src.builders.catalog_snapshot import CatalogSnapshot
+from config import FAKE_SHOP_CONFIG
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Генерация тестовых данных"),
+]
+
+
+@allure.title("Снимок каталога получает новый токен при обновлении после истечения JWT")
+def test_snapshot_refresh_uses_current_token():
+    shop = FakeShop(default_catalog(FAKE_SHOP_CONFIG["catalog_size"]), token_ttl=2)
+    client = HTTPClient(FAKE_SHOP_CONFIG["base_url"], reporting_level="off")
+    client.mount(FAKE_SHOP_CONFIG["base_url"], FakeShopAdapter(shop))
+    auth = AuthAdapter(client, TokenCache(refresh_margin=1.9))
+    auth.register_user("snapshotuser", "Snap!Passw0rd")
+    logins = []
+
+    def token_provider() -> str:
+        logins.append(time.monotonic())
+        return f"Bearer {auth.get_token('snapshotuser', 'Snap!Passw0rd')}"
+
+    snapshot = CatalogSnapshot(
+        CatalogAdapter(client), token_provider(), ttl=0, token_provider=token_provider
+    )
+    snapshot.refresh()
+    session_token = snapshot.token
+    time.sleep(2.1)
+    snapshot.refresh(force=True)
+    cart = CartAdapter(client)
+
+    assert snapshot.refreshes == 2
+    assert len(logins) == 3
+    assert snapshot.token != session_token
+    assert cart.get_cart(session_token).status_code == 401
+    assert cart.get_cart(snapshot.token).status_code == 200
+    client.close()
@@ -0,0 +1,36 @@
+import allure
+from src.builders.user_builder import UserBuilder
+from src.utils.seeds import derive_rng
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Генерация тестовых данных"),
+]
+
+
+def build_run(seed: int, nodeid: str) -> list:
+    builder = UserBuilder(rng=derive_rng(seed, nodeid))
+    return [builder.build(), *builder.build_many(3), builder.build()]
+
+
+@allure.title("Два прогона с одним seed создают одинаковых пользователей")
+def test_same_seed_and_test_give_identical_users(request):
+    seed = request.config.run_seed
+    nodeid = request.node.nodeid
+    first_run = build_run(seed, nodeid)
+    UserBuilder(rng=derive_rng(seed, "other")).build_many(10)
+    second_run = build_run(seed, nodeid)
+
+    assert first_run == second_run
+    assert len({user["username"] for user in first_run}) == len(first_run)
+    assert build_run(seed, f"{nodeid}[other]")[0] != first_run[0]
+    assert build_run(seed + 1, nodeid)[0] != first_run[0]
+
+
+@allure.title("build() и build_many() генерируют пароли одним генератором")
+def test_build_and_build_many_share_password_generator():
+    single = UserBuilder(seed=3)
+    batch = UserBuilder(seed=3)
+    passwords = [single.build()["password"] for _ in range(3)]
+
+    assert passwords == [user["password"] for user in batch.build_many(3)]
@@ -0,0 +1,34 @@
+import random
+import allure
+import pytest
+from src.backend.clients.http_client import HTTPClient
+from src.backend.fake.db import FakeDbClient
+from src.backend.fake.shop import FakeShop, default_catalog
+from src.backend.fake.transport import FakeShopAdapter
+from src.backend.services.auth.adapter import AuthAdapter
+from src.builders.user_builder import UserBuilder
+from src.builders.user_pool import UserPool
+from config import FAKE_SHOP_CONFIG
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Пул тестовых пользователей"),
+]
+
+
+@allure.title("Ошибка регистрации пользователя пула содержит логин и ответ backend")
+def test_pool_fill_reports_failed_registration():
+    shop = FakeShop(default_catalog(FAKE_SHOP_CONFIG["catalog_size"]))
+    client = HTTPClient(FAKE_SHOP_CONFIG["base_url"], reporting_level="off")
+    client.mount(FAKE_SHOP_CONFIG["base_url"], FakeShopAdapter(shop))
+    auth = AuthAdapter(client)
+    taken = UserBuilder(rng=random.Random(1)).build_many(1)[0]
+    auth.register(taken)
+    pool = UserPool(auth, FakeDbClient(shop), size=1, rng=random.Random(1))
+
+    with pytest.raises(ValueError) as error:
+        pool.fill()
+    client.close()
+
+    assert taken["username"] in str(error.value)
+    assert "User already exists" in str(error.value)
@@ -0,0 +1,158 @@
+import time
+from typing import Dict, Optional
+import allure
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+from src.backend.clients.http_client import HTTPClient
+from src.backend.clients.response_cache import ResponseCache
+from src.backend.fake.shop import FakeShop, default_catalog
+from src.backend.fake.transport import FakeShopAdapter
+from src.backend.services.auth.adapter import AuthAdapter
+from config import FAKE_SHOP_CONFIG
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Кэш ответов HTTP клиента"),
+]
+
+TOKEN = {"Authorization": "Bearer token-a"}
+
+
+class UnreadableBody:
+
+    def read(self, *args, **kwargs) -> bytes:
+        raise AssertionError("тело ответа не должно читаться")
+
+
+def make_response(
+    body: Optional[bytes] = b"[]",
+    headers: Optional[Dict[str, str]] = None,
+    status: int = 200,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers or {})
+    if body is None:
+        response.raw = UnreadableBody()
+    else:
+        response._content = body
+    return response
+
+
+def catalog_key(page: int = 1, headers: Optional[Dict[str, str]] = None):
+    return ResponseCache.key(
+        "GET", "/catalog/", {"page": page}, TOKEN if headers is None else headers
+    )
+
+
+@pytest.fixture
+def fake_client():
+    shop = FakeShop(default_catalog(FAKE_SHOP_CONFIG["catalog_size"]))
+    clients = []
+
+    def make(cache: ResponseCache) -> HTTPClient:
+        client = HTTPClient(
+            FAKE_SHOP_CONFIG["base_url"], reporting_level="off", cache=cache
+        )
+        client.mount(FAKE_SHOP_CONFIG["base_url"], FakeShopAdapter(shop))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@allure.title("Запись устаревает через ttl или раньше по max-age")
+def test_entry_expires_after_ttl_and_max_age():
+    cache = ResponseCache(ttl=0.2)
+    cache.store(catalog_key(1), make_response())
+    cache.store(
+        catalog_key(2), make_response(headers={"Cache-Control": "max-age=0.05"})
+    )
+
+    assert cache.lookup(catalog_key(1)).is_fresh()
+    assert cache.lookup(catalog_key(2)).is_fresh()
+    time.sleep(0.1)
+    assert cache.lookup(catalog_key(1)).is_fresh()
+    assert not cache.lookup(catalog_key(2)).is_fresh()
+    time.sleep(0.15)
+    assert not cache.lookup(catalog_key(1)).is_fresh()
+
+
+@allure.title("no-store не кэшируется, no-cache хранится только для перепроверки")
+def test_no_store_and_no_cache_directives():
+    cache = ResponseCache()
+    cache.store(catalog_key(1), make_response(headers={"Cache-Control": "no-store"}))
+    cache.store(catalog_key(2), make_response(headers={"Cache-Control": "no-cache"}))
+    cache.store(
+        catalog_key(3),
+        make_response(headers={"Cache-Control": "no-cache", "ETag": '"v1"'}),
+    )
+
+    assert cache.lookup(catalog_key(1)) is None
+    assert cache.lookup(catalog_key(2)) is None
+    entry = cache.lookup(catalog_key(3))
+    assert entry.etag == '"v1"'
+    assert not entry.is_fresh()
+
+
+@allure.title("Устаревшая запись с ETag перепроверяется и продлевается ответом 304")
+def test_stale_entry_is_revalidated_with_etag(fake_client):
+    cache = ResponseCache(ttl=0)
+    client = fake_client(cache)
+    auth = AuthAdapter(client)
+    auth.register_user("cacheuser", "Cache!Passw0rd")
+    headers = {
+        "Authorization": f"Bearer {auth.get_token('cacheuser', 'Cache!Passw0rd')}"
+    }
+
+    first = client.get("/catalog/", headers=headers)
+    second = client.get("/catalog/", headers=headers)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert first.headers["ETag"]
+    assert cache.stats()["stores"] == 1
+    assert cache.stats()["revalidations"] == 1
+
+
+@allure.title("LRU вытесняет давно не использованную запись")
+def test_lru_eviction_by_entry_count():
+    cache = ResponseCache(max_entries=2)
+    cache.store(catalog_key(1), make_response())
+    cache.store(catalog_key(2), make_response())
+    cache.lookup(catalog_key(1))
+    cache.store(catalog_key(3), make_response())
+
+    assert cache.lookup(catalog_key(2)) is None
+    assert cache.lookup(catalog_key(1)) is not None
+    assert cache.lookup(catalog_key(3)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+@allure.title("Общий размер записей ограничен max_bytes")
+def test_byte_cap_eviction_and_oversized_bodies():
+    cache = ResponseCache(max_bytes=10)
+    cache.store(catalog_key(1), make_response(b"123456"))
+    cache.store(catalog_key(2), make_response(b"654321"))
+    cache.store(catalog_key(3), make_response(b"12345678901"))
+    cache.store(catalog_key(4), make_response(None, {"Content-Length": "11"}))
+
+    assert cache.lookup(catalog_key(1)) is None
+    assert cache.lookup(catalog_key(2)).response.content == b"654321"
+    assert cache.lookup(catalog_key(3)) is None
+    assert cache.lookup(catalog_key(4)) is None
+    assert cache.stats()["bytes"] == 6
+
+
+@allure.title("Ответы разных пользователей хранятся раздельно")
+def test_entries_are_scoped_by_authorization():
+    cache = ResponseCache()
+    cache.store(catalog_key(1, {"Authorization": "Bearer token-a"}), make_response())
+
+    assert catalog_key(1, {"authorization": "Bearer token-a"}) == catalog_key(1)
+    assert cache.lookup(catalog_key(1, {"Authorization": "Bearer token-b"})) is None
+    assert cache.lookup(catalog_key(1, {})) is None
+    assert cache.lookup(catalog_key(1)) is not None
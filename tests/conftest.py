@@ -0,0 +1,147 @@
+import os
+import sys
+import pytest
+from src.utils.allure_results import archive_results, install_buffered_logger
+from src.utils.seeds import run_seed
+from config import (
+    ALLURE_WRITER_CONFIG,
+    BACKEND_MODE,
+    DB_ISOLATION,
+    DB_TEMPLATE_CONFIG,
+    HTTP_CACHE_CONFIG,
+    HTTP_REPORTING_CONFIG,
+)
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup("autotests-shop")
+    group.addoption(
+        "--backend",
+        choices=["live", "inprocess", "loopback"],
+        default=BACKEND_MODE,
+        help="live - BASE_URL и PostgreSQL из config.py, inprocess - заглушка "
+        "без сокетов, loopback - заглушка на локальном порту",
+    )
+    group.addoption(
+        "--db-isolation",
+        choices=["cleanup", "savepoint"],
+        default=DB_ISOLATION,
+        help="cleanup - удаление созданных данных после тестов, savepoint - "
+        "изменения БД каждого теста откатываются к SAVEPOINT (на заглушке полностью, "
+        "с live - только записи DbClient)",
+    )
+    group.addoption(
+        "--db-template",
+        choices=["off", "restore"],
+        default=DB_TEMPLATE_CONFIG["mode"],
+        help="off - работа с БД как есть, restore - пересоздать БД из шаблона "
+        "перед прогоном",
+    )
+    group.addoption(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed генерации тестовых данных прогона (по умолчанию случайный, "
+        "общий для всех воркеров xdist)",
+    )
+    group.addoption(
+        "--http-reporting",
+        choices=["full", "errors", "sampled", "off"],
+        default=HTTP_REPORTING_CONFIG["reporting_level"],
+        help="Уровень Allure-вложений для HTTP запросов",
+    )
+    group.addoption(
+        "--http-sample-rate",
+        type=float,
+        default=HTTP_REPORTING_CONFIG["sample_rate"],
+        help="Процент запросов с вложениями в режиме sampled",
+    )
+    group.addoption(
+        "--http-attachment-max-bytes",
+        type=int,
+        default=HTTP_REPORTING_CONFIG["max_attachment_bytes"],
+        help="Максимальный размер одного вложения (0 - без ограничений)",
+    )
+    group.addoption(
+        "--http-cache",
+        choices=["on", "off"],
+        default="on" if HTTP_CACHE_CONFIG["enabled"] else "off",
+        help="Кэш ответов GET для маршрутов из HTTP_CACHE_CONFIG['routes']",
+    )
+    group.addoption(
+        "--allure-writer",
+        choices=["buffered", "default"],
+        default="buffered" if ALLURE_WRITER_CONFIG["buffered"] else "default",
+        help="buffered - запись результатов Allure в фоновом потоке с дедупликацией "
+        "одинаковых вложений, default - стандартная синхронная запись allure-pytest",
+    )
+    group.addoption(
+        "--allure-archive",
+        action="store_true",
+        default=ALLURE_WRITER_CONFIG["archive"],
+        help="Упаковать каталог --alluredir в <каталог>.tar.gz в конце прогона",
+    )
+    group.addoption(
+        "--http-metrics-top",
+        type=int,
+        default=10,
+        help="Количество самых медленных эндпоинтов в итоговой сводке (0 - скрыть)",
+    )
+    group.addoption(
+        "--http-metrics-json",
+        default=None,
+        help="Путь для выгрузки гистограмм задержек HTTP запросов в JSON",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config) -> None:
+    seed = config.getoption("--seed")
+    if hasattr(config, "workerinput"):
+        seed = config.workerinput["run_seed"]
+    config.run_seed = run_seed() if seed is None else seed
+    if config.getoption("--allure-writer") != "buffered":
+        return
+    installed = install_buffered_logger(
+        dedup=ALLURE_WRITER_CONFIG["dedup"],
+        queue_size=ALLURE_WRITER_CONFIG["queue_size"],
+    )
+    if installed is None:
+        return
+    writer, restore = installed
+
+    def finish() -> None:
+        restore()
+        for error in writer.errors:
+            sys.stderr.write(f"allure results writer: {error}\n")
+        if config.getoption("--allure-archive") and not hasattr(config, "workerinput"):
+            archive_results(config.option.allure_report_dir)
+
+    config.add_cleanup(finish)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    node.workerinput["run_seed"] = node.config.run_seed
+
+
+def pytest_report_header(config) -> str:
+    return f"test data seed: {config.run_seed} (повтор: --seed {config.run_seed})"
+
+
+def pytest_sessionfinish(session) -> None:
+    config = session.config
+    allure_dir = getattr(config.option, "allure_report_dir", None)
+    if not allure_dir or hasattr(config, "workerinput"):
+        return
+    os.makedirs(allure_dir, exist_ok=True)
+    path = os.path.join(allure_dir, "environment.properties")
+    lines = []
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as environment:
+            lines = [
+                line for line in environment if not line.startswith("test_data_seed=")
+            ]
+    lines.append(f"test_data_seed={config.run_seed}\n")
+    with open(path, "w", encoding="utf-8") as environment:
+        environment.writelines(lines)
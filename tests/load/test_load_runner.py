@@ -0,0 +1,96 @@
+import argparse
+import allure
+import pytest
+from src.backend.clients.http_client import HTTPClient
+from src.backend.fake.db import FakeDbClient
+from src.backend.fake.shop import FakeShop, default_catalog
+from src.backend.fake.transport import FakeShopAdapter
+from src.load.__main__ import parse_slo
+from src.load.runner import LoadRunner, check_slo
+from src.utils.cleanup import CleanupRegistry
+from config import FAKE_SHOP_CONFIG
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Нагрузочный прогон"),
+]
+
+
+@pytest.fixture
+def load_shop():
+    shop = FakeShop(default_catalog(FAKE_SHOP_CONFIG["catalog_size"]))
+    client = HTTPClient(FAKE_SHOP_CONFIG["base_url"], reporting_level="off")
+    client.mount(FAKE_SHOP_CONFIG["base_url"], FakeShopAdapter(shop))
+    registry = CleanupRegistry(FakeDbClient(shop))
+    yield shop, client, registry
+    registry.close()
+    client.close()
+
+
+def count_users(shop: FakeShop) -> int:
+    with shop.lock:
+        return shop.conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+
+@allure.title("Короткий прогон на заглушке: сценарии доходят до заказа и удаляются")
+def test_load_run_counts_in_flight_journeys_and_cleans_up(load_shop):
+    shop, client, registry = load_shop
+    users_before = count_users(shop)
+    stats = LoadRunner(
+        client,
+        arrival_rate=40,
+        duration=0.5,
+        think_time=0.02,
+        max_workers=50,
+        seed=7,
+        cleanup_registry=registry,
+    ).run()
+    report = stats.report()
+    allure.attach(str(report), "Отчёт", allure.attachment_type.TEXT)
+
+    journeys = report["journeys"]
+    assert journeys["started"] > 0
+    assert journeys["failed"] == 0
+    assert journeys["dropped"] == 0
+    assert report["endpoints"]["POST /auth/register"]["count"] == journeys["started"]
+    assert report["endpoints"]["GET /orders/<id>"]["count"] == journeys["started"]
+    assert registry.pending == 0
+    assert count_users(shop) == users_before
+
+
+@allure.title("Сценарии без свободного воркера учитываются как пропущенные")
+def test_load_run_drops_arrivals_without_free_slot(load_shop):
+    _, client, registry = load_shop
+    stats = LoadRunner(
+        client,
+        arrival_rate=100,
+        duration=0.5,
+        think_time=0.1,
+        max_workers=1,
+        seed=7,
+        cleanup_registry=registry,
+    ).run()
+
+    assert 1 <= stats.journeys_started <= 2
+    assert stats.journeys_dropped >= 20
+    assert stats.journeys_failed == 0
+
+
+@allure.title("SLO проверяется для любого перцентиля")
+def test_slo_enforces_custom_percentile(load_shop):
+    _, client, registry = load_shop
+    stats = LoadRunner(
+        client, arrival_rate=20, duration=0.3, seed=7, cleanup_registry=registry
+    ).run()
+    slo = parse_slo(["p99.9=0.000001", "p50=100000"])
+    report = stats.report(sorted({50.0, 95.0, 99.0} | {float(key[1:]) for key in slo}))
+
+    violations = check_slo(report, slo, max_error_rate=None)
+
+    assert slo == {"p99.9": 0.000001, "p50": 100000.0}
+    assert "p99.9_ms" in report["total"]
+    assert violations
+    assert all(": p99.9 = " in violation for violation in violations)
+    assert any(violation.startswith("total: ") for violation in violations)
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_slo(["p0=100"])
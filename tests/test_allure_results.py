@@ -0,0 +1,55 @@
+import json
+from uuid import uuid4
+import allure
+from allure_commons import model2
+from src.utils.allure_results import BufferedAllureFileLogger
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Запись результатов Allure"),
+]
+
+
+def attach(logger: BufferedAllureFileLogger, body: str) -> model2.Attachment:
+    source = model2.ATTACHMENT_PATTERN.format(prefix=uuid4(), ext="json")
+    logger.report_attached_data(body, source)
+    return model2.Attachment(name="Ответ", source=source, type="application/json")
+
+
+@allure.title("Ссылки на вложения после дедупликации ведут на записанные файлы")
+def test_buffered_logger_resolves_every_attachment_source(tmp_path):
+    logger = BufferedAllureFileLogger(str(tmp_path), queue_size=4)
+    for index in range(5):
+        shared = attach(logger, '{"status": "ok"}')
+        step = model2.TestStepResult(
+            name="Запрос", attachments=[attach(logger, '{"status": "ok"}')]
+        )
+        unique = attach(logger, json.dumps({"index": index}))
+        logger.report_result(
+            model2.TestResult(
+                uuid=str(uuid4()),
+                name=f"test_{index}",
+                attachments=[shared, unique],
+                steps=[step],
+            )
+        )
+    logger.close()
+
+    results = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in tmp_path.glob("*-result.json")
+    ]
+    sources = [
+        attachment["source"]
+        for result in results
+        for executable in [result, *result["steps"]]
+        for attachment in executable["attachments"]
+    ]
+
+    assert logger.errors == []
+    assert len(results) == 5
+    assert len(sources) == 15
+    assert logger.stats["deduplicated"] == 9
+    assert len(set(sources)) == 6
+    assert all((tmp_path / source).is_file() for source in sources)
+    assert len(list(tmp_path.glob("*-attachment.json"))) == 6
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+import allure
+import pytest
+
+pytestmark = [
+    allure.epic("Инфраструктура автотестов"),
+    allure.feature("Параллельный запуск"),
+]
+
+CHILD_RUN_ENV = "AUTOTESTS_CHILD_RUN"
+
+
+@allure.title("Запуск набора в двух воркерах xdist с отдельным --alluredir")
+@pytest.mark.skipif(
+    bool(os.environ.get(CHILD_RUN_ENV)), reason="вложенный прогон проверки"
+)
+def test_parallel_run_with_alluredir(tmp_path):
+    results_dir = tmp_path / "allure-results"
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "pytest",
+            "-q",
+            "-p",
+            "no:cacheprovider",
+            "--backend",
+            "inprocess",
+            "-n",
+            "2",
+            "--alluredir",
+            str(results_dir),
+        ],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        env={**os.environ, CHILD_RUN_ENV: "1"},
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    allure.attach(
+        completed.stdout[-20000:], "Вывод pytest", allure.attachment_type.TEXT
+    )
+    assert completed.returncode == 0, completed.stdout[-5000:] + completed.stderr
+    assert "INTERNALERROR" not in completed.stdout + completed.stderr
+    assert list(results_dir.glob("*-result.json"))